@@ -94,8 +94,11 @@ function App() {
       setRadData(data)
       setSelectedRadType(actualType)
 
+      // Precomputed index (optional, generated in CI)
+      const radIndex = await loadRADIndex(actualType)
+
       // Initialize search engine
-      const engine = new RADSearchEngine(data)
+      const engine = new RADSearchEngine(data, radIndex)
       setSearchEngine(engine)
 
       setLoading(false)
@@ -106,6 +109,16 @@ function App() {
     }
   }
 
+  const loadRADIndex = async (radType) => {
+    try {
+      const response = await fetch(`${import.meta.env.BASE_URL}rad-index-${radType}.json`)
+      return response.ok ? await response.json() : null
+    } catch (err) {
+      console.warn('RAD index not available:', err)
+      return null
+    }
+  }
+
   const loadRADDataLegacy = async () => {
     try {
       setLoading(true)
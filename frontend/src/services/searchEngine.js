@@ -5,16 +5,53 @@ import Fuse from 'fuse.js'
  * Utilise Fuse.js pour recherche floue performante
  */
 export class RADSearchEngine {
-  constructor(radData) {
+  /**
+   * @param {object} radData - Sortie de rad_parser.py
+   * @param {object} radIndex - Index précalculé optionnel (rad_parser.py --index)
+   */
+  constructor(radData, radIndex = null) {
     if (!radData || !radData.annexes) {
       throw new Error('Invalid RAD data structure')
     }
 
     this.data = this._flattenData(radData)
     this.metadata = radData.metadata
+    this.index = this._checkIndex(radIndex)
     this.initFuse()
   }
 
+  /**
+   * Vérifie que l'index précalculé correspond aux données chargées
+   * @private
+   */
+  _checkIndex(radIndex) {
+    if (!radIndex || radIndex.format !== 'rad-index') return null
+
+    if (radIndex.total_entries !== this.data.length ||
+        radIndex.metadata?.cycle !== this.metadata?.cycle ||
+        radIndex.metadata?.version !== this.metadata?.version) {
+      console.warn('⚠️ RAD index does not match loaded data, ignored')
+      return null
+    }
+
+    console.log('✅ Precomputed RAD index loaded')
+    return radIndex
+  }
+
+  /**
+   * Entrées associées à une valeur normalisée d'un champ indexé
+   * @param {string} field - Champ (id, from_point, airway, aerodrome...)
+   * @param {string} key - Valeur normalisée
+   * @returns {Array|null} Entrées, ou null si le champ n'est pas indexé
+   */
+  lookupIndex(field, key) {
+    const fieldIndex = this.index?.fields?.[field]
+    if (!fieldIndex) return null
+
+    const offsets = Object.prototype.hasOwnProperty.call(fieldIndex, key) ? fieldIndex[key] : []
+    return offsets.map(offset => this.data[offset])
+  }
+
   /**
    * Aplatit toutes les annexes en un seul tableau
    */
@@ -112,6 +149,10 @@ export class RADSearchEngine {
    * @returns {Array} Résultats
    */
   searchById(id) {
+    // Lookup direct via l'index précalculé (mêmes règles de normalisation)
+    const indexed = this.lookupIndex('id', id.replace(/[\[\]\s]/g, '').toUpperCase())
+    if (indexed) return indexed
+
     const normalized = id.trim().toUpperCase()
     return this.data.filter(entry => 
       entry.id?.toUpperCase() === normalized
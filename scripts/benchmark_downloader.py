@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Benchmark du downloader RAD - Téléchargements séquentiels vs parallèles
+
+Usage:
+    python benchmark_downloader.py [--files 2] [--size-mb 8] [--latency 0.3] [--bandwidth 4]
+
+Exemple:
+    python benchmark_downloader.py --files 3 --latency 0.5 --runs 3
+
+Un serveur HTTP local imite la page RAD d'EUROCONTROL et sert des fichiers
+ZIP synthétiques avec une latence par requête et un débit limité par
+connexion. Chaque mode télécharge tous les fichiers dans un répertoire vide
+(aucun fichier n'est ignoré par les requêtes conditionnelles).
+"""
+
+import argparse
+import io
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from rad_downloader import RADDownloader, logger as downloader_logger
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Bloc écrit par le serveur entre deux pauses de limitation du débit
+STUB_CHUNK = 64 * 1024
+
+
+def make_payload(size_mb: float):
+    """Fichier ZIP valide d'environ `size_mb` MB (contenu incompressible)."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED) as archive:
+        archive.writestr('xl/worksheets/sheet1.xml', os.urandom(int(size_mb * 1024 * 1024)))
+    return buffer.getvalue()
+
+
+def start_stub_server(files: dict, latency: float, bandwidth_mb: float):
+    """Démarre le serveur local; retourne (serveur, URL de la page RAD)."""
+    links = ''.join(
+        f'<div><a href="/RAD/{path}">{name}</a></div>'
+        for name, path in files
+    )
+    page = f'<html><body>{links}</body></html>'.encode('utf-8')
+    bodies = {f'/RAD/{path}': payload for (_, path), payload in files.items()}
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(latency)
+
+            body = page if self.path == '/RAD/' else bodies.get(self.path)
+            if body is None:
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+
+            # Débit limité par connexion
+            delay = STUB_CHUNK / (bandwidth_mb * 1024 * 1024) if bandwidth_mb else 0
+            for start in range(0, len(body), STUB_CHUNK):
+                self.wfile.write(body[start:start + STUB_CHUNK])
+                if delay:
+                    time.sleep(delay)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}/RAD/'
+
+
+def stub_files(count: int, size_mb: float):
+    """{(nom, chemin): contenu} pour current, AIRAC+1, AIRAC+2..."""
+    files = {}
+    for n in range(count):
+        folder = 'CURRENT_AIRAC' if n == 0 else f'AIRAC%2B{n}'
+        name = f'RAD_25{11 + n:02d}_v1_0{n}.xlsx'
+        files[(name, f'{folder}/{name}')] = make_payload(size_mb)
+    return files
+
+
+def time_download(url: str, runs: int, **downloader_kwargs):
+    """Télécharge tous les fichiers `runs` fois; retourne (durées, tous réussis)."""
+    durations = []
+    ok = True
+
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as output_dir:
+            downloader = RADDownloader(output_dir, **downloader_kwargs)
+            downloader.BASE_URL = url
+
+            start = time.perf_counter()
+            downloader.download_all()
+            durations.append(time.perf_counter() - start)
+
+            ok = ok and len(downloader.transferred) == len(downloader.page.get('links', {}))
+
+    return durations, ok
+
+
+def report(label: str, durations: list):
+    """Affiche un résumé des durées mesurées."""
+    logger.info(
+        f"  {label:<28} médiane {statistics.median(durations):7.3f}s"
+        f"  (min {min(durations):.3f}s, max {max(durations):.3f}s)"
+    )
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark du downloader RAD (serveur local simulé)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python benchmark_downloader.py
+  python benchmark_downloader.py --files 3 --latency 0.5
+  python benchmark_downloader.py --size-mb 20 --bandwidth 10 --runs 5
+        """
+    )
+
+    parser.add_argument('--files', type=int, default=2,
+                       help='Nombre d\'éditions servies (current, future, future2...) (default: 2)')
+    parser.add_argument('--size-mb', type=float, default=8,
+                       help='Taille de chaque fichier en MB (default: 8)')
+    parser.add_argument('--latency', type=float, default=0.3,
+                       help='Latence ajoutée à chaque requête en secondes (default: 0.3)')
+    parser.add_argument('--bandwidth', type=float, default=4,
+                       help='Débit par connexion en MB/s, 0 = illimité (default: 4)')
+    parser.add_argument('--runs', type=int, default=3,
+                       help='Nombre de répétitions par mode (default: 3)')
+
+    args = parser.parse_args()
+
+    # Les logs par fichier du downloader noient les mesures
+    downloader_logger.setLevel(logging.WARNING)
+
+    server, url = start_stub_server(
+        stub_files(args.files, args.size_mb), args.latency, args.bandwidth
+    )
+
+    try:
+        logger.info(
+            f"📊 {args.files} fichiers de {args.size_mb:g} MB, latence {args.latency:g}s, "
+            f"{args.bandwidth:g} MB/s par connexion"
+        )
+
+        sequential, sequential_ok = time_download(url, args.runs, workers=1)
+        report('séquentiel (1 thread)', sequential)
+
+        concurrent, concurrent_ok = time_download(url, args.runs)
+        report(f'parallèle ({args.files} threads)', concurrent)
+
+        speedup = statistics.median(sequential) / statistics.median(concurrent)
+        logger.info(f"  → x{speedup:.2f}")
+
+        if not (sequential_ok and concurrent_ok):
+            logger.error("❌ Certains fichiers n'ont pas été téléchargés")
+            return 1
+
+        return 0
+
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark de l'index de niveaux de vol - FlightLevelIndex vs parcours des entrées
+
+Usage:
+    python benchmark_flight_levels.py [input] [--scale 1] [--queries 2000] [--runs 3]
+
+Exemple:
+    python benchmark_flight_levels.py ../data/processed/rad-data.json
+    python benchmark_flight_levels.py ../data/raw/RAD_2511_v1_17.xlsx --queries 5000
+    python benchmark_flight_levels.py --scale 10
+
+`input` est une sortie du parser (JSON) ou un classeur RAD; sans `input`, un
+classeur synthétique est généré (generate_rad_workbook, --scale). Les requêtes
+(espace aérien, FL ou plage de FL) sont tirées des espaces aériens présents.
+
+Mesures (médiane sur --runs):
+    - scan: parcours de toutes les entrées, regex sur utilization à chaque requête
+    - index: FlightLevelIndex.between() (construction mesurée à part)
+Les deux doivent retourner les mêmes entrées pour chaque requête.
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from generate_rad_workbook import generate_workbook
+from rad_columnar import load_rad_json
+from rad_flight_levels import AIRSPACE_FIELDS, FlightLevelIndex, parse_flight_levels
+from rad_index import tokenize
+from rad_parser import RADParser, logger as parser_logger
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Nom de fichier des classeurs générés (cycle/version lus par _extract_metadata)
+GENERATED_FILENAME = 'RAD_2511_v1_17.xlsx'
+
+
+def load_data(args, workdir: Path):
+    """Données du parser: JSON, classeur parsé, ou classeur généré."""
+    if args.input and Path(args.input).suffix.lower() == '.json':
+        return load_rad_json(args.input)
+
+    excel_path = args.input
+    if not excel_path:
+        excel_path = workdir / GENERATED_FILENAME
+        logger.info(f"🏗️  Génération d'un classeur x{args.scale:g}...")
+        generate_workbook(excel_path, scale=args.scale, seed=args.seed)
+
+    return RADParser(excel_path).parse()
+
+
+def scan(records: list, airspace: str, low: int, high: int):
+    """Référence: parcours de toutes les entrées, bandes relues dans le texte."""
+    matches = []
+    for record in records:
+        if 'utilization' not in record:
+            continue
+        if not any(airspace in tokenize(record[field]) for field in AIRSPACE_FIELDS if record.get(field)):
+            continue
+        for band_low, band_high in parse_flight_levels(record['utilization']):
+            if (band_low is None or band_low <= high) and (band_high is None or low <= band_high):
+                matches.append(record)
+                break
+    return matches
+
+
+def make_queries(index: FlightLevelIndex, count: int, seed: int):
+    """Requêtes (espace aérien, bas, haut): moitié FL unique, moitié plage."""
+    rng = random.Random(seed)
+    airspaces = sorted(index.trees)
+    queries = []
+    for _ in range(count):
+        low = rng.randrange(50, 460, 5)
+        high = low if rng.random() < 0.5 else low + rng.randrange(10, 100, 10)
+        queries.append((rng.choice(airspaces), low, high))
+    return queries
+
+
+def timed(function, runs: int):
+    """Médiane des durées de `function()` et son dernier résultat."""
+    durations = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), result
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark de l'index de niveaux de vol (FlightLevelIndex)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python benchmark_flight_levels.py ../data/processed/rad-data.json
+  python benchmark_flight_levels.py ../data/raw/RAD_2511_v1_17.xlsx --queries 5000
+  python benchmark_flight_levels.py --scale 10
+        """
+    )
+
+    parser.add_argument('input', nargs='?',
+                       help='Sortie du parser (JSON) ou classeur RAD (défaut: classeur généré)')
+    parser.add_argument('--scale', type=float, default=1,
+                       help='Taille du classeur généré, en RAD réels (default: 1)')
+    parser.add_argument('--seed', type=int, default=1,
+                       help='Graine du classeur généré et des requêtes (default: 1)')
+    parser.add_argument('--queries', type=int, default=2000,
+                       help='Nombre de requêtes (default: 2000)')
+    parser.add_argument('--runs', type=int, default=3,
+                       help='Nombre de répétitions (default: 3)')
+
+    args = parser.parse_args()
+
+    # Les logs par feuille du parser noient les mesures
+    parser_logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data = load_data(args, Path(tmpdir))
+
+    build_s, index = timed(lambda: FlightLevelIndex(data), args.runs)
+    if not index.trees:
+        logger.error("❌ Aucune contrainte de niveau de vol dans les données")
+        return 1
+
+    queries = make_queries(index, args.queries, args.seed)
+    records = index.records
+
+    logger.info(f"📊 {len(records)} entrées, {len(index.trees)} espaces aériens, "
+                f"{len(queries)} requêtes")
+
+    scan_s, expected = timed(
+        lambda: [scan(records, airspace, low, high) for airspace, low, high in queries], args.runs
+    )
+    index_s, results = timed(
+        lambda: [index.between(airspace, low, high) for airspace, low, high in queries], args.runs
+    )
+
+    logger.info(f"  {'construction index':<20} {build_s:8.3f}s")
+    logger.info(f"  {'scan':<20} {scan_s:8.3f}s  ({scan_s / len(queries) * 1e6:9.1f} µs/requête)")
+    logger.info(f"  {'index':<20} {index_s:8.3f}s  ({index_s / len(queries) * 1e6:9.1f} µs/requête)")
+    logger.info(f"  ⚡ Gain: x{scan_s / index_s:.1f}")
+
+    # Même ensemble d'entrées (l'index les rend dans l'ordre des entrées, comme le scan)
+    mismatches = sum(
+        1 for got, want in zip(results, expected) if list(map(id, got)) != list(map(id, want))
+    )
+    if mismatches:
+        logger.error(f"  ❌ {mismatches} requête(s) avec des résultats différents")
+        return 1
+
+    logger.info(f"  ✅ Résultats identiques ({sum(map(len, results))} entrées au total)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
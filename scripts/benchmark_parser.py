@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Benchmark du parser RAD - Compare les temps de parsing entre deux modes
+
+Usage:
+    python benchmark_parser.py input.xlsx [--runs 3]
+
+Exemple:
+    python benchmark_parser.py ../data/raw/RAD_2511_v1_17.xlsx --runs 5
+
+Mesures:
+    - load: classeur ouvert une fois vs relu pour chaque feuille
+    - records: moteur colonne par colonne vs boucle df.iterrows() historique
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+
+import pandas as pd
+
+from rad_parser import RADParser, logger as parser_logger
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+
+def time_parse(excel_path: str, runs: int, **parser_kwargs):
+    """Parse le fichier `runs` fois et retourne les durées (secondes)."""
+    durations = []
+    data = None
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        data = RADParser(excel_path, **parser_kwargs).parse()
+        durations.append(time.perf_counter() - start)
+
+    return durations, data
+
+
+def report(label: str, durations: list):
+    """Affiche un résumé des durées mesurées."""
+    logger.info(
+        f"  {label:<28} médiane {statistics.median(durations):7.3f}s"
+        f"  (min {min(durations):.3f}s, max {max(durations):.3f}s)"
+    )
+
+
+def bench_load(excel_path: str, runs: int):
+    """Ouverture unique du classeur vs une lecture par feuille."""
+    logger.info("📊 Chargement du classeur")
+
+    per_sheet, legacy_data = time_parse(excel_path, runs, single_load=False)
+    single, data = time_parse(excel_path, runs, single_load=True)
+
+    report("lecture par feuille", per_sheet)
+    report("ouverture unique", single)
+
+    speedup = statistics.median(per_sheet) / statistics.median(single)
+    logger.info(f"  ⚡ Gain: x{speedup:.2f}")
+
+    if legacy_data['annexes'] != data['annexes']:
+        logger.error("  ❌ Les deux modes produisent des annexes différentes")
+        return False
+
+    logger.info("  ✅ Sorties identiques")
+    return True
+
+
+def legacy_records(rad_parser: RADParser, df: pd.DataFrame, sheet_name: str):
+    """Référence ligne par ligne (df.iterrows + _safe_str), comme avant les schémas."""
+    schema = rad_parser.ANNEX_SCHEMAS[sheet_name]
+    id_col = schema['id_column']
+    if 'Annex 3B' in sheet_name:
+        id_col = rad_parser._find_column(df, id_col)
+
+    records = []
+    for idx, row in df.iterrows():
+        if pd.isna(row.get(id_col)):
+            continue
+
+        record = {'id': rad_parser._safe_str(row.get(id_col))}
+        for key, col in schema['columns'].items():
+            record[key] = rad_parser._safe_str(row.get(col))
+        record.update(schema['constants'])
+        record['searchable_text'] = " | ".join(
+            str(val).strip() for col, val in row.items()
+            if pd.notna(val) and str(val).strip()
+        ).upper()
+        for key, col in schema.get('trailing', {}).items():
+            record[key] = rad_parser._safe_str(row.get(col))
+
+        records.append(record)
+
+    return records
+
+
+def bench_records(excel_path: str, runs: int):
+    """Construction des entrées: schéma colonne par colonne vs iterrows."""
+    logger.info("📊 Construction des entrées par feuille")
+
+    rad_parser = RADParser(excel_path)
+    with pd.ExcelFile(excel_path, engine='openpyxl') as workbook:
+        frames = {
+            sheet_name: rad_parser._clean_columns(workbook.parse(sheet_name))
+            for sheet_name in rad_parser.SHEET_MAPPING
+        }
+
+    ok = True
+    totals = {'iterrows': 0.0, 'schema': 0.0}
+
+    for sheet_name, df in frames.items():
+        legacy, legacy_out = [], None
+        schema, schema_out = [], None
+
+        for _ in range(runs):
+            start = time.perf_counter()
+            legacy_out = legacy_records(rad_parser, df, sheet_name)
+            legacy.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            schema_out = rad_parser._parse_sheet(sheet_name, df)
+            schema.append(time.perf_counter() - start)
+
+        totals['iterrows'] += statistics.median(legacy)
+        totals['schema'] += statistics.median(schema)
+
+        same = legacy_out == schema_out
+        ok = ok and same
+        logger.info(
+            f"  {sheet_name:<20} {len(df):>7} lignes"
+            f"  iterrows {statistics.median(legacy):7.3f}s"
+            f"  schéma {statistics.median(schema):7.3f}s"
+            f"  {'✅' if same else '❌ sorties différentes'}"
+        )
+
+    logger.info(
+        f"  ⚡ Total: iterrows {totals['iterrows']:.3f}s → schéma {totals['schema']:.3f}s"
+        f" (x{totals['iterrows'] / max(totals['schema'], 1e-9):.1f})"
+    )
+    return ok
+
+
+BENCHMARKS = {
+    'load': bench_load,
+    'records': bench_records,
+}
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark du parser RAD',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python benchmark_parser.py RAD_2511_v1_17.xlsx
+  python benchmark_parser.py ../data/raw/RAD.xlsx --runs 5
+  python benchmark_parser.py ../data/raw/RAD.xlsx --only records
+        """
+    )
+
+    parser.add_argument('input', help='Input Excel file (RAD_YYMM_vX_YY.xlsx)')
+    parser.add_argument('--runs', type=int, default=3,
+                       help='Nombre de répétitions par mode (default: 3)')
+    parser.add_argument('--only', choices=sorted(BENCHMARKS), action='append',
+                       help='Limiter à certains benchmarks (répétable)')
+
+    args = parser.parse_args()
+
+    # Les logs par feuille du parser noient les mesures
+    parser_logger.setLevel(logging.WARNING)
+
+    ok = True
+    for name in args.only or BENCHMARKS:
+        ok = BENCHMARKS[name](args.input, args.runs) and ok
+        logger.info("")
+
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks du parser RAD sur classeurs synthétiques, avec baseline
+
+Usage:
+    python benchmark_suite.py [--rows 1000] [--scale 1] [--input RAD.xlsx] [--runs 3]
+                              [--baseline baseline.json] [--save-baseline baseline.json]
+
+Exemple:
+    python benchmark_suite.py --rows 1000 --scale 1 --scale 10 --save-baseline ../data/bench/baseline.json
+    python benchmark_suite.py --rows 1000 --scale 1 --scale 10 --baseline ../data/bench/baseline.json
+
+Pour chaque charge (classeur généré par generate_rad_workbook, ou fichier
+réel), mesure:
+    - le temps de lecture et de parsing de chaque feuille (médiane)
+    - le temps total de parse() (médiane)
+    - le pic de mémoire Python pendant parse() (tracemalloc, passe séparée)
+    - la taille du JSON produit (indent 2, comme la CLI)
+
+Avec --baseline, compare aux mesures enregistrées (--save-baseline) et
+retourne 1 si le temps total ou le pic mémoire dépasse la baseline de plus
+de --tolerance.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from generate_rad_workbook import generate_workbook
+from rad_parser import RADParser, logger as parser_logger
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+RESULTS_FORMAT = 'rad-benchmark'
+RESULTS_VERSION = 1
+
+# Métriques comparées à la baseline → écart absolu minimal pour compter comme
+# régression (en plus de la tolérance relative): évite le bruit des petites charges
+GATED_METRICS = {
+    'total_s': 0.05,
+    'peak_memory_mb': 1.0,
+}
+
+# Écart minimal (secondes) pour signaler une feuille plus lente
+SHEET_MIN_DELTA = 0.05
+
+# Nom de fichier des classeurs générés (cycle/version lus par _extract_metadata)
+GENERATED_FILENAME = 'RAD_2511_v1_17.xlsx'
+
+
+def workloads(args, workdir: Path):
+    """[(nom, chemin)] des classeurs à mesurer (générés au besoin)."""
+    items = []
+
+    for rows in args.rows or []:
+        items.append((f'rows-{rows}', {'rows': rows}))
+    for scale in args.scale or []:
+        items.append((f'scale-{scale:g}x', {'scale': scale}))
+
+    paths = []
+    for name, size in items:
+        path = workdir / f'{name}-seed{args.seed}' / GENERATED_FILENAME
+        if not path.exists():
+            logger.info(f"🏗️  Génération {name}...")
+            generate_workbook(path, seed=args.seed, **size)
+        paths.append((name, path))
+
+    for input_path in args.input or []:
+        paths.append((Path(input_path).name, Path(input_path)))
+
+    return paths
+
+
+def measure_sheets(excel_path: Path):
+    """Temps de lecture et de parsing de chaque feuille (classeur ouvert une fois)."""
+    rad_parser = RADParser(excel_path)
+    workbook = rad_parser._open_workbook()
+    timings = {}
+
+    try:
+        for sheet_name in RADParser.SHEET_MAPPING:
+            start = time.perf_counter()
+            df = rad_parser._read_sheet(sheet_name, workbook)
+            read = time.perf_counter()
+            rad_parser._parse_sheet(sheet_name, df)
+            done = time.perf_counter()
+
+            timings[sheet_name] = {'read_s': read - start, 'parse_s': done - read}
+    finally:
+        if workbook is not None:
+            workbook.close()
+
+    return timings
+
+
+def measure(excel_path: Path, runs: int):
+    """Toutes les mesures d'une charge."""
+    durations = []
+    data = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        rad_parser = RADParser(excel_path)
+        data = rad_parser.parse()
+        durations.append(time.perf_counter() - start)
+
+    sheet_runs = [measure_sheets(excel_path) for _ in range(runs)]
+    sheets = {
+        sheet_name: {
+            metric: round(statistics.median(run[sheet_name][metric] for run in sheet_runs), 4)
+            for metric in ('read_s', 'parse_s')
+        }
+        for sheet_name in RADParser.SHEET_MAPPING
+    }
+
+    # Passe séparée: tracemalloc ralentit fortement l'exécution
+    tracemalloc.start()
+    try:
+        RADParser(excel_path).parse()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / 'rad-data.json'
+        rad_parser.save_json(output_path)
+        output_bytes = output_path.stat().st_size
+
+    return {
+        'total_entries': data['stats']['total_entries'],
+        'total_s': round(statistics.median(durations), 4),
+        'peak_memory_mb': round(peak / 1024 / 1024, 1),
+        'output_bytes': output_bytes,
+        'sheets': sheets,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float):
+    """Compare aux mesures de la baseline; retourne la liste des régressions."""
+    regressions = []
+
+    for name, current in results['workloads'].items():
+        previous = baseline.get('workloads', {}).get(name)
+        if previous is None:
+            logger.info(f"  {name}: absent de la baseline")
+            continue
+
+        for metric, min_delta in GATED_METRICS.items():
+            before, after = previous[metric], current[metric]
+            ratio = after / before if before else 1.0
+            regressed = ratio > 1 + tolerance and after - before > min_delta
+            status = '❌' if regressed else '✅'
+            logger.info(f"  {status} {name} {metric}: {before} → {after} ({ratio - 1:+.1%})")
+            if status == '❌':
+                regressions.append(f"{name} {metric}")
+
+        if current['output_bytes'] != previous['output_bytes']:
+            logger.warning(
+                f"  ⚠️  {name} taille du JSON: {previous['output_bytes']} → {current['output_bytes']} octets"
+            )
+
+        # Feuilles nettement plus lentes: signalées, sans faire échouer la suite
+        for sheet_name, timing in current['sheets'].items():
+            before = previous.get('sheets', {}).get(sheet_name, {}).get('parse_s')
+            after = timing['parse_s']
+            if before and after > before * (1 + tolerance) and after - before > SHEET_MIN_DELTA:
+                logger.warning(f"  ⚠️  {name} {sheet_name} parse: {before}s → {after}s")
+
+    return regressions
+
+
+def save_json(data: dict, output_path: str):
+    """Écrit un fichier de résultats."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description='Benchmarks du parser RAD sur classeurs synthétiques',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python benchmark_suite.py --rows 1000
+  python benchmark_suite.py --rows 1000 --scale 1 --scale 10 --save-baseline baseline.json
+  python benchmark_suite.py --rows 1000 --scale 1 --scale 10 --baseline baseline.json
+  python benchmark_suite.py --input ../data/raw/RAD_2511_v1_17.xlsx --output results.json
+        """
+    )
+
+    parser.add_argument('--rows', type=int, action='append',
+                       help='Classeur généré de N lignes au total (répétable)')
+    parser.add_argument('--scale', type=float, action='append',
+                       help='Classeur généré de N fois la taille d\'un RAD actuel, jusqu\'à 10 (répétable)')
+    parser.add_argument('--input', action='append',
+                       help='Classeur existant à mesurer (répétable)')
+    parser.add_argument('--seed', type=int, default=1,
+                       help='Graine des classeurs générés (default: 1)')
+    parser.add_argument('--workdir',
+                       help='Répertoire des classeurs générés, réutilisés d\'un run à l\'autre '
+                            '(default: répertoire temporaire)')
+    parser.add_argument('--runs', type=int, default=3,
+                       help='Nombre de répétitions par mesure de temps (default: 3)')
+    parser.add_argument('--output', help='Écrire les résultats dans ce fichier JSON')
+    parser.add_argument('--baseline', help='Comparer à ces résultats enregistrés')
+    parser.add_argument('--save-baseline', help='Enregistrer les résultats comme baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                       help='Dégradation tolérée avant échec (default: 0.25 = +25%%)')
+
+    args = parser.parse_args()
+
+    if not (args.rows or args.scale or args.input):
+        args.rows = [1000]
+
+    # Les logs par feuille du parser noient les mesures
+    parser_logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(args.workdir) if args.workdir else Path(tmp)
+
+        results = {
+            'format': RESULTS_FORMAT,
+            'version': RESULTS_VERSION,
+            'created_at': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'runs': args.runs,
+            'workloads': {},
+        }
+
+        for name, excel_path in workloads(args, workdir):
+            logger.info(f"📊 {name}")
+            result = measure(excel_path, args.runs)
+            results['workloads'][name] = result
+
+            logger.info(
+                f"  {result['total_entries']} entrées: {result['total_s']:.3f}s, "
+                f"pic {result['peak_memory_mb']} MB, JSON {result['output_bytes'] / 1024:.0f} KB"
+            )
+            for sheet_name, timing in result['sheets'].items():
+                logger.info(f"    {sheet_name:<22} lecture {timing['read_s']:7.3f}s  parsing {timing['parse_s']:7.3f}s")
+
+    if args.output:
+        save_json(results, args.output)
+        logger.info(f"💾 Résultats: {args.output}")
+
+    if args.save_baseline:
+        save_json(results, args.save_baseline)
+        logger.info(f"💾 Baseline enregistrée: {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        logger.info(f"📏 Comparaison à {args.baseline} (tolérance {args.tolerance:.0%})")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            logger.error(f"❌ Régressions: {', '.join(regressions)}")
+            return 1
+        logger.info("✅ Pas de régression")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
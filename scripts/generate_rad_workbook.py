@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Générateur de classeurs RAD synthétiques (benchmarks, tests de non-régression)
+
+Usage:
+    python generate_rad_workbook.py output.xlsx [--rows 1000 | --scale 1.0] [--seed 1]
+
+Exemple:
+    python generate_rad_workbook.py ../data/bench/RAD_2511_v1_17.xlsx --scale 10
+
+Le classeur reprend exactement les noms de feuilles de RADParser.SHEET_MAPPING
+et les en-têtes attendus par ANNEX_SCHEMAS, avec les retours à la ligne que
+contient le fichier EUROCONTROL (ex: "Valid\\nFrom", nettoyés par
+_clean_columns). Les valeurs imitent le RAD: IDs préfixés par pays, points,
+airways, aérodromes OACI, FL, créneaux horaires, dates Excel, cellules vides.
+La génération est déterministe pour une même graine.
+"""
+
+import argparse
+import logging
+import random
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from rad_parser import RADParser
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Nombre de lignes par feuille d'un RAD actuel (ordre de grandeur, cycle 2511)
+CURRENT_RAD_ROWS = {
+    'Annex 1': 700,
+    'Annex 2A': 300,
+    'Annex 2B': 6500,
+    'Annex 2C': 250,
+    'Annex 3A Conditions': 400,
+    'Annex 3A ARR': 2300,
+    'Annex 3A DEP': 2300,
+    'Annex 3B DCT': 6000,
+    'Annex 3B FRA LIM': 900,
+}
+
+MAX_SCALE = 10
+
+# En-têtes du fichier EUROCONTROL contenant un retour à la ligne
+# (clé: en-tête nettoyé tel qu'il apparaît dans ANNEX_SCHEMAS)
+RAW_HEADERS = {
+    'Change Ind.': 'Change\nInd.',
+    'Valid From': 'Valid\nFrom',
+    'Valid Until': 'Valid\nUntil',
+    'Release Date': 'Release\nDate',
+    'Time Applicability': 'Time\nApplicability',
+    'Operational Goal': 'Operational\nGoal',
+    'Special Event and Crisis': 'Special Event\nand Crisis',
+    'ARR Time Applicability': 'ARR Time\nApplicability',
+    'DEP Time Applicability': 'DEP Time\nApplicability',
+    'ARR Operational Goal': 'ARR Operational\nGoal',
+    'DEP Operational Goal': 'DEP Operational\nGoal',
+    'First PT STAR / STAR ID': 'First PT STAR\n/ STAR ID',
+    'Last PT SID / SID ID': 'Last PT SID\n/ SID ID',
+    'RAD Application ID': 'RAD Application\nID',
+}
+
+ID_PREFIXES = ['LS', 'LF', 'ED', 'EG', 'LI', 'LO', 'EB', 'EH', 'LE', 'LK']
+NAS_FABS = ['FABEC', 'FAB CE', 'UK-IRELAND FAB', 'SW FAB', 'DANUBE FAB', 'NEFAB', 'NAS']
+CHANGE_INDICATORS = ['', '', '', 'NEW', 'AMD', 'DEL']
+TIME_APPLICABILITY = [
+    'H24',
+    'MON-FRI 0600-1800 (0500-1700)',
+    'SAT-SUN 0000-2359',
+    '0700-2100 (0600-2000)',
+    'MON-THU 2200-0500, FRI 2200-SAT 0700',
+]
+UTILIZATION = [
+    'Not available for traffic ARR {ad}',
+    'Only available for traffic DEP {ad} ABV FL{fl}',
+    'Not available ABV FL{fl} BLW FL{fl2}',
+    'Compulsory for traffic DEP {ad} via {pt}',
+    'Not available for traffic with RFL BLW FL{fl}',
+]
+GOALS = ['Traffic segregation', 'Capacity', 'Airspace structure', 'ATC coordination', '']
+REMARKS = ['', '', 'See AIP', 'Military activity', 'Subject to ATC clearance', 'Valid with CDR']
+
+
+class RADWorkbookGenerator:
+    """Génère des lignes réalistes pour chaque feuille du RAD."""
+
+    def __init__(self, seed: int = 1):
+        self.random = random.Random(seed)
+
+        # Référentiels partagés par toutes les feuilles (jointures réalistes)
+        self.points = [self._name(5) for _ in range(2000)]
+        self.aerodromes = [
+            self.random.choice(ID_PREFIXES) + self._name(2) for _ in range(400)
+        ]
+        self.airways = [
+            f"{self.random.choice(['U', '', 'T'])}{self.random.choice('LMNPQYZ')}{self.random.randint(1, 999)}"
+            for _ in range(300)
+        ]
+        self.airspaces = [ad[:2] + self._name(2) + suffix for ad in self.aerodromes[:80]
+                          for suffix in ('FRA', 'UTA', 'CTA')]
+
+    def _name(self, length: int):
+        return ''.join(self.random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(length))
+
+    def _blank(self, value, probability: float = 0.15):
+        """Cellule vide avec une probabilité donnée (NaN côté pandas)."""
+        return None if self.random.random() < probability else value
+
+    def _date(self):
+        """Date Excel, texte ou vide, comme dans les colonnes de validité."""
+        r = self.random.random()
+        if r < 0.5:
+            return datetime(2025, self.random.randint(1, 12), self.random.randint(1, 28))
+        if r < 0.7:
+            return 'UFN'
+        return None
+
+    def _flight_level(self):
+        return self.random.choice(range(95, 460, 10))
+
+    def _utilization(self):
+        fl = self._flight_level()
+        return self.random.choice(UTILIZATION).format(
+            ad=self.random.choice(self.aerodromes),
+            pt=self.random.choice(self.points),
+            fl=f"{fl:03d}",
+            fl2=f"{max(fl - 100, 45):03d}",
+        )
+
+    def _definition(self):
+        parts = self.random.sample(self.aerodromes + self.airspaces, self.random.randint(1, 6))
+        return ', '.join(parts)
+
+    def value(self, key: str, row_id: str):
+        """Valeur d'une cellule selon la clé JSON de sa colonne."""
+        if key == 'id':
+            return row_id
+        if key == 'change_indicator':
+            return self._blank(self.random.choice(CHANGE_INDICATORS), 0.5)
+        if key in ('valid_from', 'valid_until', 'release_date'):
+            return self._date()
+        if key in ('from_point', 'to_point', 'first_pt_star', 'last_pt_sid', 'dct_arr_pt', 'dct_dep_pt'):
+            return self._blank(self.random.choice(self.points))
+        if key == 'point_or_airspace':
+            return self._blank(self.random.choice(self.points + self.airspaces))
+        if key == 'airway':
+            return self._blank(self.random.choice(self.airways), 0.3)
+        if key == 'aerodrome':
+            return self.random.choice(self.aerodromes)
+        if key in ('airspace', 'atc_unit'):
+            return self._blank(self.random.choice(self.airspaces))
+        if key == 'utilization':
+            return self._utilization()
+        if key == 'time_applicability' or key.endswith('time_applicability'):
+            return self._blank(self.random.choice(TIME_APPLICABILITY), 0.3)
+        if key == 'operational_goal':
+            return self._blank(self.random.choice(GOALS), 0.3)
+        if key == 'nas_fab':
+            return self.random.choice(NAS_FABS)
+        if key == 'definition':
+            return self._definition()
+        if key == 'condition':
+            return f"{self.random.choice(['ARR', 'DEP'])} {self.random.choice(self.aerodromes)} via {self.random.choice(self.points)}"
+        if key == 'group_id':
+            return self._blank(f"G{self.random.randint(1, 99):02d}", 0.5)
+        if key in ('arr_fpl_option', 'dep_fpl_options'):
+            return self._blank(self.random.choice(['Yes', 'No']), 0.4)
+        if key == 'categorisation':
+            return self._blank(self.random.choice(['Structural', 'Capacity', 'Environmental']), 0.3)
+        # remarks, owner, special_event, explanation...
+        return self._blank(self.random.choice(REMARKS), 0.4)
+
+    def rows(self, sheet_name: str, count: int):
+        """Lignes (listes de cellules) d'une feuille, dans l'ordre de ses en-têtes."""
+        schema = RADParser.ANNEX_SCHEMAS[sheet_name]
+        keys = ['id', *schema['columns'], *schema.get('trailing', {})]
+        numbering = 3 if sheet_name.startswith('Annex 3A') else 4
+
+        for n in range(count):
+            prefix = self.random.choice(ID_PREFIXES)
+            row_id = f"{prefix}{n % 10 ** numbering:0{numbering}d}{self.random.choice(['', 'A', 'C'])}"
+            # ~2% de lignes sans ID (ignorées par le parser)
+            if self.random.random() < 0.02:
+                row_id = None
+            yield [self.value(key, row_id) for key in keys]
+
+
+def raw_headers(sheet_name: str):
+    """En-têtes Excel d'une feuille, avec leurs retours à la ligne d'origine."""
+    schema = RADParser.ANNEX_SCHEMAS[sheet_name]
+    headers = [schema['id_column'], *schema['columns'].values(), *schema.get('trailing', {}).values()]
+    return [RAW_HEADERS.get(header, header) for header in headers]
+
+
+def sheet_row_counts(rows: int = None, scale: float = None):
+    """Lignes par feuille: `rows` au total, ou `scale` fois un RAD actuel."""
+    if rows is not None:
+        scale = rows / sum(CURRENT_RAD_ROWS.values())
+    scale = 1.0 if scale is None else scale
+
+    if not 0 < scale <= MAX_SCALE:
+        raise ValueError(f"Taille hors limites (au plus {MAX_SCALE}x un RAD actuel)")
+
+    return {sheet: max(1, round(count * scale)) for sheet, count in CURRENT_RAD_ROWS.items()}
+
+
+def generate_workbook(output_path: str, rows: int = None, scale: float = None, seed: int = 1):
+    """Écrit un classeur RAD synthétique; retourne le nombre de lignes par feuille."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    counts = sheet_row_counts(rows, scale)
+    generator = RADWorkbookGenerator(seed)
+
+    # write_only: les lignes sont écrites au fil de l'eau (10x un RAD en mémoire bornée)
+    workbook = Workbook(write_only=True)
+    for sheet_name in RADParser.SHEET_MAPPING:
+        sheet = workbook.create_sheet(sheet_name)
+        sheet.append(raw_headers(sheet_name))
+        for row in generator.rows(sheet_name, counts[sheet_name]):
+            sheet.append(row)
+
+    workbook.save(output_path)
+    return counts
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description='Génère un classeur RAD synthétique',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python generate_rad_workbook.py RAD_2511_v1_17.xlsx
+  python generate_rad_workbook.py RAD_2511_v1_17.xlsx --rows 1000
+  python generate_rad_workbook.py RAD_2511_v1_17.xlsx --scale 10 --seed 42
+        """
+    )
+
+    parser.add_argument('output', help='Fichier Excel à créer (nommé RAD_YYMM_vX_YY.xlsx pour les métadonnées)')
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument('--rows', type=int,
+                      help='Nombre total de lignes, réparties comme dans un RAD réel')
+    size.add_argument('--scale', type=float,
+                      help=f'Taille relative à un RAD actuel, jusqu\'à {MAX_SCALE} (default: 1)')
+    parser.add_argument('--seed', type=int, default=1,
+                       help='Graine aléatoire (default: 1)')
+
+    args = parser.parse_args()
+
+    try:
+        counts = generate_workbook(args.output, rows=args.rows, scale=args.scale, seed=args.seed)
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+        return 1
+
+    size = Path(args.output).stat().st_size / 1024 / 1024
+    logger.info(f"✅ {args.output}: {sum(counts.values())} lignes, {size:.1f} MB")
+    for sheet_name, count in counts.items():
+        logger.info(f"  • {sheet_name}: {count}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+RAD Aerodromes - Index par aérodrome OACI des entrées Annex 3A ARR/DEP
+
+Les options d'arrivée et de départ d'un aérodrome (STAR/SID, points DCT,
+options FPL) sont réparties entre les feuilles Annex 3A ARR, Annex 3A DEP et
+Annex 3A Conditions. La section `aerodromes` de la sortie les regroupe par
+code OACI, avec les conditions déjà jointes à chaque entrée:
+
+    "aerodromes": {
+      "EDDF": {
+        "arrivals":   [{"id": "ED1234A", "first_pt_star": ..., "dct_arr_pt": ...,
+                        "conditions": [{"id": "ED1234A", "condition": ..., ...}]}, ...],
+        "departures": [{"id": ..., "last_pt_sid": ..., "dct_dep_pt": ..., "conditions": [...]}, ...],
+        "conditions": ["ED1234A", "ED2001C", ...]
+      }
+    }
+
+Une ligne de condition est jointe à une entrée ARR/DEP quand son "RAD
+Application ID" est l'ID de l'entrée, ou quand l'entrée cite cet ID (options
+FPL, remarques...). `conditions` de l'aérodrome liste ces IDs, plus ceux des
+conditions dont le texte mentionne l'aérodrome. Les entrées sont reprises
+sans searchable_text.
+
+"options DCT/STAR/SID à EDDF" = data['aerodromes']['EDDF'].
+
+Usage:
+    python rad_parser.py input.xlsx rad-data.json --derived-sections aerodromes
+"""
+
+from rad_index import normalize_id, tokenize
+
+# Champs d'une entrée ARR/DEP qui peuvent citer une condition par son ID
+REFERENCE_FIELDS = ('arr_fpl_option', 'dep_fpl_options', 'remarks', 'operational_goal', 'special_event')
+
+# Champs d'une condition où l'aérodrome concerné peut être mentionné
+MENTION_FIELDS = ('condition', 'explanation')
+
+
+def _entry(record: dict):
+    """Copie d'une entrée sans searchable_text (texte de recherche de l'annexe)."""
+    return {key: value for key, value in record.items() if key != 'searchable_text'}
+
+
+def build_aerodrome_index(arrivals: list, departures: list, conditions: list):
+    """Section `aerodromes`: {OACI: {arrivals, departures, conditions}}, triée par OACI."""
+    rows_by_id = {}
+    for row in conditions:
+        condition_id = normalize_id(row.get('id') or '')
+        if condition_id:
+            rows_by_id.setdefault(condition_id, []).append(_entry(row))
+
+    index = {}
+
+    def aerodrome(icao: str):
+        return index.setdefault(icao, {'arrivals': [], 'departures': [], 'conditions': []})
+
+    for kind, records in (('arrivals', arrivals), ('departures', departures)):
+        for record in records:
+            icaos = tokenize(record.get('aerodrome') or '')
+            if not icaos:
+                continue
+
+            # Conditions de l'entrée: même ID, puis IDs cités dans ses champs texte
+            entry_id = normalize_id(record.get('id') or '')
+            condition_ids = [entry_id] if entry_id in rows_by_id else []
+            for field in REFERENCE_FIELDS:
+                for token in tokenize(record.get(field) or ''):
+                    if token in rows_by_id and token not in condition_ids:
+                        condition_ids.append(token)
+
+            entry = _entry(record)
+            entry['conditions'] = [row for condition_id in condition_ids for row in rows_by_id[condition_id]]
+
+            for icao in icaos:
+                item = aerodrome(icao)
+                item[kind].append(entry)
+                item['conditions'].extend(condition_ids)
+
+    # Conditions dont le texte mentionne un aérodrome ayant des entrées ARR/DEP
+    for condition_id, rows in rows_by_id.items():
+        for row in rows:
+            text = ' '.join(row.get(field) or '' for field in MENTION_FIELDS)
+            for token in tokenize(text):
+                if token in index:
+                    index[token]['conditions'].append(condition_id)
+
+    for item in index.values():
+        item['conditions'] = sorted(set(item['conditions']))
+
+    return dict(sorted(index.items()))
@@ -0,0 +1,183 @@
+"""
+RAD Areas - Graphe des zones de l'Annex 1 et fermeture transitive précalculée
+
+Les zones de l'Annex 1 sont définies en texte libre (`definition`): une liste
+d'unités (ACC, FIR/UIR, secteurs FRA/CTA...), d'aérodromes OACI et d'autres
+zones de l'Annex 1, que les règles des autres annexes citent par leur ID.
+Le graphe zone → références est résolu une fois au parsing; la section
+`areas` de la sortie permet ensuite d'étendre une référence de zone sans
+récursion:
+
+    "areas": {
+      "graph":        {"LS5179": ["LSGG", "LSZH", "EDDF"], ...},  # références directes
+      "members":      {"LS5179": ["EDDF", "LSGG", "LSZH"], ...},  # unités/aérodromes, transitif
+      "subareas":     {"EG9318C": ["ED2416A"], ...},              # zones incluses, transitif
+      "contained_in": {"LFPG": ["LF0007A", ...], ...},            # inverse de members + subareas
+      "cycles":       [["EG0003A", "EG0004C"]]                    # zones qui s'incluent mutuellement
+    }
+
+"quelles zones contiennent LFPG / LSAS" = areas['contained_in']['LFPG'].
+Une unité suffixée (LSASFIR, EDKMFRA, LFFFACC...) est aussi rangée sous son
+code OACI à 4 lettres dans contained_in.
+
+Les zones d'un même cycle (composante fortement connexe) partagent leur
+fermeture: chacune contient les autres et tous leurs membres. Les
+composantes sont résolues une seule fois chacune (Tarjan itératif, sans
+limite de profondeur), dans l'ordre où leurs dépendances sont déjà connues.
+
+Usage:
+    python rad_parser.py input.xlsx rad-data.json --derived-sections areas
+"""
+
+import logging
+import re
+
+from rad_index import normalize_id, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Références d'une définition: identifiants d'au moins 4 caractères (les
+# mots de liaison et niveaux de vol sont écartés)
+REFERENCE_PATTERN = re.compile(r'^[A-Z][A-Z0-9]{3,}$')
+LEVEL_PATTERN = re.compile(r'^FL\d+$')
+STOP_WORDS = frozenset(['AND', 'EXCEPT', 'EXCLUDING', 'INCLUDING', 'PLUS', 'PART', 'WITH', 'ONLY'])
+
+# Unité suffixée → code OACI à 4 lettres (LSASFIR → LSAS)
+UNIT_PATTERN = re.compile(r'^([A-Z]{4})(?:FIR|UIR|ACC|UAC|CTA|UTA|TMA|FRA)$')
+
+
+def parse_definition(definition: str, area_ids=()):
+    """Références d'une définition de zone, dans l'ordre, sans doublon.
+
+    Un ID de zone connu (`area_ids`) est toujours gardé, même court.
+
+    >>> parse_definition('LSAS, LFFF AND EDKMFRA ABV FL245')
+    ['LSAS', 'LFFF', 'EDKMFRA']
+    """
+    return [
+        token for token in tokenize(definition or '')
+        if token in area_ids
+        or (REFERENCE_PATTERN.match(token) and token not in STOP_WORDS and not LEVEL_PATTERN.match(token))
+    ]
+
+
+def build_graph(records: list):
+    """Graphe zone → références directes (définitions d'un même ID fusionnées)."""
+    area_ids = {normalize_id(record.get('id') or '') for record in records} - {''}
+
+    graph = {}
+    for record in records:
+        area_id = normalize_id(record.get('id') or '')
+        if not area_id:
+            continue
+        references = graph.setdefault(area_id, [])
+        for reference in parse_definition(record.get('definition'), area_ids):
+            if reference not in references:
+                references.append(reference)
+    return graph
+
+
+def strongly_connected(graph: dict):
+    """Composantes fortement connexes (Tarjan itératif), chaque composante
+    émise après toutes celles qu'elle atteint."""
+    index, lowlink = {}, {}
+    stack, on_stack = [], set()
+    components = []
+
+    for root in graph:
+        if root in index:
+            continue
+
+        # Pile d'appels explicite: (nœud, itérateur sur ses voisins zones)
+        work = [(root, iter(graph[root]))]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in graph:
+                    continue
+                if neighbor not in index:
+                    index[neighbor] = lowlink[neighbor] = len(index)
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(graph[neighbor])))
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def build_area_graph(records: list):
+    """Section `areas` de la sortie du parser à partir des entrées de l'Annex 1."""
+    graph = build_graph(records)
+
+    # Fermeture mémoïsée par composante: (zones atteintes, membres atteints)
+    closure = {}
+    members, subareas, cycles = {}, {}, []
+
+    for component in strongly_connected(graph):
+        component_set = set(component)
+        areas, leaves = set(component_set), set()
+        for node in component:
+            for reference in graph[node]:
+                if reference in component_set:
+                    continue
+                if reference in graph:
+                    reached_areas, reached_leaves = closure[reference]
+                    areas |= reached_areas
+                    leaves |= reached_leaves
+                else:
+                    leaves.add(reference)
+
+        result = (frozenset(areas), frozenset(leaves))
+        for node in component:
+            closure[node] = result
+
+        if len(component) > 1 or component[0] in graph[component[0]]:
+            cycles.append(sorted(component))
+
+    for area_id in graph:
+        areas, leaves = closure[area_id]
+        members[area_id] = sorted(leaves)
+        subareas[area_id] = sorted(areas - {area_id})
+
+    contained_in = {}
+    for area_id in graph:
+        for reference in (*members[area_id], *subareas[area_id]):
+            keys = [reference]
+            unit = UNIT_PATTERN.match(reference)
+            if unit:
+                keys.append(unit.group(1))
+            for key in keys:
+                areas = contained_in.setdefault(key, [])
+                if not areas or areas[-1] != area_id:
+                    areas.append(area_id)
+
+    if cycles:
+        logger.warning(f"⚠️  Annex 1: {len(cycles)} cycle(s) de zones ({', '.join('/'.join(c) for c in cycles[:5])})")
+
+    return {
+        'graph': graph,
+        'members': members,
+        'subareas': subareas,
+        'contained_in': {key: sorted(areas) for key, areas in sorted(contained_in.items())},
+        'cycles': sorted(cycles),
+    }
@@ -0,0 +1,273 @@
+"""
+RAD Cache - Cache de parsing par feuille, indexé sur le contenu du xlsx
+
+Entre deux versions mineures du RAD (ex: RAD_2511_v1_17 → v1_19), la plupart
+des feuilles ne changent pas. Chaque feuille est identifiée par un hash de sa
+partie XML dans le xlsx (xl/worksheets/sheetN.xml), avec les références aux
+shared strings et aux styles résolues: deux classeurs dont la table de
+strings a été renumérotée donnent le même hash pour une feuille inchangée.
+
+Les entrées parsées sont stockées sous ce hash dans un répertoire de cache;
+les entrées les moins récemment utilisées sont supprimées au-delà d'une
+taille maximale (les anciens cycles AIRAC partent en premier).
+
+Usage (via le parser):
+    python rad_parser.py input.xlsx output.json --cache-dir ../data/cache
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from posixpath import join as zip_join, normpath as zip_normpath
+
+logger = logging.getLogger(__name__)
+
+# À incrémenter quand le format des entrées produites par le parser change
+CACHE_FORMAT = 1
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# Une ligne (<row ...>) ou une cellule (<c .../> ou <c ...>...</c>)
+_TOKEN = re.compile(rb'<row\b([^>]*)>|<c\b([^>]*?)(?:/>|>(.*?)</c>)', re.S)
+_ATTR_R = re.compile(rb'\br="([^"]*)"')
+_ATTR_S = re.compile(rb'\ss="(\d+)"')
+_ATTR_T = re.compile(rb'\bt="([^"]*)"')
+_VALUE = re.compile(rb'<v>([^<]*)</v>')
+
+
+def sheet_digests(excel_path, sheet_names=None):
+    """Calcule le hash de contenu de chaque feuille du classeur.
+
+    Returns:
+        dict: nom de feuille → hash hexadécimal (feuilles absentes omises)
+    """
+    with zipfile.ZipFile(excel_path) as zf:
+        parts, date1904 = _sheet_parts(zf)
+        strings = _shared_strings(zf)
+        styles = _style_keys(zf)
+
+        digests = {}
+        for sheet_name, part in parts.items():
+            if sheet_names is not None and sheet_name not in sheet_names:
+                continue
+
+            digest = hashlib.sha256(b'1904' if date1904 else b'1900')
+            _hash_sheet(digest, zf.read(part), strings, styles)
+            digests[sheet_name] = digest.hexdigest()
+
+    return digests
+
+
+def cache_key(digest: str, *parts):
+    """Clé de cache: hash de la feuille + tout ce qui influence le parsing.
+
+    Les parties sont sérialisées sans trier les clés: l'ordre des colonnes
+    d'un schéma fixe l'ordre des champs des entrées, il doit changer la clé.
+    """
+    key = hashlib.sha256(f"v{CACHE_FORMAT}|{digest}".encode('utf-8'))
+    for part in parts:
+        key.update(b'|')
+        key.update(json.dumps(part, ensure_ascii=False).encode('utf-8'))
+    return key.hexdigest()
+
+
+def _sheet_parts(zf: zipfile.ZipFile):
+    """Associe chaque nom de feuille à sa partie XML dans l'archive."""
+    workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels.iter(f'{_NS_PKG_REL}Relationship')}
+
+    parts = {}
+    for sheet in workbook.iter(f'{_NS_MAIN}sheet'):
+        target = targets.get(sheet.get(f'{_NS_REL}id'))
+        if not target:
+            continue
+        # Cibles relatives à xl/ (ou absolues depuis la racine du package)
+        path = target.lstrip('/') if target.startswith('/') else zip_normpath(zip_join('xl', target))
+        parts[sheet.get('name')] = path
+
+    pr = workbook.find(f'{_NS_MAIN}workbookPr')
+    date1904 = pr is not None and pr.get('date1904') in ('1', 'true')
+
+    return parts, date1904
+
+
+def _shared_strings(zf: zipfile.ZipFile):
+    """Table des shared strings (liste de bytes UTF-8, vide si absente)."""
+    try:
+        data = zf.open('xl/sharedStrings.xml')
+    except KeyError:
+        return []
+
+    strings = []
+    with data:
+        for event, elem in ET.iterparse(data):
+            if elem.tag == f'{_NS_MAIN}si':
+                text = ''.join(t.text or '' for t in elem.iter(f'{_NS_MAIN}t'))
+                strings.append(text.encode('utf-8'))
+                elem.clear()
+
+    return strings
+
+
+def _style_keys(zf: zipfile.ZipFile):
+    """Format numérique de chaque style de cellule (détermine dates vs nombres)."""
+    try:
+        styles = ET.fromstring(zf.read('xl/styles.xml'))
+    except KeyError:
+        return []
+
+    formats = {
+        fmt.get('numFmtId'): fmt.get('formatCode', '')
+        for fmt in styles.iter(f'{_NS_MAIN}numFmt')
+    }
+
+    keys = []
+    cell_xfs = styles.find(f'{_NS_MAIN}cellXfs')
+    if cell_xfs is not None:
+        for xf in cell_xfs.iter(f'{_NS_MAIN}xf'):
+            fmt_id = xf.get('numFmtId', '0')
+            keys.append(f"{fmt_id}:{formats.get(fmt_id, '')}".encode('utf-8'))
+
+    return keys
+
+
+def _hash_sheet(digest, xml: bytes, strings: list, styles: list):
+    """Alimente `digest` avec les lignes/cellules de la feuille, références résolues.
+
+    Seuls les repères de lignes et les cellules non vides sont pris en compte:
+    un changement de largeur de colonne ou de mise en page ne change pas le hash.
+    """
+    for match in _TOKEN.finditer(xml):
+        row_attrs, cell_attrs, body = match.groups()
+
+        if row_attrs is not None:
+            ref = _ATTR_R.search(row_attrs)
+            digest.update(b'\x1dR' + (ref.group(1) if ref else b''))
+            continue
+
+        # Cellule vide (souvent seulement stylée): lue comme NaN, ignorée
+        if not body:
+            continue
+
+        ref = _ATTR_R.search(cell_attrs)
+        cell_type = _ATTR_T.search(cell_attrs)
+        cell_type = cell_type.group(1) if cell_type else b'n'
+
+        style = _ATTR_S.search(cell_attrs)
+        style_key = b''
+        if style:
+            index = int(style.group(1))
+            style_key = styles[index] if index < len(styles) else style.group(1)
+
+        if cell_type == b's':
+            value = _VALUE.search(body)
+            if value:
+                index = int(value.group(1))
+                body = strings[index] if index < len(strings) else body
+
+        digest.update(b'\x1e'.join((
+            b'\x1dC',
+            ref.group(1) if ref else b'',
+            cell_type,
+            style_key,
+            body,
+        )))
+
+
+class ParseCache:
+    """Répertoire de cache: une entrée JSON par (contenu de feuille, configuration)."""
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self._used = set()
+
+    def _path(self, key: str):
+        return self.cache_dir / f"{key}.json"
+
+    def contains(self, key: str):
+        """Indique si une entrée existe pour `key`, sans la charger."""
+        return self._path(key).is_file()
+
+    def get(self, key: str):
+        """Retourne les entrées en cache pour `key`, ou None."""
+        path = self._path(key)
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                records = json.load(f)['records']
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠️  Entrée de cache illisible, ignorée: {path.name} ({e})")
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        # mtime = date de dernière utilisation (politique LRU)
+        os.utime(path)
+        self._used.add(key)
+        self.hits += 1
+        return records
+
+    def put(self, key: str, records: list, **info):
+        """Enregistre les entrées d'une feuille (écriture atomique)."""
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({**info, 'records': records}, f, ensure_ascii=False, separators=(',', ':'))
+
+        os.replace(tmp_path, path)
+        self._used.add(key)
+
+    def evict(self):
+        """Supprime les entrées les moins récemment utilisées au-delà de max_bytes.
+
+        Les entrées lues ou écrites pendant ce run ne sont jamais supprimées.
+        """
+        entries = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+
+        for mtime, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if path.stem in self._used:
+                continue
+
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"  🧹 Cache: {removed} entrée(s) supprimée(s), {total / 1024 / 1024:.1f} MB conservés")
+
+        return removed
+
+    def stats(self):
+        """Compteurs pour data['stats']['cache']."""
+        return {'hits': self.hits, 'misses': self.misses}
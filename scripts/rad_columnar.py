@@ -0,0 +1,211 @@
+"""
+RAD Columnar - Format de sortie en colonnes avec encodage par dictionnaire
+
+Dans la sortie standard, chaque entrée répète toutes ses clés ainsi que des
+valeurs peu variées (annex, type, nas_fab, change_indicator, atc_unit...).
+Le format colonnes stocke chaque annexe comme un ensemble de tableaux, un par
+champ; les champs peu variés sont remplacés par des index dans un
+dictionnaire de strings propre à l'annexe:
+
+    {
+      "metadata": {...},
+      "format": "columnar",
+      "format_version": 1,
+      "annexes": {
+        "annex2b_rules": {
+          "count": 2,
+          "fields": ["id", "annex", ...],
+          "dictionary": ["2B", ...],
+          "encoded": ["annex", ...],
+          "columns": {"id": ["LS1", "LS2"], "annex": [0, 0], ...}
+        }
+      },
+      "stats": {...}
+    }
+
+Usage:
+    python rad_parser.py input.xlsx output.json --format columnar
+
+    from rad_columnar import load_rad_json
+    data = load_rad_json('rad-data-current.json')   # forme habituelle, quel que soit le format
+"""
+
+import json
+
+FORMAT_NAME = 'columnar'
+FORMAT_VERSION = 1
+
+# Un champ est encodé par dictionnaire si ses valeurs distinctes représentent
+# au plus cette fraction du nombre d'entrées
+DICTIONARY_MAX_RATIO = 0.5
+
+# Clés du document; les autres (sections dérivées, ex: areas) suivent les stats
+DOCUMENT_KEYS = ('metadata', 'format', 'format_version', 'annexes', 'stats')
+
+
+def is_columnar(data: dict):
+    """True si `data` est au format colonnes."""
+    return data.get('format') == FORMAT_NAME
+
+
+def encode_annex(records: list):
+    """Encode une liste d'entrées en colonnes (champs absents → null)."""
+    fields = []
+    seen_fields = set()
+    for record in records:
+        for field in record:
+            if field not in seen_fields:
+                seen_fields.add(field)
+                fields.append(field)
+
+    count = len(records)
+    dictionary = []
+    positions = {}
+    encoded = []
+    columns = {}
+
+    for field in fields:
+        values = [record.get(field) for record in records]
+        try:
+            distinct = set(values)
+        except TypeError:
+            # Valeurs structurées (ex: validity): colonne telle quelle
+            columns[field] = values
+            continue
+
+        if None in distinct or len(distinct) > count * DICTIONARY_MAX_RATIO:
+            columns[field] = values
+            continue
+
+        codes = []
+        for value in values:
+            code = positions.get(value)
+            if code is None:
+                code = positions[value] = len(dictionary)
+                dictionary.append(value)
+            codes.append(code)
+
+        encoded.append(field)
+        columns[field] = codes
+
+    return {
+        'count': count,
+        'fields': fields,
+        'dictionary': dictionary,
+        'encoded': encoded,
+        'columns': columns,
+    }
+
+
+def sections(data: dict):
+    """Sections dérivées (areas...) reprises telles quelles dans les deux formats."""
+    return {key: value for key, value in data.items() if key not in DOCUMENT_KEYS}
+
+
+def encode(data: dict):
+    """Convertit une sortie du parser (entrées) au format colonnes."""
+    return {
+        'metadata': data['metadata'],
+        'format': FORMAT_NAME,
+        'format_version': FORMAT_VERSION,
+        'annexes': {
+            json_key: encode_annex(records)
+            for json_key, records in data['annexes'].items()
+        },
+        'stats': data['stats'],
+        **sections(data),
+    }
+
+
+class ColumnarAnnex:
+    """Annexe au format colonnes; les entrées sont reconstruites à la demande."""
+
+    def __init__(self, annex: dict):
+        self.count = annex['count']
+        self.fields = annex['fields']
+
+        # Colonnes encodées décodées paresseusement (un tableau par champ)
+        self._raw = annex['columns']
+        self._dictionary = annex['dictionary']
+        self._encoded = set(annex['encoded'])
+        self._decoded = {}
+
+    def column(self, field: str):
+        """Valeurs d'un champ pour toutes les entrées."""
+        if field not in self._decoded:
+            values = self._raw[field]
+            if field in self._encoded:
+                dictionary = self._dictionary
+                values = [dictionary[code] for code in values]
+            self._decoded[field] = values
+        return self._decoded[field]
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index: int):
+        """Entrée n°index, avec les clés dans l'ordre d'origine."""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+
+        record = {}
+        for field in self.fields:
+            value = self.column(field)[index]
+            if value is not None:
+                record[field] = value
+        return record
+
+    def __iter__(self):
+        return iter(self.records())
+
+    def records(self):
+        """Toutes les entrées (liste de dictionnaires, comme la sortie standard)."""
+        columns = [self.column(field) for field in self.fields]
+        return [
+            {field: value for field, value in zip(self.fields, row) if value is not None}
+            for row in zip(*columns)
+        ]
+
+
+def decode(data: dict):
+    """Reconstruit la forme habituelle {metadata, annexes: {clé: [entrées]}, stats}."""
+    if not is_columnar(data):
+        return data
+
+    if data.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Version du format colonnes non supportée: {data.get('format_version')}")
+
+    return {
+        'metadata': data['metadata'],
+        'annexes': {
+            json_key: ColumnarAnnex(annex).records()
+            for json_key, annex in data['annexes'].items()
+        },
+        'stats': data['stats'],
+        **sections(data),
+    }
+
+
+def load_rad_json(path: str, lazy: bool = False):
+    """Charge une sortie du parser, au format entrées ou colonnes.
+
+    Avec lazy=True et un fichier colonnes, les annexes sont des ColumnarAnnex
+    (entrées reconstruites à la demande) au lieu de listes.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if lazy and is_columnar(data):
+        return {
+            'metadata': data['metadata'],
+            'annexes': {
+                json_key: ColumnarAnnex(annex)
+                for json_key, annex in data['annexes'].items()
+            },
+            'stats': data['stats'],
+            **sections(data),
+        }
+
+    return decode(data)
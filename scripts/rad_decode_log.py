@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+RAD Decode Log - Décodage en flux des journaux de rejets IFPS/eurofpl
+
+Usage:
+    python rad_decode_log.py rad-data.json [log ...] [-o decoded.jsonl] [--summary summary.json]
+
+Exemple:
+    python rad_decode_log.py ../frontend/public/rad-data-current.json rejects-*.log -o decoded.jsonl --workers 4
+    zcat rejects.log.gz | python rad_decode_log.py rad-data-current.json - --summary summary.json
+
+Chaque ligne du journal (fichiers ou stdin avec '-') est lue au fil de l'eau.
+Tous les codes REF:[...] et références "ANNEX 2B" sont extraits par des
+motifs précompilés, puis résolus par l'index d'IDs de RADIndex (rad_query).
+Chaque ligne contenant au moins une référence produit une ligne JSONL:
+
+    {"source": "rejects.log", "line": 12, "message": "...",
+     "annexes": ["2B"],
+     "refs": [{"ref": "LSLF1139C", "found": true, "rules": [{...entrée RAD...}]}]}
+
+Les compteurs par règle, annexe et NAS/FAB sont cumulés au fil de l'eau
+(affichés en fin de traitement, et écrits avec --summary). La mémoire ne
+dépend pas de la taille du journal: les lignes sont traitées par lots, avec
+au plus quelques lots en cours lorsque --workers répartit le décodage sur
+plusieurs processus; le cache des REF résolues est un LRU borné
+(--cache-size) et seules les REF inconnues les plus fréquentes sont gardées.
+"""
+
+import argparse
+import json
+import logging
+import re
+import sys
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from rad_query import RADIndex
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Toutes les références d'une ligne (pas seulement la première, comme rad_query)
+REF_PATTERN = re.compile(r'REF:\s*\[?([A-Z0-9]+)\]?', re.IGNORECASE)
+ANNEX_PATTERN = re.compile(r'\bANNEX\s+(\d[A-C]?)\b', re.IGNORECASE)
+
+# Lignes envoyées à un worker en une fois
+DEFAULT_BATCH_SIZE = 2000
+
+# Lots en attente par worker (borne la mémoire quand la sortie est lente)
+PENDING_BATCHES_PER_WORKER = 2
+
+# Champs des entrées RAD omis dans la sortie enrichie (texte de recherche Fuse)
+DROPPED_FIELDS = ('searchable_text',)
+
+# Règles les plus fréquentes affichées en fin de traitement
+TOP_RULES = 10
+
+# REF résolues gardées en cache (LRU), par processus
+DEFAULT_CACHE_SIZE = 10000
+
+# REF inconnues comptées (les plus fréquentes), au-delà la liste est élaguée
+MAX_UNKNOWN_REFS = 1000
+
+
+class DecodeCache:
+    """Cache LRU des références résolues: (REF, annexes...) → entrée décodée."""
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def __setitem__(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+def decode_line(index: RADIndex, line: str, cache: DecodeCache = None):
+    """Références d'une ligne résolues par l'index; None sans référence.
+
+    `cache` garde les références déjà résolues (DecodeCache, taille bornée).
+    """
+    refs = list(dict.fromkeys(ref.upper() for ref in REF_PATTERN.findall(line)))
+    annexes = list(dict.fromkeys(annex.upper() for annex in ANNEX_PATTERN.findall(line)))
+
+    if not refs and not annexes:
+        return None
+
+    decoded = []
+    for ref in refs:
+        key = (ref, *annexes)
+        entry = cache.get(key) if cache is not None else None
+
+        if entry is None:
+            rules = index.by_id(ref)
+            # Un même ID dans plusieurs annexes: garder celles citées par le message
+            if annexes and len(rules) > 1:
+                rules = [rule for rule in rules if rule.get('annex') in annexes] or rules
+            entry = {
+                'ref': ref,
+                'found': bool(rules),
+                'rules': [
+                    {field: value for field, value in rule.items() if field not in DROPPED_FIELDS}
+                    for rule in rules
+                ],
+            }
+            if cache is not None:
+                cache[key] = entry
+
+        decoded.append(entry)
+
+    return {'annexes': annexes, 'refs': decoded}
+
+
+def decode_lines(index: RADIndex, lines: list, cache: DecodeCache = None):
+    """Décode un lot de (source, n° de ligne, texte); retourne (texte JSONL, compteurs du lot).
+
+    La sérialisation et les compteurs sont faits ici pour que les workers ne
+    renvoient qu'une chaîne et quelques Counter au processus principal.
+    """
+    chunks = []
+    stats = DecodeStats()
+    for source, line_no, line in lines:
+        stats.lines_read += 1
+        decoded = decode_line(index, line, cache)
+        if decoded is not None:
+            result = {'source': source, 'line': line_no, 'message': line, **decoded}
+            stats.add(result)
+            chunks.append(json.dumps(result, ensure_ascii=False))
+            chunks.append('\n')
+    return ''.join(chunks), stats
+
+
+# Index du processus worker (chargé une fois par _init_worker)
+_worker_index = None
+_worker_cache = None
+
+
+def _init_worker(rad_path: str, cache_size: int):
+    global _worker_index, _worker_cache
+    _worker_index = RADIndex.load(rad_path)
+    _worker_cache = DecodeCache(cache_size)
+
+
+def _decode_batch(lines: list):
+    return decode_lines(_worker_index, lines, _worker_cache)
+
+
+def read_lines(paths: list):
+    """(source, n° de ligne, texte) des journaux, '-' pour l'entrée standard."""
+    for path in paths:
+        if path == '-':
+            stream, close = sys.stdin, False
+        else:
+            stream, close = open(path, 'r', encoding='utf-8', errors='replace'), True
+
+        try:
+            for line_no, line in enumerate(stream, 1):
+                line = line.strip()
+                if line:
+                    yield path, line_no, line
+        finally:
+            if close:
+                stream.close()
+
+
+def batches(iterable, size: int):
+    """Découpe un itérable en listes de `size` éléments."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def decode_stream(rad_path: str, lines, workers: int = 1, batch_size: int = DEFAULT_BATCH_SIZE,
+                  cache_size: int = DEFAULT_CACHE_SIZE):
+    """(texte JSONL, compteurs) de chaque lot, dans l'ordre du journal."""
+    if workers <= 1:
+        index = RADIndex.load(rad_path)
+        cache = DecodeCache(cache_size)
+        for batch in batches(lines, batch_size):
+            yield decode_lines(index, batch, cache)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(rad_path, cache_size)) as pool:
+        pending = deque()
+        for batch in batches(lines, batch_size):
+            pending.append(pool.submit(_decode_batch, batch))
+            # Pas plus de quelques lots en vol: la lecture attend le décodage
+            if len(pending) >= workers * PENDING_BATCHES_PER_WORKER:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+class DecodeStats:
+    """Compteurs cumulés (taille bornée par le nombre de règles, pas par le journal).
+
+    Les REF inconnues ne sont pas bornées par le RAD: au-delà de
+    2 × MAX_UNKNOWN_REFS, seules les MAX_UNKNOWN_REFS plus fréquentes sont
+    gardées (comptes approchés pour les REF rares, unknown_refs_truncated).
+    """
+
+    def __init__(self):
+        self.lines_read = 0
+        self.lines = 0
+        self.refs = 0
+        self.resolved = 0
+        self.by_rule = Counter()
+        self.by_annex = Counter()
+        self.by_nas_fab = Counter()
+        self.unknown_refs = Counter()
+        self.unknown_refs_truncated = False
+
+    def _prune_unknown_refs(self):
+        if len(self.unknown_refs) > 2 * MAX_UNKNOWN_REFS:
+            self.unknown_refs = Counter(dict(self.unknown_refs.most_common(MAX_UNKNOWN_REFS)))
+            self.unknown_refs_truncated = True
+
+    def add(self, result: dict):
+        self.lines += 1
+
+        # Annexes citées sans REF (ex: "RAD ANNEX 2C")
+        if not result['refs']:
+            self.by_annex.update(result['annexes'])
+
+        for ref in result['refs']:
+            self.refs += 1
+            if not ref['found']:
+                self.unknown_refs[ref['ref']] += 1
+                self.by_annex.update(result['annexes'])
+                continue
+
+            self.resolved += 1
+            self.by_rule[ref['ref']] += 1
+            self.by_annex.update({rule.get('annex') for rule in ref['rules']})
+            self.by_nas_fab.update({rule.get('nas_fab') or 'N/A' for rule in ref['rules']})
+
+        self._prune_unknown_refs()
+
+    def merge(self, other: 'DecodeStats'):
+        """Ajoute les compteurs d'un lot."""
+        self.lines_read += other.lines_read
+        self.lines += other.lines
+        self.refs += other.refs
+        self.resolved += other.resolved
+        self.by_rule.update(other.by_rule)
+        self.by_annex.update(other.by_annex)
+        self.by_nas_fab.update(other.by_nas_fab)
+        self.unknown_refs.update(other.unknown_refs)
+        self.unknown_refs_truncated = self.unknown_refs_truncated or other.unknown_refs_truncated
+        self._prune_unknown_refs()
+
+    def summary(self):
+        return {
+            'lines_read': self.lines_read,
+            'lines_with_references': self.lines,
+            'refs': self.refs,
+            'resolved': self.resolved,
+            'unresolved': self.refs - self.resolved,
+            'by_rule': dict(self.by_rule.most_common()),
+            'by_annex': dict(self.by_annex.most_common()),
+            'by_nas_fab': dict(self.by_nas_fab.most_common()),
+            'unknown_refs': dict(self.unknown_refs.most_common(MAX_UNKNOWN_REFS)),
+            'unknown_refs_truncated': self.unknown_refs_truncated or len(self.unknown_refs) > MAX_UNKNOWN_REFS,
+        }
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description='Décode en flux des journaux de rejets IFPS/eurofpl avec le RAD',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python rad_decode_log.py rad-data-current.json rejects.log
+  python rad_decode_log.py rad-data-current.json rejects-*.log -o decoded.jsonl --summary summary.json
+  zcat rejects.log.gz | python rad_decode_log.py rad-data-current.json - --workers 4 > decoded.jsonl
+        """
+    )
+
+    parser.add_argument('rad', help='Sortie du parser (rad-data.json, entrées ou colonnes)')
+    parser.add_argument('logs', nargs='*', default=['-'],
+                       help='Journaux à décoder, \'-\' pour l\'entrée standard (default: -)')
+    parser.add_argument('--output', '-o',
+                       help='Fichier JSONL enrichi (default: sortie standard)')
+    parser.add_argument('--summary',
+                       help='Écrire les compteurs par règle, annexe et NAS/FAB dans ce fichier JSON')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Décoder dans N processus (default: 1)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                       help=f'Lignes par lot envoyé aux workers (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                       help=f'REF résolues gardées en cache LRU par processus (default: {DEFAULT_CACHE_SIZE})')
+
+    args = parser.parse_args()
+
+    stats = DecodeStats()
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+
+    try:
+        for text, batch_stats in decode_stream(args.rad, read_lines(args.logs),
+                                               workers=args.workers, batch_size=args.batch_size,
+                                               cache_size=args.cache_size):
+            stats.merge(batch_stats)
+            output.write(text)
+    except FileNotFoundError as e:
+        logger.error(f"❌ {e}")
+        return 1
+    except KeyboardInterrupt:
+        logger.warning("\n⚠️  Décodage interrompu par l'utilisateur")
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    summary = stats.summary()
+    logger.info(
+        f"✅ {summary['lines_read']} lignes, {summary['lines_with_references']} avec référence, "
+        f"{summary['resolved']}/{summary['refs']} REF résolues"
+    )
+    for rule_id, count in stats.by_rule.most_common(TOP_RULES):
+        logger.info(f"  • {rule_id}: {count}")
+    if stats.unknown_refs:
+        shown = min(len(stats.unknown_refs), MAX_UNKNOWN_REFS)
+        more = " (les plus fréquentes)" if summary['unknown_refs_truncated'] else ""
+        logger.warning(f"⚠️  {shown} REF inconnue(s) dans ce RAD{more}")
+
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        logger.info(f"💾 Compteurs: {args.summary}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
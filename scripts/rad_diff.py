@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+RAD Diff - Patch entre deux versions du RAD (entrées ajoutées/supprimées/modifiées)
+
+Usage:
+    python rad_diff.py diff old.(json|xlsx) new.(json|xlsx) -o patch.json
+    python rad_diff.py apply old.json patch.json -o new.json
+
+Exemple:
+    python rad_diff.py diff rad-data-current.json ../data/raw/RAD_2511_v1_19.xlsx -o rad-patch.json
+
+Les entrées sont appariées par annexe et par `id` via des tables de hachage,
+en temps linéaire. Un même ID pouvant apparaître plusieurs fois dans une
+annexe, la clé d'une entrée est [id, n] où n est son rang parmi les entrées
+de même ID. Les sections dérivées (areas, aerodromes...) sont reprises
+entières quand elles ont changé. Appliquer le patch à l'ancienne version
+redonne exactement la nouvelle (mêmes entrées, même ordre, mêmes sections).
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import sys
+from pathlib import Path
+
+from rad_columnar import load_rad_json, sections
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+PATCH_FORMAT = 'rad-patch'
+PATCH_VERSION = 1
+
+
+class PatchError(ValueError):
+    """Patch incompatible avec les données auxquelles on l'applique."""
+
+
+def load_rad(path: str):
+    """Charge une sortie du parser (.json) ou parse un fichier RAD (.xlsx)."""
+    path = Path(path)
+
+    if path.suffix.lower() == '.xlsx':
+        # Import local: pandas n'est nécessaire que pour les fichiers Excel
+        from rad_parser import RADParser
+        return RADParser(str(path)).parse()
+
+    # Sortie au format entrées ou colonnes (--format columnar)
+    return load_rad_json(str(path))
+
+
+def annexes_digest(annexes: dict):
+    """Hash du contenu des annexes (vérifie que le patch s'applique à la bonne base)."""
+    payload = json.dumps(annexes, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _keyed(records: list):
+    """Clés [id, n] dans l'ordre des entrées (n = rang parmi les entrées de même ID)."""
+    seen = {}
+    keys = []
+    for record in records:
+        record_id = record.get('id', '')
+        n = seen.get(record_id, 0)
+        seen[record_id] = n + 1
+        keys.append((record_id, n))
+    return keys
+
+
+def diff_annex(old_records: list, new_records: list):
+    """Calcule le patch d'une annexe (None si aucune différence)."""
+    old_keys = _keyed(old_records)
+    new_keys = _keyed(new_records)
+
+    old_by_key = dict(zip(old_keys, old_records))
+    new_by_key = dict(zip(new_keys, new_records))
+
+    removed = [list(key) for key in old_keys if key not in new_by_key]
+
+    added = []
+    modified = []
+    for index, (key, record) in enumerate(zip(new_keys, new_records)):
+        previous = old_by_key.get(key)
+
+        if previous is None:
+            added.append({'index': index, 'record': record})
+        elif previous != record:
+            modified.append(_record_change(key, previous, record))
+
+    # Ordre relatif des entrées conservées: s'il a changé, le patch
+    # transporte l'ordre complet des clés
+    kept_old = [key for key in old_keys if key in new_by_key]
+    kept_new = [key for key in new_keys if key in old_by_key]
+    reordered = kept_old != kept_new
+
+    if not (removed or added or modified or reordered):
+        return None
+
+    annex_patch = {'removed': removed, 'added': added, 'modified': modified}
+    if reordered:
+        annex_patch['order'] = [list(key) for key in new_keys]
+
+    return annex_patch
+
+
+def _record_change(key: tuple, previous: dict, record: dict):
+    """Modification d'une entrée: champs changés, ou entrée complète si la structure diffère."""
+    if list(previous) != list(record):
+        return {'key': list(key), 'record': record}
+
+    changed = {
+        field: value for field, value in record.items()
+        if previous[field] != value
+    }
+    return {'key': list(key), 'set': changed}
+
+
+def diff_data(old: dict, new: dict):
+    """Patch complet entre deux sorties du parser."""
+    old_annexes = old.get('annexes', {})
+    new_annexes = new.get('annexes', {})
+
+    annexes = {}
+    for json_key in list(old_annexes) + [k for k in new_annexes if k not in old_annexes]:
+        annex_patch = diff_annex(old_annexes.get(json_key, []), new_annexes.get(json_key, []))
+        if annex_patch is not None:
+            annexes[json_key] = annex_patch
+
+    # Sections dérivées: remplacées entières si elles diffèrent (absentes
+    # du patch: reprises de l'ancienne version)
+    old_sections = sections(old)
+    new_sections = sections(new)
+    changed_sections = {
+        name: value for name, value in new_sections.items()
+        if old_sections.get(name) != value
+    }
+
+    return {
+        'format': PATCH_FORMAT,
+        'version': PATCH_VERSION,
+        'base': {
+            'cycle': old.get('metadata', {}).get('cycle'),
+            'version': old.get('metadata', {}).get('version'),
+            'sha256': annexes_digest(old_annexes),
+        },
+        'target': {
+            'cycle': new.get('metadata', {}).get('cycle'),
+            'version': new.get('metadata', {}).get('version'),
+            'sha256': annexes_digest(new_annexes),
+        },
+        # Ordre des annexes de la nouvelle version
+        'annex_order': list(new_annexes),
+        'annexes': annexes,
+        'metadata': new.get('metadata', {}),
+        'stats': new.get('stats', {}),
+        # Ordre des sections de la nouvelle version, et celles qui ont changé
+        'section_order': list(new_sections),
+        'sections': changed_sections,
+    }
+
+
+def apply_annex(old_records: list, annex_patch: dict):
+    """Applique le patch d'une annexe et retourne la nouvelle liste d'entrées."""
+    by_key = dict(zip(_keyed(old_records), old_records))
+
+    for key in annex_patch['removed']:
+        if by_key.pop(tuple(key), None) is None:
+            raise PatchError(f"Entrée à supprimer absente: {key}")
+
+    for change in annex_patch['modified']:
+        key = tuple(change['key'])
+        if key not in by_key:
+            raise PatchError(f"Entrée à modifier absente: {key}")
+
+        if 'record' in change:
+            by_key[key] = change['record']
+        else:
+            by_key[key] = {**by_key[key], **change['set']}
+
+    added_by_index = {item['index']: item['record'] for item in annex_patch['added']}
+
+    if 'order' in annex_patch:
+        return [
+            added_by_index[index] if index in added_by_index else by_key[tuple(key)]
+            for index, key in enumerate(annex_patch['order'])
+        ]
+
+    # Entrées conservées dans leur ordre d'origine, ajouts insérés à leur index final
+    kept = iter(by_key.values())
+    return [
+        added_by_index[index] if index in added_by_index else next(kept)
+        for index in range(len(by_key) + len(added_by_index))
+    ]
+
+
+def apply_patch(old: dict, patch: dict, verify: bool = True):
+    """Applique un patch produit par diff_data() et retourne la nouvelle version."""
+    if patch.get('format') != PATCH_FORMAT or patch.get('version') != PATCH_VERSION:
+        raise PatchError("Format de patch non reconnu")
+
+    old_annexes = old.get('annexes', {})
+    if verify and annexes_digest(old_annexes) != patch['base']['sha256']:
+        raise PatchError(
+            f"Le patch s'applique au cycle {patch['base']['cycle']} "
+            f"v{patch['base']['version']}, pas à ces données"
+        )
+
+    annexes = {}
+    for json_key in patch['annex_order']:
+        records = old_annexes.get(json_key, [])
+        annex_patch = patch['annexes'].get(json_key)
+        annexes[json_key] = apply_annex(records, annex_patch) if annex_patch else records
+
+    new = {
+        'metadata': patch['metadata'],
+        'annexes': annexes,
+        'stats': patch['stats'],
+    }
+
+    # Patchs sans sections (antérieurs à leur prise en charge): aucune section
+    changed_sections = patch.get('sections', {})
+    for name in patch.get('section_order', []):
+        if name in changed_sections:
+            new[name] = changed_sections[name]
+        elif name in old:
+            new[name] = old[name]
+        else:
+            raise PatchError(f"Section absente de la version de base: {name}")
+
+    if verify and annexes_digest(annexes) != patch['target']['sha256']:
+        raise PatchError("Le résultat ne correspond pas à la version cible")
+
+    return new
+
+
+def summarize(patch: dict):
+    """Compte des ajouts/suppressions/modifications par annexe."""
+    return {
+        json_key: {
+            'added': len(annex_patch['added']),
+            'removed': len(annex_patch['removed']),
+            'modified': len(annex_patch['modified']),
+        }
+        for json_key, annex_patch in patch['annexes'].items()
+    }
+
+
+def save_json(data: dict, output_path: str, indent: int = None):
+    """Écrit un JSON (compact par défaut) et retourne sa taille en KB."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        if indent:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+        else:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+    return output_path.stat().st_size / 1024
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description='Diff/patch entre deux versions du RAD',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python rad_diff.py diff rad-data-current.json rad-data-new.json -o rad-patch.json
+  python rad_diff.py diff RAD_2511_v1_17.xlsx RAD_2511_v1_19.xlsx -o rad-patch.json
+  python rad_diff.py apply rad-data-current.json rad-patch.json -o rad-data-new.json
+        """
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    diff_parser = subparsers.add_parser('diff', help='Calcule le patch old → new')
+    diff_parser.add_argument('old', help='Ancienne version (.json parsé ou .xlsx)')
+    diff_parser.add_argument('new', help='Nouvelle version (.json parsé ou .xlsx)')
+    diff_parser.add_argument('--output', '-o', required=True, help='Fichier patch JSON')
+
+    apply_parser = subparsers.add_parser('apply', help='Applique un patch')
+    apply_parser.add_argument('old', help='Version de base (.json parsé)')
+    apply_parser.add_argument('patch', help='Fichier patch JSON')
+    apply_parser.add_argument('--output', '-o', required=True, help='Nouvelle version JSON')
+    apply_parser.add_argument('--indent', type=int, default=2,
+                              help='JSON indent (default: 2, use 0 for minified)')
+
+    parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
+    try:
+        if args.command == 'diff':
+            old = load_rad(args.old)
+            new = load_rad(args.new)
+
+            patch = diff_data(old, new)
+            size = save_json(patch, args.output)
+
+            for json_key, counts in summarize(patch).items():
+                logger.info(f"  • {json_key}: +{counts['added']} -{counts['removed']} ~{counts['modified']}")
+            for name in patch['sections']:
+                logger.info(f"  • section {name}: remplacée")
+            logger.info(f"✅ Patch {patch['base']['cycle']} v{patch['base']['version']} → "
+                        f"{patch['target']['cycle']} v{patch['target']['version']}: {size:.1f} KB")
+        else:
+            with open(args.patch, 'r', encoding='utf-8') as f:
+                patch = json.load(f)
+
+            new = apply_patch(load_rad(args.old), patch)
+            size = save_json(new, args.output, indent=args.indent)
+            logger.info(f"✅ Patch appliqué: {args.output} ({size:.1f} KB)")
+
+        return 0
+
+    except FileNotFoundError as e:
+        logger.error(f"❌ {e}")
+        return 1
+    except PatchError as e:
+        logger.error(f"❌ Patch invalide: {e}")
+        return 1
+    except Exception as e:
+        logger.error(f"❌ Erreur inattendue: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,11 +8,28 @@ Usage:
 Ce script:
     1. Parse la page RAD d'EUROCONTROL
     2. Extrait les liens des RAD current et future (AIRAC+1)
-    3. Télécharge les fichiers Excel
-    4. Extrait et sauvegarde les métadonnées (cycle, version, dates)
+    3. Télécharge les fichiers Excel en parallèle (uniquement s'ils ont changé)
+    4. Extrait et sauvegarde les métadonnées (cycle, version, dates, checksums)
+
+Les téléchargements passent par un fichier .part: une coupure est reprise
+(requête Range) avec des tentatives espacées exponentiellement, et le
+fichier n'est renommé à sa place définitive qu'après vérification de sa
+taille (Content-Length) et de son intégrité ZIP (un .xlsx est un ZIP).
+
+Les requêtes sont conditionnelles: l'ETag / Last-Modified et le SHA-256 de
+chaque fichier sont conservés dans rad_downloads_metadata.json. Un fichier
+déjà présent avec le bon checksum n'est pas retransféré, et la clé
+"transferred" des métadonnées liste les RAD réellement téléchargés (vide:
+rien n'a changé, le parsing peut être sauté).
 """
 
+import hashlib
+import io
+import os
+import time
+import zipfile
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import re
 import json
@@ -22,6 +39,8 @@ from datetime import datetime
 from urllib.parse import urljoin
 import argparse
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration du logging
 logging.basicConfig(
@@ -31,27 +50,102 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+METADATA_FILENAME = "rad_downloads_metadata.json"
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MB
+# Lectures réseau: petites, pour qu'une coupure perde au plus un bloc de cette taille
+NETWORK_READ_SIZE = 64 * 1024
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 2.0  # secondes, doublé à chaque tentative
+
+
+class DownloadError(Exception):
+    """Fichier téléchargé invalide (taille, ZIP corrompu, reprise impossible)."""
+
+
+class IncompleteDownload(DownloadError):
+    """Transfert interrompu: le .part est conservé et la tentative suivante le reprend."""
+
+
+class FileLogger(logging.LoggerAdapter):
+    """Préfixe chaque message par le type de RAD (logs entremêlés en parallèle)."""
+
+    def process(self, msg, kwargs):
+        return f"[{self.extra['rad_type'].upper()}] {msg}", kwargs
+
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024):
+    """SHA-256 (hex) d'un fichier, lu par blocs."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def conditional_headers(validators: dict):
+    """En-têtes If-None-Match / If-Modified-Since à partir d'ETag / Last-Modified."""
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
 
 class RADDownloader:
     """Télécharge automatiquement les fichiers RAD depuis EUROCONTROL."""
 
     BASE_URL = "https://www.nm.eurocontrol.int/RAD/"
 
-    def __init__(self, output_dir: str = "../data/raw"):
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(self, output_dir: str = "../data/raw", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 retries: int = DEFAULT_RETRIES, backoff: float = DEFAULT_BACKOFF,
+                 workers: int = None):
+        # output_dir None: téléchargements en mémoire uniquement (fetch_to_memory
+        # sans keep_file); download_all() lève alors ValueError
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        if self.output_dir is not None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Nombre de téléchargements simultanés (None: un par fichier trouvé)
+        self.workers = workers
+
+        # Session partagée par les threads: un pool de connexions par hôte,
+        # assez grand pour tous les téléchargements simultanés
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max(10, workers or 0))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
 
+        # Taille des blocs écrits sur disque, nombre de nouvelles tentatives
+        # et délai initial entre deux tentatives
+        self.chunk_size = chunk_size
+        self.retries = max(0, retries)
+        self.backoff = backoff
+
         self.rad_files = {
             'current': None,
             'future': None
         }
 
+        # Métadonnées du run précédent (validateurs HTTP, checksums)
+        self.metadata_path = self.output_dir / METADATA_FILENAME if self.output_dir else None
+        self.previous = self._load_metadata()
+
+        # Validateurs de la page RAD et liens qu'elle contenait
+        self.page = {}
+
+        # Types de RAD réellement transférés pendant ce run
+        self.transferred = []
+        self._lock = threading.Lock()
+
     def download_all(self):
-        """Télécharge les RAD current et future."""
+        """Télécharge en parallèle tous les RAD trouvés (current, future...)."""
+        if self.output_dir is None:
+            raise ValueError("download_all() nécessite un output_dir (None: fetch_to_memory uniquement)")
+
         logger.info("🔄 Démarrage du téléchargement des RAD...")
         logger.info(f"📁 Destination: {self.output_dir.absolute()}")
         logger.info("")
@@ -64,31 +158,90 @@ class RADDownloader:
             logger.error("❌ Aucun fichier RAD trouvé sur la page")
             return False
 
-        # 2. Télécharger les fichiers
-        for rad_type, rad_info in rad_links.items():
-            logger.info("")
-            logger.info(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-            logger.info(f"📥 Téléchargement RAD {rad_type.upper()}")
-            logger.info(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        # 2. Télécharger les fichiers (ignorés s'ils n'ont pas changé)
+        logger.info("")
+        logger.info(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        logger.info(f"📥 Téléchargement RAD {', '.join(t.upper() for t in rad_links)}")
+        logger.info(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
 
-            success = self._download_rad(rad_type, rad_info)
+        results = self._download_concurrently(rad_links)
 
+        for rad_type, success in results.items():
             if not success:
                 logger.warning(f"⚠️  Échec du téléchargement pour {rad_type}")
 
+        # Ordre de la page, quel que soit l'ordre de fin des threads
+        self.transferred.sort(key=list(rad_links).index)
+
         # 3. Sauvegarder les métadonnées
         logger.info("")
         logger.info("📝 Sauvegarde des métadonnées...")
         self._save_metadata()
 
         logger.info("")
-        logger.info("✅ Téléchargement terminé avec succès!")
+        if self.transferred:
+            logger.info(f"✅ Téléchargement terminé: {', '.join(self.transferred)} transféré(s)")
+        else:
+            logger.info("✅ Aucun fichier modifié, rien à transférer")
         return True
 
+    def _download_concurrently(self, rad_links: dict):
+        """Un thread par fichier: {rad_type: succès}.
+
+        Chaque téléchargement gère ses propres erreurs et tentatives; un
+        échec n'interrompt pas les autres.
+        """
+        workers = self.workers or len(rad_links)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='rad-download') as pool:
+            futures = {
+                rad_type: pool.submit(self._download_rad, rad_type, rad_info)
+                for rad_type, rad_info in rad_links.items()
+            }
+
+            results = {}
+            for rad_type, future in futures.items():
+                try:
+                    results[rad_type] = future.result()
+                except Exception as e:
+                    logger.error(f"[{rad_type.upper()}] ❌ Erreur inattendue: {e}")
+                    results[rad_type] = False
+
+        return results
+
+    def _load_metadata(self):
+        """Charge les métadonnées du run précédent ({} si absentes ou illisibles)."""
+        if self.metadata_path is None:
+            return {}
+
+        try:
+            with open(self.metadata_path, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return metadata if isinstance(metadata, dict) else {}
+
+    def _previous_file(self, filename: str):
+        """Entrée du run précédent pour ce nom de fichier (un RAD future devient current)."""
+        for info in (self.previous.get('files') or {}).values():
+            if info and Path(info.get('path', '')).name == filename:
+                return info
+        return None
+
     def _parse_rad_page(self):
         """Parse la page RAD pour extraire les liens de téléchargement."""
         try:
-            response = self.session.get(self.BASE_URL, timeout=30)
+            previous_page = self.previous.get('page') or {}
+            headers = conditional_headers(previous_page) if previous_page.get('links') else {}
+
+            response = self.session.get(self.BASE_URL, timeout=30, headers=headers)
+
+            if response.status_code == 304:
+                logger.info("  ♻️  Page inchangée (304), liens du run précédent réutilisés")
+                self.page = previous_page
+                return previous_page['links']
+
             response.raise_for_status()
 
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -97,6 +250,8 @@ class RADDownloader:
             # Rechercher les liens RAD_*.xlsx
             # Pattern: RAD_YYMM_vX_YY.xlsx
             pattern = re.compile(r'RAD_(\d{4})_v(\d+)_(\d+)\.xlsx')
+            # Éditions suivantes: AIRAC+1 (future), AIRAC+2 (future2)...
+            next_airac = re.compile(r'AIRAC(?:\+|%2B)(\d+)', re.IGNORECASE)
 
             for link in soup.find_all('a', href=True):
                 href = link['href']
@@ -107,10 +262,13 @@ class RADDownloader:
                     version = f"{version_major}.{version_minor}"
 
                     # Déterminer si c'est current ou future selon le path
+                    next_match = next_airac.search(href)
                     if 'CURRENT_AIRAC' in href:
                         rad_type = 'current'
-                    elif 'AIRAC+1' in href or 'AIRAC%2B1' in href:
+                    elif next_match and next_match.group(1) == '1':
                         rad_type = 'future'
+                    elif next_match:
+                        rad_type = f"future{next_match.group(1)}"
                     else:
                         continue
 
@@ -130,6 +288,12 @@ class RADDownloader:
 
                     logger.info(f"  ✅ Trouvé {rad_type.upper()}: Cycle {cycle} v{version}")
 
+            self.page = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'links': rad_links
+            }
+
             return rad_links
 
         except requests.RequestException as e:
@@ -165,68 +329,320 @@ class RADDownloader:
             return None
 
     def _download_rad(self, rad_type: str, rad_info: dict):
-        """Télécharge un fichier RAD."""
-        try:
-            url = rad_info['url']
-            filename = rad_info['filename']
-            output_path = self.output_dir / filename
-
-            logger.info(f"  📍 URL: {url}")
-            logger.info(f"  💾 Fichier: {filename}")
-
-            # Télécharger le fichier
-            response = self.session.get(url, timeout=60, stream=True)
-            response.raise_for_status()
-
-            # Sauvegarder avec barre de progression
-            total_size = int(response.headers.get('content-length', 0))
-
-            with open(output_path, 'wb') as f:
-                if total_size == 0:
-                    f.write(response.content)
-                else:
-                    downloaded = 0
-                    chunk_size = 8192
+        """Télécharge un fichier RAD (sauf s'il est déjà présent et inchangé)."""
+        log = FileLogger(logger, {'rad_type': rad_type})
+        url = rad_info['url']
+        filename = rad_info['filename']
+        output_path = self.output_dir / filename
+
+        log.info(f"  📍 URL: {url}")
+        log.info(f"  💾 Fichier: {filename}")
+
+        # Copie locale vérifiée: même nom (donc même cycle/version) et même checksum
+        previous = self._previous_file(filename)
+        verified = (
+            previous is not None and bool(previous.get('sha256'))
+            and output_path.exists() and file_sha256(output_path) == previous['sha256']
+        )
+
+        if previous is not None and output_path.exists() and not verified:
+            log.warning("  ⚠️  Checksum local différent, nouveau téléchargement")
+
+        headers = {}
+        if verified:
+            headers = conditional_headers(previous)
+            if not headers:
+                # Pas de validateur HTTP: le checksum suffit, aucune requête
+                log.info("  ♻️  Déjà présent (checksum identique), téléchargement ignoré")
+                self._record_file(rad_type, rad_info, output_path, previous, transferred=False)
+                return True
 
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded += len(chunk)
+        try:
+            # Requête conditionnelle: 304 si le fichier n'a pas changé côté serveur
+            response_headers, _ = self._fetch(url, output_path, headers, log)
 
-                            # Afficher la progression
-                            progress = (downloaded / total_size) * 100
-                            if downloaded % (chunk_size * 10) == 0:
-                                logger.info(f"    ⏳ {progress:.1f}% ({downloaded / 1024 / 1024:.1f} MB / {total_size / 1024 / 1024:.1f} MB)")
+            if response_headers is None:
+                log.info("  ♻️  Non modifié (304), téléchargement ignoré")
+                self._record_file(rad_type, rad_info, output_path, previous, transferred=False)
+                return True
 
             file_size = output_path.stat().st_size / 1024 / 1024  # MB
-            logger.info(f"  ✅ Téléchargé: {file_size:.1f} MB")
+            log.info(f"  ✅ Téléchargé: {file_size:.1f} MB")
+
+            # Serveur qui ignore les en-têtes conditionnels (200): un contenu
+            # identique à la copie locale vérifiée ne compte pas comme transféré
+            sha256 = file_sha256(output_path)
+            changed = not verified or sha256 != previous['sha256']
+            if not changed:
+                log.info("  ♻️  Contenu identique (checksum), fichier considéré inchangé")
 
             # Sauvegarder les infos pour les métadonnées
-            self.rad_files[rad_type] = {
-                'path': str(output_path),
-                'cycle': rad_info['cycle'],
-                'version': rad_info['version'],
-                'effective_date': rad_info['effective_date'],
-                'downloaded_at': datetime.now().isoformat(),
-                'size_mb': round(file_size, 2)
-            }
+            self._record_file(rad_type, rad_info, output_path, {
+                'downloaded_at': datetime.now().isoformat() if changed else previous.get('downloaded_at'),
+                'sha256': sha256,
+                'etag': response_headers.get('ETag'),
+                'last_modified': response_headers.get('Last-Modified'),
+            }, transferred=changed)
 
             return True
 
-        except requests.RequestException as e:
-            logger.error(f"  ❌ Erreur de téléchargement: {e}")
+        except (requests.RequestException, DownloadError) as e:
+            if verified:
+                # La copie locale est intègre: on la garde
+                log.warning(f"  ⚠️  Vérification impossible ({e}), copie locale conservée")
+                self._record_file(rad_type, rad_info, output_path, previous, transferred=False)
+                return True
+
+            log.error(f"  ❌ Erreur de téléchargement: {e}")
             return False
         except Exception as e:
-            logger.error(f"  ❌ Erreur inattendue: {e}")
+            log.error(f"  ❌ Erreur inattendue: {e}")
             return False
 
+    def fetch_to_memory(self, rad_type: str, rad_info: dict, keep_file: bool = False):
+        """Télécharge un RAD en mémoire, sans passer par le disque.
+
+        keep_file: écrit aussi une copie dans output_dir (et l'enregistre
+        pour les métadonnées), comme download_all().
+
+        Returns:
+            BytesIO du fichier, ou None en cas d'échec
+        """
+        if keep_file and self.output_dir is None:
+            raise ValueError("keep_file nécessite un output_dir")
+
+        log = FileLogger(logger, {'rad_type': rad_type})
+        log.info(f"  📍 URL: {rad_info['url']}")
+
+        try:
+            response_headers, buffer = self._fetch(rad_info['url'], log=log)
+        except (requests.RequestException, DownloadError) as e:
+            log.error(f"  ❌ Erreur de téléchargement: {e}")
+            return None
+
+        content = buffer.getbuffer()
+        log.info(f"  ✅ Reçu en mémoire: {len(content) / 1024 / 1024:.1f} MB")
+
+        if keep_file:
+            output_path = self.output_dir / rad_info['filename']
+            part_path = output_path.with_name(output_path.name + '.part')
+            part_path.write_bytes(content)
+            os.replace(part_path, output_path)
+
+            self._record_file(rad_type, rad_info, output_path, {
+                'downloaded_at': datetime.now().isoformat(),
+                'sha256': hashlib.sha256(content).hexdigest(),
+                'etag': response_headers.get('ETag'),
+                'last_modified': response_headers.get('Last-Modified'),
+            }, transferred=True)
+            log.info(f"  💾 Copie écrite: {output_path}")
+
+        del content  # libère la vue sur le buffer
+        return buffer
+
+    def _fetch(self, url: str, output_path: Path = None, headers: dict = None, log=logger):
+        """Télécharge `url`, avec reprise et tentatives.
+
+        Sur disque via un .part renommé en `output_path` une fois vérifié, ou
+        en mémoire si `output_path` est None.
+
+        Returns:
+            (en-têtes de la réponse, BytesIO du contenu en mémoire ou None),
+            ou (None, None) si le serveur a répondu 304
+        """
+        part_path = output_path.with_name(output_path.name + '.part') if output_path else None
+        buffer = io.BytesIO() if part_path is None else None
+        state = {}
+        last_error = None
+
+        try:
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    delay = self.backoff * 2 ** (attempt - 1)
+                    log.info(f"    🔁 Tentative {attempt + 1}/{self.retries + 1} dans {delay:.1f}s")
+                    time.sleep(delay)
+
+                try:
+                    if buffer is not None:
+                        response_headers = self._fetch_part(url, buffer, headers, state, log)
+                        if response_headers is None:
+                            return None, None
+
+                        self._verify_part(buffer, state.get('expected_size'))
+                        buffer.seek(0)
+                        return response_headers, buffer
+
+                    with open(part_path, 'ab+') as part:
+                        response_headers = self._fetch_part(url, part, headers, state, log)
+                        if response_headers is not None:
+                            self._verify_part(part, state.get('expected_size'))
+
+                    if response_headers is None:
+                        return None, None
+
+                    # Remplacement atomique: l'ancienne copie reste intacte jusqu'ici
+                    os.replace(part_path, output_path)
+                    return response_headers, None
+
+                except requests.HTTPError as e:
+                    status = e.response.status_code if e.response is not None else None
+                    if status is not None and status < 500 and status != 429:
+                        raise
+                    last_error = e
+                except (requests.RequestException, DownloadError) as e:
+                    last_error = e
+
+                log.warning(f"    ⚠️  {last_error}")
+
+            # Un .part non vide est conservé: le prochain run le reprendra
+            raise last_error
+
+        finally:
+            if part_path is not None and part_path.exists() and part_path.stat().st_size == 0:
+                part_path.unlink()
+
+    def _fetch_part(self, url: str, part, headers: dict, state: dict, log=logger):
+        """Une requête: complète `part` (Range) ou le réécrit entièrement.
+
+        `part` est un fichier binaire ouvert en ajout/lecture ou un BytesIO;
+        son contenu déjà reçu est conservé d'une tentative à l'autre.
+        """
+        offset = part.seek(0, os.SEEK_END)
+
+        request_headers = dict(headers or {})
+        if offset:
+            # Reprise: If-Range garantit qu'on complète bien la même version du
+            # fichier (sinon le serveur renvoie tout en 200). Pour un .part
+            # d'un run précédent, le nom du fichier fixe déjà cycle et version,
+            # et la vérification finale écarte un résultat incohérent.
+            request_headers = {'Range': f'bytes={offset}-'}
+            if state.get('validator'):
+                request_headers['If-Range'] = state['validator']
+
+        with self.session.get(url, timeout=60, stream=True, headers=request_headers) as response:
+            if response.status_code == 304:
+                return None
+
+            if response.status_code == 416:
+                # Le .part ne correspond plus au fichier distant
+                self._discard(part)
+                raise DownloadError("Reprise refusée (416), téléchargement repris depuis le début")
+
+            response.raise_for_status()
+
+            state['validator'] = response.headers.get('ETag') or response.headers.get('Last-Modified')
+            length = int(response.headers.get('content-length', 0)) or None
+
+            if response.status_code == 206:
+                start, total = self._parse_content_range(response.headers.get('Content-Range', ''))
+                if start != offset:
+                    self._discard(part)
+                    raise DownloadError(f"Plage inattendue (début {start}, attendu {offset})")
+                log.info(f"    ⏯️  Reprise à {offset / 1024 / 1024:.1f} MB")
+            else:
+                self._discard(part)
+                offset, total = 0, length
+
+            state['expected_size'] = total
+            downloaded = offset
+            reported = downloaded * 10 // total if total else 0
+
+            # Lu par blocs de 64 KB, écrit par blocs de chunk_size: en cas de
+            # coupure, tout ce qui a été reçu est écrit avant de propager l'erreur
+            pending = bytearray()
+            try:
+                for chunk in response.iter_content(chunk_size=NETWORK_READ_SIZE):
+                    if not chunk:
+                        continue
+                    pending += chunk
+                    downloaded += len(chunk)
+                    if len(pending) >= self.chunk_size:
+                        part.write(pending)
+                        pending.clear()
+
+                    # Afficher la progression (par paliers de 10%)
+                    if total and downloaded * 10 // total > reported:
+                        reported = downloaded * 10 // total
+                        progress = (downloaded / total) * 100
+                        log.info(f"    ⏳ {progress:.1f}% ({downloaded / 1024 / 1024:.1f} MB / {total / 1024 / 1024:.1f} MB)")
+            finally:
+                if pending:
+                    part.write(pending)
+
+            return response.headers
+
+    @staticmethod
+    def _discard(part):
+        """Vide le contenu partiel (le prochain essai repart de zéro)."""
+        part.seek(0)
+        part.truncate()
+
+    @staticmethod
+    def _parse_content_range(content_range: str):
+        """'bytes 100-999/1000' → (100, 1000); total None si inconnu ('*')."""
+        match = re.match(r'bytes (\d+)-\d+/(\d+|\*)', content_range)
+        if not match:
+            raise DownloadError(f"Content-Range invalide: {content_range!r}")
+        start, total = match.groups()
+        return int(start), (int(total) if total != '*' else None)
+
+    def _verify_part(self, part, expected_size: int = None):
+        """Vérifie la taille annoncée et l'intégrité ZIP du contenu reçu."""
+        part.flush()
+        size = part.seek(0, os.SEEK_END)
+
+        if expected_size is not None and size < expected_size:
+            raise IncompleteDownload(f"Transfert incomplet ({size}/{expected_size} octets)")
+
+        if expected_size is not None and size != expected_size:
+            self._discard(part)
+            raise DownloadError(f"Taille inattendue ({size} octets, {expected_size} annoncés)")
+
+        try:
+            part.seek(0)
+            with zipfile.ZipFile(part) as archive:
+                corrupted = archive.testzip()
+        except zipfile.BadZipFile as e:
+            corrupted = str(e)
+
+        if corrupted is not None:
+            self._discard(part)
+            raise DownloadError(f"Fichier ZIP corrompu ({corrupted})")
+
+    def _record_file(self, rad_type: str, rad_info: dict, output_path: Path,
+                     download: dict, transferred: bool):
+        """Enregistre un RAD pour les métadonnées (download: date, checksum, validateurs)."""
+        size = output_path.stat().st_size
+
+        entry = {
+            'path': str(output_path),
+            'cycle': rad_info['cycle'],
+            'version': rad_info['version'],
+            'effective_date': rad_info['effective_date'],
+            'downloaded_at': download.get('downloaded_at'),
+            'size_mb': round(size / 1024 / 1024, 2),
+            'size': size,
+            'sha256': download.get('sha256'),
+            'etag': download.get('etag'),
+            'last_modified': download.get('last_modified'),
+            'url': rad_info['url'],
+            'transferred': transferred
+        }
+
+        with self._lock:
+            self.rad_files[rad_type] = entry
+            if transferred:
+                self.transferred.append(rad_type)
+
     def _save_metadata(self):
         """Sauvegarde les métadonnées des RAD téléchargés."""
-        metadata_path = self.output_dir / "rad_downloads_metadata.json"
+        metadata_path = self.metadata_path
 
         metadata = {
             'last_update': datetime.now().isoformat(),
-            'files': self.rad_files
+            'files': self.rad_files,
+            'transferred': self.transferred,
+            'page': self.page
         }
 
         with open(metadata_path, 'w', encoding='utf-8') as f:
@@ -239,7 +655,8 @@ class RADDownloader:
         logger.info("📊 Résumé des téléchargements:")
         for rad_type, info in self.rad_files.items():
             if info:
-                logger.info(f"  • {rad_type.upper()}: Cycle {info['cycle']} v{info['version']} ({info['size_mb']} MB)")
+                status = "transféré" if info['transferred'] else "inchangé"
+                logger.info(f"  • {rad_type.upper()}: Cycle {info['cycle']} v{info['version']} ({info['size_mb']} MB, {status})")
 
 
 def main():
@@ -258,6 +675,17 @@ Exemples:
     parser.add_argument('--output-dir', '-o',
                        default='../data/raw',
                        help='Répertoire de destination (default: ../data/raw)')
+    parser.add_argument('--chunk-size', type=int,
+                       default=DEFAULT_CHUNK_SIZE // 1024,
+                       help=f'Taille des blocs écrits sur disque en KB (default: {DEFAULT_CHUNK_SIZE // 1024})')
+    parser.add_argument('--retries', type=int,
+                       default=DEFAULT_RETRIES,
+                       help=f'Nouvelles tentatives après une coupure (default: {DEFAULT_RETRIES})')
+    parser.add_argument('--backoff', type=float,
+                       default=DEFAULT_BACKOFF,
+                       help=f'Délai avant la 1re nouvelle tentative, doublé ensuite (default: {DEFAULT_BACKOFF}s)')
+    parser.add_argument('--workers', type=int,
+                       help='Téléchargements simultanés (default: un par fichier trouvé)')
     parser.add_argument('--verbose', '-v',
                        action='store_true',
                        help='Affichage détaillé')
@@ -268,7 +696,13 @@ Exemples:
         logger.setLevel(logging.DEBUG)
 
     try:
-        downloader = RADDownloader(args.output_dir)
+        downloader = RADDownloader(
+            args.output_dir,
+            chunk_size=args.chunk_size * 1024,
+            retries=args.retries,
+            backoff=args.backoff,
+            workers=args.workers
+        )
         success = downloader.download_all()
 
         return 0 if success else 1
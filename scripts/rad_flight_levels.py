@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+RAD Flight Levels - Bornes de niveaux de vol et index par espace aérien
+
+Usage:
+    python rad_flight_levels.py rad-data.json --airspace LFPG --fl 345
+    python rad_flight_levels.py rad-data.json --airspace LFPG --fl 245 --to-fl 335 --annex 2A
+
+Les contraintes de niveau (capping Annex 2A, "ABV FL" / "BLW FL" des règles
+Annex 2B...) ne sont que du texte dans `utilization`. Elles sont extraites
+en bandes de niveaux, bornes entières incluses, None = non bornée:
+
+    "ABV FL245"                   → [[246, None]]
+    "AT OR ABV FL245"             → [[245, None]]
+    "BLW FL305", "FL305 AND BLW"  → [[None, 304]], [[None, 305]]
+    "BTN FL245 AND FL335"         → [[245, 335]]
+    "ABV FL195 BLW FL285"         → [[196, 284]]
+    "BLW FL200 ... ABV FL300"     → [[None, 199], [301, None]]
+    "MAX FL 245", "CAPPING FL245" → [[None, 245]]
+
+Avec `rad_parser.py --derived-fields flight_levels`, chaque entrée ayant un
+champ utilization reçoit ces bandes dans `flight_levels` (liste vide sans
+contrainte); sinon FlightLevelIndex les calcule au chargement.
+FlightLevelIndex range les bandes de chaque espace aérien (airspace,
+point_or_airspace, atc_unit) dans un arbre d'intervalles: "règles qui
+s'appliquent au FL345 dans LSASFRA" ou "entre FL245 et FL335" sans
+parcourir les entrées.
+"""
+
+import argparse
+import json
+import logging
+import re
+import sys
+
+from rad_columnar import load_rad_json
+from rad_index import tokenize
+from rad_validity import IntervalTree
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Champs qui désignent l'espace aérien d'une entrée (comme rad_query)
+AIRSPACE_FIELDS = ('airspace', 'point_or_airspace', 'atc_unit')
+
+_FL = r'FL\s*(?P<{}>\d{{2,3}})'
+
+# Contraintes, de la plus spécifique à la plus générale (finditer garde la
+# première alternative qui correspond: "AT OR ABV FL245" n'est pas lu "ABV FL245")
+CONSTRAINT_PATTERN = re.compile('|'.join([
+    r'\b(?:BTN|BETWEEN|FROM)\s+' + _FL.format('range_low') + r'\s+(?:AND|TO)\s+(?:FL\s*)?(?P<range_high>\d{2,3})\b',
+    r'\b' + _FL.format('dash_low') + r'\s*-\s*(?:FL\s*)?(?P<dash_high>\d{2,3})\b',
+    r'\b' + _FL.format('and_above') + r'\s+AND\s+AB(?:V|OVE)\b',
+    r'\b' + _FL.format('and_below') + r'\s+AND\s+B(?:LW|ELOW)\b',
+    r'\b(?:AT\s+OR\s+AB(?:V|OVE)|FROM)\s+' + _FL.format('at_or_above'),
+    r'\b(?:AT\s+OR\s+B(?:LW|ELOW)|UP\s+TO|MAX(?:IMUM)?|CAPP(?:ING|ED)(?:\s+AT)?|CAP)\s*:?\s*'
+    + _FL.format('at_or_below'),
+    r'\bAB(?:V|OVE)\s+' + _FL.format('above'),
+    r'\bB(?:LW|ELOW)\s+' + _FL.format('below'),
+]))
+
+# Groupe → (borne, décalage pour une borne entière incluse)
+LOWER_BOUNDS = {'and_above': 0, 'at_or_above': 0, 'above': 1}
+UPPER_BOUNDS = {'and_below': 0, 'at_or_below': 0, 'below': -1}
+
+
+def _band(lower, upper):
+    """Bandes d'une paire de bornes (bornes croisées: deux bandes disjointes)."""
+    if lower is not None and upper is not None and lower > upper:
+        return [[None, upper], [lower, None]]
+    return [[lower, upper]]
+
+
+def parse_flight_levels(text: str):
+    """Bandes [bas, haut] (FL entiers inclus, None = non bornée) d'un texte utilization."""
+    bands = []
+    lower = upper = None
+
+    for match in CONSTRAINT_PATTERN.finditer((text or '').upper()):
+        group = match.lastgroup
+        if group in ('range_high', 'dash_high'):
+            low, high = sorted(int(value) for value in match.group(match.lastindex - 1, match.lastindex))
+            bands.append([low, high])
+        elif group in LOWER_BOUNDS:
+            # Deuxième borne basse: la bande précédente est complète
+            if lower is not None:
+                bands.extend(_band(lower, upper))
+                upper = None
+            lower = int(match.group(group)) + LOWER_BOUNDS[group]
+        else:
+            if upper is not None:
+                bands.extend(_band(lower, upper))
+                lower = None
+            upper = int(match.group(group)) + UPPER_BOUNDS[group]
+
+    if lower is not None or upper is not None:
+        bands.extend(_band(lower, upper))
+
+    return sorted(bands, key=lambda band: (band[0] is not None, band[0] or 0))
+
+
+def flight_levels_column(utilization: list):
+    """`flight_levels` de toute une feuille; chaque texte distinct est parsé une fois."""
+    parsed = {}
+    column = []
+    for text in utilization:
+        if text not in parsed:
+            parsed[text] = parse_flight_levels(text)
+        # Copie: les entrées ne partagent pas de liste modifiable
+        column.append([list(band) for band in parsed[text]])
+    return column
+
+
+class FlightLevelIndex:
+    """Bandes de niveaux des entrées, par espace aérien (arbre d'intervalles)."""
+
+    def __init__(self, data: dict):
+        self.metadata = data.get('metadata', {})
+        self.records = [
+            record
+            for records in data['annexes'].values() if isinstance(records, list)
+            for record in records
+        ]
+
+        intervals = {}
+        for offset, record in enumerate(self.records):
+            bands = record.get('flight_levels')
+            if bands is None:
+                if 'utilization' not in record:
+                    continue
+                # Sortie sans --derived-fields flight_levels: calculé à la volée
+                bands = parse_flight_levels(record['utilization'])
+            if not bands:
+                continue
+
+            airspaces = dict.fromkeys(
+                token
+                for field in AIRSPACE_FIELDS if record.get(field)
+                for token in tokenize(record[field])
+            )
+            for airspace in airspaces:
+                for low, high in bands:
+                    # Bornes incluses → intervalle [bas, haut + 1)
+                    intervals.setdefault(airspace, []).append((
+                        float('-inf') if low is None else low,
+                        float('inf') if high is None else high + 1,
+                        offset,
+                    ))
+
+        self.trees = {airspace: IntervalTree(items) for airspace, items in intervals.items()}
+
+    @classmethod
+    def load(cls, path: str):
+        """Charge une sortie du parser (format entrées ou colonnes)."""
+        return cls(load_rad_json(path))
+
+    def between(self, airspace: str, low: int, high: int = None, annex: str = None):
+        """Entrées de l'espace aérien contraintes sur au moins un FL de [low, high]."""
+        tree = self.trees.get(airspace.strip().upper())
+        if tree is None:
+            return []
+
+        high = low if high is None else high
+        offsets = sorted(set(tree.overlapping(min(low, high), max(low, high) + 1)))
+        records = [self.records[offset] for offset in offsets]
+        if annex:
+            records = [record for record in records if record.get('annex') == annex]
+        return records
+
+    def at(self, airspace: str, flight_level: int, annex: str = None):
+        """Entrées de l'espace aérien dont une bande contient ce FL."""
+        return self.between(airspace, flight_level, flight_level, annex)
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description='Règles RAD contraignant un niveau de vol dans un espace aérien',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python rad_flight_levels.py rad-data.json --airspace LFPG --fl 345
+  python rad_flight_levels.py rad-data.json --airspace LFPG --fl 245 --to-fl 335 --annex 2A
+        """
+    )
+
+    parser.add_argument('input', help='Sortie du parser (rad-data.json, entrées ou colonnes)')
+    parser.add_argument('--airspace', required=True, help='Espace aérien (ex: LSASFRA, EGTT)')
+    parser.add_argument('--fl', type=int, required=True, help='Niveau de vol (ex: 345)')
+    parser.add_argument('--to-fl', type=int, help='Fin de plage de niveaux (incluse)')
+    parser.add_argument('--annex', help='Limiter à une annexe (ex: 2A, 2B)')
+    parser.add_argument('--json', action='store_true', help='Afficher les entrées en JSON')
+
+    args = parser.parse_args()
+
+    try:
+        index = FlightLevelIndex.load(args.input)
+    except FileNotFoundError as e:
+        logger.error(f"❌ {e}")
+        return 1
+
+    results = index.between(args.airspace, args.fl, args.to_fl, annex=args.annex)
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return 0
+
+    logger.info(f"✅ {len(results)} règle(s) pour {args.airspace.upper()} au FL{args.fl}"
+                + (f"-{args.to_fl}" if args.to_fl else ''))
+    for record in results:
+        bands = record.get('flight_levels') or parse_flight_levels(record.get('utilization'))
+        print(f"{record.get('id', ''):<12} {record.get('annex', ''):<3} {bands}  {record.get('utilization', '')}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+RAD Index - Index inversé précalculé à partir de la sortie du parser
+
+Le frontend (RADSearchEngine) aplatit toutes les annexes en un seul tableau,
+dans l'ordre du JSON, et `searchById` parcourt ce tableau en entier. Cet index,
+construit une fois en CI, associe chaque valeur normalisée des champs
+pondérés par Fuse (ID, points, airways, aérodromes, espaces aériens, NAS/FAB)
+aux positions (offsets) des entrées dans ce tableau aplati:
+
+    {
+      "format": "rad-index",
+      "version": 1,
+      "metadata": {"cycle": "2511", "version": "1.17", "filename": "..."},
+      "total_entries": 15308,
+      "annexes": {"annex1_areas": [0, 730], ...},        # [offset de départ, nombre]
+      "fields": {
+        "id": {"LSLF1139C": [812]},
+        "from_point": {"OMASI": [3, 97, ...]},
+        ...
+      }
+    }
+
+Usage:
+    python rad_parser.py input.xlsx rad-data.json --index rad-index.json
+"""
+
+import json
+import re
+from pathlib import Path
+
+INDEX_FORMAT = 'rad-index'
+INDEX_VERSION = 1
+
+# Champs identifiants pondérés par Fuse dans searchEngine.js (le texte libre
+# - utilization, operational_goal, searchable_text - reste à Fuse)
+INDEXED_FIELDS = (
+    'id',
+    'point_or_airspace',
+    'airspace',
+    'airway',
+    'from_point',
+    'to_point',
+    'aerodrome',
+    'nas_fab',
+)
+
+_ID_NOISE = re.compile(r'[\[\]\s]')
+_TOKEN_SPLIT = re.compile(r'[^A-Z0-9]+')
+
+
+def normalize_id(value: str):
+    """Normalise un ID comme searchByReference (sans crochets ni espaces, majuscules)."""
+    return _ID_NOISE.sub('', value).upper()
+
+
+def tokenize(value: str):
+    """Découpe une valeur en identifiants (ex: 'LSAS, LFFF' → ['LSAS', 'LFFF'])."""
+    tokens = (token for token in _TOKEN_SPLIT.split(value.upper()) if len(token) >= 2)
+    return list(dict.fromkeys(tokens))
+
+
+def index_keys(field: str, value: str):
+    """Clés d'index d'une valeur de champ."""
+    if field == 'id':
+        key = normalize_id(value)
+        return [key] if key else []
+    return tokenize(value)
+
+
+def build_inverted_index(data: dict, fields: tuple = INDEXED_FIELDS):
+    """Construit l'index inversé valeur normalisée → offsets, champ par champ."""
+    index = {field: {} for field in fields}
+    annexes = {}
+    offset = 0
+
+    for json_key, records in data['annexes'].items():
+        if not isinstance(records, list):
+            continue
+
+        annexes[json_key] = [offset, len(records)]
+
+        for record in records:
+            for field in fields:
+                value = record.get(field)
+                if not value:
+                    continue
+                for key in index_keys(field, value):
+                    index[field].setdefault(key, []).append(offset)
+            offset += 1
+
+    metadata = data.get('metadata', {})
+    return {
+        'format': INDEX_FORMAT,
+        'version': INDEX_VERSION,
+        'metadata': {
+            'cycle': metadata.get('cycle'),
+            'version': metadata.get('version'),
+            'filename': metadata.get('filename'),
+        },
+        'total_entries': offset,
+        'annexes': annexes,
+        'fields': index,
+    }
+
+
+def save_index(index: dict, output_path: str):
+    """Écrit l'index en JSON compact et retourne sa taille en KB."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+
+    return output_path.stat().st_size / 1024
@@ -9,6 +9,10 @@ Exemple:
     python rad_parser.py ../data/raw/RAD_2511_v1_17.xlsx ../frontend/public/rad-data.json
 """
 
+import csv
+import io
+import time
+import numpy as np
 import pandas as pd
 import json
 import re
@@ -17,6 +21,26 @@ from pathlib import Path
 from datetime import datetime
 import argparse
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice, repeat
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import rad_aerodromes
+import rad_areas
+import rad_cache
+import rad_columnar
+import rad_flight_levels
+import rad_index
+import rad_shards
+import rad_sqlite
+import rad_stream
+import rad_validity
 
 # Configuration du logging
 logging.basicConfig(
@@ -43,10 +67,227 @@ class RADParser:
         'Annex 3B FRA LIM': 'annex3b_fra'
     }
     
-    def __init__(self, excel_path: str):
-        self.excel_path = Path(excel_path)
-        if not self.excel_path.exists():
-            raise FileNotFoundError(f"Fichier non trouvé: {excel_path}")
+    # Champs communs en tête de chaque entrée (après 'id')
+    _VALIDITY_COLUMNS = {
+        'change_indicator': 'Change Ind.',
+        'valid_from': 'Valid From',
+        'valid_until': 'Valid Until',
+    }
+    
+    # Schéma déclaratif par feuille: clé JSON → colonne Excel (en-têtes nettoyés).
+    # L'ordre des clés est celui du JSON produit:
+    #   id, columns..., constants..., searchable_text, trailing...
+    ANNEX_SCHEMAS = {
+        'Annex 1': {
+            'id_column': 'ID',
+            'columns': {
+                **_VALIDITY_COLUMNS,
+                'definition': 'Definition',
+                'remarks': 'Remarks',
+                'owner': 'Owner',
+                'release_date': 'Release Date',
+            },
+            'constants': {'annex': '1', 'type': 'Area Definition'},
+        },
+        'Annex 2A': {
+            'id_column': 'ID',
+            'columns': {
+                **_VALIDITY_COLUMNS,
+                'airspace': 'Airspace',
+                'utilization': 'Utilization',
+                'time_applicability': 'Time Applicability',
+                'operational_goal': 'Operational Goal',
+                'remarks': 'Remarks',
+                'nas_fab': 'NAS/FAB',
+                'release_date': 'Release Date',
+            },
+            'constants': {'annex': '2A', 'type': 'Flight Level Capping Rule'},
+        },
+        'Annex 2B': {
+            'id_column': 'ID',
+            'columns': {
+                **_VALIDITY_COLUMNS,
+                'airway': 'Airway',
+                'from_point': 'From',
+                'to_point': 'To',
+                'point_or_airspace': 'Point or Airspace',
+                'utilization': 'Utilization',
+                'time_applicability': 'Time Applicability',
+                'categorisation': 'Categorisation',
+                'operational_goal': 'Operational Goal',
+                'remarks': 'Remarks',
+                'atc_unit': 'ATC Unit',
+                'nas_fab': 'NAS/FAB',
+                'release_date': 'Release Date',
+                'special_event': 'Special Event and Crisis',
+            },
+            'constants': {'annex': '2B', 'type': 'Capacity & Structural Rule'},
+        },
+        'Annex 2C': {
+            'id_column': 'ID',
+            'columns': {
+                **_VALIDITY_COLUMNS,
+                'airspace': 'Airspace',
+                'utilization': 'Utilization',
+                'time_applicability': 'Time Applicability',
+                'categorisation': 'Categorisation',
+                'operational_goal': 'Operational Goal',
+                'remarks': 'Remarks',
+                'nas_fab': 'NAS/FAB',
+                'release_date': 'Release Date',
+                'group_id': 'Group ID',
+            },
+            'constants': {'annex': '2C', 'type': 'FUA Traffic Flow Rule'},
+        },
+        # Annex 3A: les \n des en-têtes ont été remplacés par des espaces
+        'Annex 3A Conditions': {
+            'id_column': 'RAD Application ID',
+            'columns': {
+                **_VALIDITY_COLUMNS,
+                'nas_fab': 'NAS / FAB',
+                'release_date': 'Release Date',
+                'special_event': 'Special Event and Crisis',
+            },
+            'constants': {'annex': '3A', 'type': 'Aerodrome Connectivity - Condition'},
+            'trailing': {
+                'time_applicability': 'Time Applicability',
+                'condition': 'Condition',
+                'explanation': 'Explanation',
+            },
+        },
+        'Annex 3A ARR': {
+            'id_column': 'ARR ID',
+            'columns': {
+                **_VALIDITY_COLUMNS,
+                'nas_fab': 'NAS / FAB',
+                'release_date': 'Release Date',
+                'special_event': 'Special Event and Crisis',
+            },
+            'constants': {'annex': '3A', 'type': 'Aerodrome Connectivity - Arrival'},
+            'trailing': {
+                'aerodrome': 'ARR AD',
+                'time_applicability': 'ARR Time Applicability',
+                'operational_goal': 'ARR Operational Goal',
+                'remarks': 'ARR Remarks',
+                'first_pt_star': 'First PT STAR / STAR ID',
+                'dct_arr_pt': 'DCT ARR PT',
+                'arr_fpl_option': 'ARR FPL Option',
+            },
+        },
+        'Annex 3A DEP': {
+            'id_column': 'DEP ID',
+            'columns': {
+                **_VALIDITY_COLUMNS,
+                'nas_fab': 'NAS / FAB',
+                'release_date': 'Release Date',
+                'special_event': 'Special Event and Crisis',
+            },
+            'constants': {'annex': '3A', 'type': 'Aerodrome Connectivity - Departure'},
+            'trailing': {
+                'aerodrome': 'DEP AD',
+                'time_applicability': 'DEP Time Applicability',
+                'operational_goal': 'DEP Operational Goal',
+                'remarks': 'DEP Remarks',
+                'last_pt_sid': 'Last PT SID / SID ID',
+                'dct_dep_pt': 'DCT DEP PT',
+                'dep_fpl_options': 'DEP FPL Options',
+            },
+        },
+        # Annex 3B: la colonne ID est recherchée de façon tolérante (_find_column)
+        'Annex 3B DCT': {
+            'id_column': 'ID',
+            'columns': {
+                **_VALIDITY_COLUMNS,
+                'from_point': 'From',
+                'to_point': 'To',
+                'utilization': 'Utilization',
+                'time_applicability': 'Time Applicability',
+                'remarks': 'Remarks',
+                'atc_unit': 'ATC Unit',
+                'nas_fab': 'NAS/FAB',
+            },
+            'constants': {'annex': '3B', 'type': 'DCT Option'},
+        },
+        'Annex 3B FRA LIM': {
+            'id_column': 'RAD Application ID',
+            'columns': {
+                **_VALIDITY_COLUMNS,
+                'from_point': 'From',
+                'to_point': 'To',
+                'utilization': 'Utilization',
+                'time_applicability': 'Time Applicability',
+                'remarks': 'Remarks',
+                'atc_unit': 'ATC Unit',
+                'nas_fab': 'NAS/FAB',
+            },
+            'constants': {'annex': '3B', 'type': 'FRA Limitation'},
+        },
+    }
+    
+    # Champs dérivés du texte, ajoutés en fin d'entrée sur demande (derived_fields):
+    #   validity: valid_from/valid_until/time_applicability structurés (rad_validity)
+    #   flight_levels: bandes de FL du texte utilization (rad_flight_levels)
+    DERIVED_FIELDS = ('validity', 'flight_levels')
+    
+    # Sections dérivées des annexes, ajoutées à la sortie après stats (derived_sections):
+    #   areas: graphe des zones de l'Annex 1 et fermeture transitive (rad_areas)
+    #   aerodromes: entrées Annex 3A ARR/DEP par OACI, conditions jointes (rad_aerodromes)
+    DERIVED_SECTIONS = ('areas', 'aerodromes')
+    
+    def __init__(self, excel_path, single_load: bool = True,
+                 searchable_fields: list = None, jobs: int = 1,
+                 cache_dir: str = None, cache_max_bytes: int = rad_cache.DEFAULT_MAX_BYTES,
+                 filename: str = None, profile: bool = False, derived_fields: list = None,
+                 derived_sections: list = None, start_method: str = None):
+        """
+        excel_path: chemin du fichier, ou son contenu (bytes / objet fichier,
+        ex: téléchargé en mémoire). Pour un contenu, `filename` donne le nom
+        d'origine (RAD_YYMM_vX_YY.xlsx) dont sont extraits cycle et version.
+        start_method: démarrage des processus du pool (--jobs), ex:
+        'forkserver' quand d'autres threads tournent (None: défaut de la plateforme).
+        """
+        if isinstance(excel_path, (bytes, bytearray)) or hasattr(excel_path, 'read'):
+            # Contenu en mémoire: relu via un BytesIO neuf à chaque ouverture
+            content = excel_path.read() if hasattr(excel_path, 'read') else excel_path
+            self._content = bytes(content)
+            self.excel_path = Path(filename or getattr(excel_path, 'name', None) or 'RAD.xlsx')
+        else:
+            self._content = None
+            self.excel_path = Path(excel_path)
+            if not self.excel_path.exists():
+                raise FileNotFoundError(f"Fichier non trouvé: {excel_path}")
+        
+        # True: le classeur est ouvert une seule fois pour toutes les feuilles
+        # False: ancien comportement, une lecture complète par feuille
+        self.single_load = single_load
+        
+        # Clés JSON à reprendre dans searchable_text (None = toutes les colonnes)
+        self.searchable_fields = set(searchable_fields) if searchable_fields is not None else None
+        
+        # Champs dérivés à ajouter aux entrées (aucun par défaut: sortie inchangée)
+        unknown = set(derived_fields or ()) - set(self.DERIVED_FIELDS)
+        if unknown:
+            raise ValueError(f"Champs dérivés inconnus: {', '.join(sorted(unknown))}")
+        self.derived_fields = tuple(f for f in self.DERIVED_FIELDS if f in (derived_fields or ()))
+        
+        # Sections dérivées à ajouter à la sortie (aucune par défaut)
+        unknown = set(derived_sections or ()) - set(self.DERIVED_SECTIONS)
+        if unknown:
+            raise ValueError(f"Sections dérivées inconnues: {', '.join(sorted(unknown))}")
+        self.derived_sections = tuple(s for s in self.DERIVED_SECTIONS if s in (derived_sections or ()))
+        
+        # Nombre de processus pour parser les feuilles (1 = séquentiel)
+        self.jobs = max(1, jobs)
+        self.start_method = start_method
+        
+        # Cache des feuilles déjà parsées, indexé sur leur contenu (optionnel)
+        self.cache = rad_cache.ParseCache(cache_dir, cache_max_bytes) if cache_dir else None
+        
+        # Mode profil: durée de chaque étape par feuille → stats['timings']
+        self.profile = profile
+        self.timings = {}
+        self._current_sheet = None
+        self._parse_elapsed = None
         
         self.data = {
             'metadata': {},
@@ -57,45 +298,391 @@ class RADParser:
     def parse(self):
         """Parse le fichier Excel complet."""
         logger.info(f"📖 Lecture de {self.excel_path.name}")
+        start = time.perf_counter()
         
         # Extraire les métadonnées du nom de fichier
         self._extract_metadata()
         
-        # Parser chaque feuille
+        # Parser chaque feuille (résultats toujours dans l'ordre de SHEET_MAPPING)
         total_entries = 0
-        for sheet_name, json_key in self.SHEET_MAPPING.items():
-            logger.info(f"  ⚙️  Parsing {sheet_name}...")
+        for sheet_name, json_key, parsed_data, error in self._iter_parsed_sheets():
+            if error is not None:
+                logger.error(f"    ❌ Erreur ({sheet_name}): {error}")
+                self.data['annexes'][json_key] = []
+                continue
             
-            try:
-                df = pd.read_excel(
-                    self.excel_path, 
-                    sheet_name=sheet_name,
-                    engine='openpyxl'
-                )
-                
-                parsed_data = self._parse_sheet(sheet_name, df)
-                self.data['annexes'][json_key] = parsed_data
+            self.data['annexes'][json_key] = parsed_data
+            
+            count = len(parsed_data) if isinstance(parsed_data, list) else 0
+            total_entries += count
+            logger.info(f"    ✅ {count} entrées")
+        
+        self._parse_elapsed = time.perf_counter() - start
+        
+        # Statistiques
+        self.data['stats'] = self._build_stats(total_entries, {
+            key: len(val) if isinstance(val, list) else 0 
+            for key, val in self.data['annexes'].items()
+        })
+        
+        self._build_sections()
+        
+        logger.info(f"✅ Total: {total_entries} entrées parsées")
+        return self.data
+    
+    def parse_stream(self, output_path: str, indent: int = 2):
+        """Parse et écrit le JSON au fil de l'eau, une annexe à la fois.
+        
+        Chaque annexe est écrite dès que sa feuille est parsée puis libérée:
+        la mémoire reste bornée par la plus grosse feuille au lieu du RAD
+        complet. Le fichier produit est identique à parse() + save_json()
+        (format 'records'); self.data['annexes'] reste vide.
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        logger.info(f"📖 Lecture de {self.excel_path.name} (écriture en flux vers {output_path})")
+        start = time.perf_counter()
+        
+        self._extract_metadata()
+        
+        # Fichier temporaire: un parsing interrompu ne laisse pas de JSON tronqué
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        total_entries = 0
+        by_annex = {}
+        
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            writer = rad_stream.StreamingJSONWriter(f, indent=indent)
+            writer.begin(self.data['metadata'])
+            
+            for sheet_name, json_key, parsed_data, error in self._iter_parsed_sheets():
+                if error is not None:
+                    logger.error(f"    ❌ Erreur ({sheet_name}): {error}")
+                    parsed_data = []
                 
                 count = len(parsed_data) if isinstance(parsed_data, list) else 0
-                total_entries += count
-                logger.info(f"    ✅ {count} entrées")
+                with self._stage('serialize_s', sheet_name):
+                    writer.write_annex(json_key, parsed_data if isinstance(parsed_data, list) else [])
+                parsed_data = None
                 
-            except Exception as e:
-                logger.error(f"    ❌ Erreur: {e}")
-                self.data['annexes'][json_key] = []
+                by_annex[json_key] = count
+                total_entries += count
+                if error is None:
+                    logger.info(f"    ✅ {count} entrées")
+            
+            self._parse_elapsed = time.perf_counter() - start
+            self.data['stats'] = self._build_stats(total_entries, by_annex)
+            
+            peak = peak_rss_mb()
+            if peak is not None:
+                self.data['stats']['peak_rss_mb'] = round(peak, 1)
+            
+            writer.end(self.data['stats'])
         
-        # Statistiques
-        self.data['stats'] = {
+        tmp_path.replace(output_path)
+        
+        file_size = output_path.stat().st_size / 1024  # KB
+        logger.info(f"✅ Fichier généré: {output_path}")
+        logger.info(f"   - {total_entries} entrées totales")
+        logger.info(f"   - {file_size:.1f} KB")
+        if peak is not None:
+            logger.info(f"   - Pic mémoire (RSS): {peak:.1f} MB")
+        
+        return self.data
+    
+    def _build_sections(self):
+        """Sections dérivées demandées, calculées sur les annexes parsées."""
+        if 'areas' in self.derived_sections:
+            areas = rad_areas.build_area_graph(self.data['annexes'].get('annex1_areas') or [])
+            self.data['areas'] = areas
+            logger.info(f"🗺️  Zones Annex 1: {len(areas['graph'])} zones, "
+                        f"{len(areas['contained_in'])} références résolues")
+        
+        if 'aerodromes' in self.derived_sections:
+            annexes = self.data['annexes']
+            aerodromes = rad_aerodromes.build_aerodrome_index(
+                annexes.get('annex3a_arrivals') or [],
+                annexes.get('annex3a_departures') or [],
+                annexes.get('annex3a_conditions') or [],
+            )
+            self.data['aerodromes'] = aerodromes
+            logger.info(f"🛬 Aérodromes Annex 3A: {len(aerodromes)} codes OACI indexés")
+    
+    def _sections(self):
+        """{nom: contenu} des sections dérivées présentes dans self.data."""
+        return {name: self.data[name] for name in self.DERIVED_SECTIONS if name in self.data}
+    
+    def _build_stats(self, total_entries: int, by_annex: dict):
+        """Statistiques du parsing (+ compteurs du cache s'il est activé)."""
+        stats = {
             'total_entries': total_entries,
             'parsed_at': datetime.now().isoformat(),
-            'by_annex': {
-                key: len(val) if isinstance(val, list) else 0 
-                for key, val in self.data['annexes'].items()
+            'by_annex': by_annex
+        }
+        
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+            logger.info(f"♻️  Cache: {self.cache.hits} hit(s), {self.cache.misses} miss(es)")
+        
+        if self.profile:
+            stats['timings'] = self._timings_stats()
+        
+        return stats
+    
+    @contextmanager
+    def _stage(self, stage: str, sheet_name: str = None):
+        """Chronomètre une étape du traitement d'une feuille (mode profil uniquement)."""
+        if not self.profile:
+            yield
+            return
+        
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing = self.timings.setdefault(sheet_name or self._current_sheet, {})
+            timing[stage] = timing.get(stage, 0.0) + time.perf_counter() - start
+    
+    def _timings_stats(self):
+        """Durées par feuille et par étape (secondes), durée totale et pic mémoire.
+        
+        Étapes disjointes: read_s (lecture Excel), rows_s (construction des
+        entrées), searchable_text_s, serialize_s (écriture JSON de l'annexe;
+        null si non mesurée: format columnar, ou sérialisation pas encore faite).
+        """
+        sheets = {}
+        for sheet_name in self.SHEET_MAPPING:
+            timing = self.timings.get(sheet_name, {})
+            searchable = timing.get('searchable_text_s', 0.0)
+            sheets[sheet_name] = {
+                'read_s': round(timing.get('read_s', 0.0), 4),
+                'rows_s': round(max(timing.get('parse_s', 0.0) - searchable, 0.0), 4),
+                'searchable_text_s': round(searchable, 4),
+                'serialize_s': round(timing['serialize_s'], 4) if 'serialize_s' in timing else None,
+                'cached': timing.get('cached', False),
             }
+            if 'worker_peak_rss_mb' in timing:
+                sheets[sheet_name]['worker_peak_rss_mb'] = timing['worker_peak_rss_mb']
+        
+        peak = peak_rss_mb()
+        return {
+            'parse_s': round(self._parse_elapsed, 4) if self._parse_elapsed is not None else None,
+            'peak_rss_mb': round(peak, 1) if peak is not None else None,
+            'sheets': sheets,
         }
+    
+    def save_profile_report(self, output_path: str):
+        """Écrit les durées par feuille en JSON, ou en CSV (ajout d'une ligne par
+        feuille, pour suivre l'évolution d'un cycle AIRAC à l'autre)."""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        timings = self.data['stats'].get('timings') or self._timings_stats()
+        metadata = self.data['metadata']
         
-        logger.info(f"✅ Total: {total_entries} entrées parsées")
-        return self.data
+        if output_path.suffix.lower() != '.csv':
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump({'metadata': metadata, 'timings': timings}, f, indent=2, ensure_ascii=False)
+        else:
+            fields = ['parsed_at', 'cycle', 'version', 'sheet', 'read_s', 'rows_s',
+                      'searchable_text_s', 'serialize_s', 'cached', 'parse_s', 'peak_rss_mb']
+            new_file = not output_path.exists() or output_path.stat().st_size == 0
+            
+            with open(output_path, 'a', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+                if new_file:
+                    writer.writeheader()
+                for sheet_name, timing in timings['sheets'].items():
+                    writer.writerow({
+                        'parsed_at': metadata.get('parsed_at'),
+                        'cycle': metadata.get('cycle'),
+                        'version': metadata.get('version'),
+                        'sheet': sheet_name,
+                        'parse_s': timings['parse_s'],
+                        'peak_rss_mb': timings['peak_rss_mb'],
+                        **timing,
+                    })
+        
+        logger.info(f"⏱️  Rapport de profil: {output_path}")
+    
+    def _iter_parsed_sheets(self):
+        """Parse les feuilles et produit (sheet_name, json_key, entrées, erreur).
+        
+        Une erreur sur une feuille est renvoyée au lieu d'être levée, pour que
+        seule l'annexe concernée soit vidée. Avec un cache, les feuilles
+        inchangées sont relues depuis le cache et ne sont pas parsées.
+        """
+        cached, keys = self._load_cached_sheets()
+        pending = [sheet_name for sheet_name in self.SHEET_MAPPING if sheet_name not in cached]
+        
+        if self.jobs > 1 and len(pending) > 1:
+            parsed = self._parse_sheets_parallel(pending)
+        else:
+            parsed = self._parse_sheets_serial(pending)
+        
+        try:
+            for sheet_name, json_key in self.SHEET_MAPPING.items():
+                if sheet_name in cached:
+                    # Lecture paresseuse: une seule annexe du cache en mémoire à la fois
+                    parsed_data = self.cache.get(keys[sheet_name])
+                    if parsed_data is not None:
+                        logger.info(f"  ♻️  {sheet_name} (cache)")
+                        if self.profile:
+                            self.timings.setdefault(sheet_name, {})['cached'] = True
+                        yield sheet_name, json_key, parsed_data, None
+                        parsed_data = None
+                        continue
+                    
+                    # Entrée disparue ou illisible depuis le repérage: parser la feuille
+                    fallback = self._parse_sheets_serial([sheet_name])
+                    try:
+                        _, parsed_data, error = next(fallback)
+                    finally:
+                        fallback.close()
+                else:
+                    _, parsed_data, error = next(parsed)
+                
+                if error is None and keys.get(sheet_name):
+                    self.cache.put(
+                        keys[sheet_name], parsed_data,
+                        sheet=sheet_name, source=self.excel_path.name,
+                        cycle=self.data['metadata'].get('cycle')
+                    )
+                
+                yield sheet_name, json_key, parsed_data, error
+                # Ne pas retenir l'annexe pendant le parsing de la suivante (mode --stream)
+                parsed_data = None
+        finally:
+            # Ferme le classeur / le pool de processus
+            parsed.close()
+        
+        if self.cache is not None:
+            self.cache.evict()
+    
+    def _load_cached_sheets(self):
+        """Retourne ({feuilles présentes dans le cache}, {sheet_name: clé de cache}).
+        
+        Les entrées ne sont pas chargées ici: _iter_parsed_sheets les lit une
+        par une, au moment de les produire.
+        """
+        if self.cache is None:
+            return set(), {}
+        
+        try:
+            digests = rad_cache.sheet_digests(self._source(), self.SHEET_MAPPING)
+        except Exception as e:
+            # Classeur illisible: pas de cache, le parsing signalera l'erreur par feuille
+            logger.warning(f"⚠️  Hash des feuilles impossible ({e}), cache ignoré")
+            return set(), {}
+        
+        fields = sorted(self.searchable_fields) if self.searchable_fields is not None else None
+        keys = {
+            sheet_name: rad_cache.cache_key(digest, sheet_name, self.ANNEX_SCHEMAS[sheet_name], fields,
+                                             self.derived_fields)
+            for sheet_name, digest in digests.items()
+        }
+        
+        cached = {sheet_name for sheet_name, key in keys.items() if self.cache.contains(key)}
+        
+        # Feuilles sans entrée en cache: comptées comme miss ici (les hits le sont à la lecture)
+        self.cache.misses += len(set(self.SHEET_MAPPING) - cached)
+        
+        return cached, keys
+    
+    def _parse_sheets_serial(self, sheet_names: list):
+        """Lit et parse les feuilles une par une: (sheet_name, entrées, erreur)."""
+        if not sheet_names:
+            return
+        
+        # Ouvrir le classeur une seule fois (zip + shared strings décodés une fois)
+        workbook = self._open_workbook() if self.single_load else None
+        
+        try:
+            for sheet_name in sheet_names:
+                logger.info(f"  ⚙️  Parsing {sheet_name}...")
+                
+                try:
+                    with self._stage('read_s', sheet_name):
+                        df = self._read_sheet(sheet_name, workbook)
+                    with self._stage('parse_s', sheet_name):
+                        parsed_data, error = self._parse_sheet(sheet_name, df), None
+                except Exception as e:
+                    parsed_data, error = None, e
+                
+                # Libérer la feuille avant de passer la main (mode --stream)
+                df = None
+                
+                yield sheet_name, parsed_data, error
+                parsed_data = None
+        finally:
+            if workbook is not None:
+                workbook.close()
+    
+    def _parse_sheets_parallel(self, sheet_names: list):
+        """Variante multi-processus: une feuille par tâche, résultats dans l'ordre."""
+        workers = min(self.jobs, len(sheet_names))
+        logger.info(f"  🚀 {workers} processus en parallèle")
+        
+        mp_context = multiprocessing.get_context(self.start_method) if self.start_method else None
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_sheet_worker,
+            initargs=(self,)
+        ) as pool:
+            # Au plus `workers` feuilles soumises et non consommées: les
+            # résultats en attente ne s'accumulent pas en mémoire
+            to_submit = iter(sheet_names)
+            futures = {
+                sheet_name: pool.submit(_parse_sheet_worker, sheet_name)
+                for sheet_name in islice(to_submit, workers)
+            }
+            
+            for sheet_name in sheet_names:
+                # pop: le résultat n'est plus retenu par le Future une fois consommé
+                future = futures.pop(sheet_name)
+                try:
+                    parsed_data, timing = future.result()
+                    error = None
+                    if self.profile:
+                        self.timings[sheet_name] = timing
+                except Exception as e:
+                    parsed_data, error = None, e
+                future = None
+                
+                for next_sheet in islice(to_submit, 1):
+                    futures[next_sheet] = pool.submit(_parse_sheet_worker, next_sheet)
+                
+                logger.info(f"  ⚙️  {sheet_name}")
+                yield sheet_name, parsed_data, error
+                parsed_data = None
+    
+    def _source(self):
+        """Chemin du classeur, ou nouveau flux sur son contenu en mémoire."""
+        if self._content is not None:
+            return io.BytesIO(self._content)
+        return self.excel_path
+    
+    def _open_workbook(self):
+        """Ouvre le classeur une fois (openpyxl en lecture seule via pandas)."""
+        try:
+            return pd.ExcelFile(self._source(), engine='openpyxl')
+        except Exception as e:
+            # Repli sur la lecture feuille par feuille: chaque feuille
+            # échouera (ou non) individuellement comme avant
+            logger.warning(f"⚠️  Ouverture unique impossible ({e}), lecture par feuille")
+            return None
+    
+    def _read_sheet(self, sheet_name: str, workbook=None):
+        """Lit une feuille depuis le classeur ouvert, ou depuis le disque."""
+        if workbook is not None:
+            return workbook.parse(sheet_name)
+        
+        return pd.read_excel(
+            self._source(),
+            sheet_name=sheet_name,
+            engine='openpyxl'
+        )
     
     def _extract_metadata(self):
         """Extrait cycle, version depuis le nom de fichier."""
@@ -123,8 +710,11 @@ class RADParser:
     def _parse_sheet(self, sheet_name: str, df: pd.DataFrame):
         """Dispatcher vers la bonne méthode selon le type de feuille."""
         
+        # Feuille en cours (étapes chronométrées plus bas, mode profil)
+        self._current_sheet = sheet_name
+        
         # Nettoyer les noms de colonnes
-        df.columns = df.columns.str.replace('\n', ' ').str.strip()
+        self._clean_columns(df)
         
         # Router selon le type
         if 'Annex 2B' in sheet_name:
@@ -142,265 +732,112 @@ class RADParser:
         else:
             return []
     
+    def _clean_columns(self, df: pd.DataFrame):
+        """Remplace les \n des en-têtes Excel par des espaces."""
+        df.columns = df.columns.str.replace('\n', ' ').str.strip()
+        return df
+    
     def _parse_annex_2b(self, df: pd.DataFrame):
         """Parse Annex 2B - Capacity & Structural Rules (le plus important)."""
-        rules = []
-        
-        for idx, row in df.iterrows():
-            # Ignorer les lignes sans ID
-            if pd.isna(row.get('ID')):
-                continue
-            
-            rule = {
-                'id': self._safe_str(row.get('ID')),
-                'change_indicator': self._safe_str(row.get('Change Ind.')),
-                'valid_from': self._safe_str(row.get('Valid From')),
-                'valid_until': self._safe_str(row.get('Valid Until')),
-                'airway': self._safe_str(row.get('Airway')),
-                'from_point': self._safe_str(row.get('From')),
-                'to_point': self._safe_str(row.get('To')),
-                'point_or_airspace': self._safe_str(row.get('Point or Airspace')),
-                'utilization': self._safe_str(row.get('Utilization')),
-                'time_applicability': self._safe_str(row.get('Time Applicability')),
-                'categorisation': self._safe_str(row.get('Categorisation')),
-                'operational_goal': self._safe_str(row.get('Operational Goal')),
-                'remarks': self._safe_str(row.get('Remarks')),
-                'atc_unit': self._safe_str(row.get('ATC Unit')),
-                'nas_fab': self._safe_str(row.get('NAS/FAB')),
-                'release_date': self._safe_str(row.get('Release Date')),
-                'special_event': self._safe_str(row.get('Special Event and Crisis')),
-                
-                # Métadonnées pour recherche
-                'annex': '2B',
-                'type': 'Capacity & Structural Rule',
-                'searchable_text': self._build_searchable_text(row)
-            }
-            
-            rules.append(rule)
-        
-        return rules
+        return self._parse_with_schema(df, self.ANNEX_SCHEMAS['Annex 2B'])
     
     def _parse_annex_2a(self, df: pd.DataFrame):
         """Parse Annex 2A - Flight Level Capping Rules."""
-        rules = []
-        
-        for idx, row in df.iterrows():
-            if pd.isna(row.get('ID')):
-                continue
-            
-            rule = {
-                'id': self._safe_str(row.get('ID')),
-                'change_indicator': self._safe_str(row.get('Change Ind.')),
-                'valid_from': self._safe_str(row.get('Valid From')),
-                'valid_until': self._safe_str(row.get('Valid Until')),
-                'airspace': self._safe_str(row.get('Airspace')),
-                'utilization': self._safe_str(row.get('Utilization')),
-                'time_applicability': self._safe_str(row.get('Time Applicability')),
-                'operational_goal': self._safe_str(row.get('Operational Goal')),
-                'remarks': self._safe_str(row.get('Remarks')),
-                'nas_fab': self._safe_str(row.get('NAS/FAB')),
-                'release_date': self._safe_str(row.get('Release Date')),
-                
-                'annex': '2A',
-                'type': 'Flight Level Capping Rule',
-                'searchable_text': self._build_searchable_text(row)
-            }
-            
-            rules.append(rule)
-        
-        return rules
+        return self._parse_with_schema(df, self.ANNEX_SCHEMAS['Annex 2A'])
     
     def _parse_annex_2c(self, df: pd.DataFrame):
         """Parse Annex 2C - FUA Traffic Flow Rules."""
-        rules = []
-        
-        for idx, row in df.iterrows():
-            if pd.isna(row.get('ID')):
-                continue
-            
-            rule = {
-                'id': self._safe_str(row.get('ID')),
-                'change_indicator': self._safe_str(row.get('Change Ind.')),
-                'valid_from': self._safe_str(row.get('Valid From')),
-                'valid_until': self._safe_str(row.get('Valid Until')),
-                'airspace': self._safe_str(row.get('Airspace')),
-                'utilization': self._safe_str(row.get('Utilization')),
-                'time_applicability': self._safe_str(row.get('Time Applicability')),
-                'categorisation': self._safe_str(row.get('Categorisation')),
-                'operational_goal': self._safe_str(row.get('Operational Goal')),
-                'remarks': self._safe_str(row.get('Remarks')),
-                'nas_fab': self._safe_str(row.get('NAS/FAB')),
-                'release_date': self._safe_str(row.get('Release Date')),
-                'group_id': self._safe_str(row.get('Group ID')),
-                
-                'annex': '2C',
-                'type': 'FUA Traffic Flow Rule',
-                'searchable_text': self._build_searchable_text(row)
-            }
-            
-            rules.append(rule)
-        
-        return rules
+        return self._parse_with_schema(df, self.ANNEX_SCHEMAS['Annex 2C'])
     
     def _parse_annex_1(self, df: pd.DataFrame):
         """Parse Annex 1 - Area Definitions."""
-        areas = []
-        
-        for idx, row in df.iterrows():
-            if pd.isna(row.get('ID')):
-                continue
-            
-            area = {
-                'id': self._safe_str(row.get('ID')),
-                'change_indicator': self._safe_str(row.get('Change Ind.')),
-                'valid_from': self._safe_str(row.get('Valid From')),
-                'valid_until': self._safe_str(row.get('Valid Until')),
-                'definition': self._safe_str(row.get('Definition')),
-                'remarks': self._safe_str(row.get('Remarks')),
-                'owner': self._safe_str(row.get('Owner')),
-                'release_date': self._safe_str(row.get('Release Date')),
-                
-                'annex': '1',
-                'type': 'Area Definition',
-                'searchable_text': self._build_searchable_text(row)
-            }
-            
-            areas.append(area)
-        
-        return areas
+        return self._parse_with_schema(df, self.ANNEX_SCHEMAS['Annex 1'])
     
     def _parse_annex_3a(self, df: pd.DataFrame, sheet_name: str):
-        """Parse Annex 3A - Aerodrome Connectivity."""
-        entries = []
-
-        # Déterminer le type et les noms de colonnes spécifiques
-        # NOTE: Les \n ont été remplacés par des espaces lors du nettoyage des colonnes (ligne 127)
-        if 'ARR' in sheet_name:
-            entry_type = 'Arrival'
-            id_col = 'ARR ID'
-            ad_col = 'ARR AD'
-            time_col = 'ARR Time Applicability'  # Espace, pas \n
-            goal_col = 'ARR Operational Goal'  # Espace, pas \n
-            remarks_col = 'ARR Remarks'
-            extra_cols = {
-                'first_pt_star': 'First PT STAR / STAR ID',  # Espace, pas \n
-                'dct_arr_pt': 'DCT ARR PT',
-                'arr_fpl_option': 'ARR FPL Option'
-            }
-        elif 'DEP' in sheet_name:
-            entry_type = 'Departure'
-            id_col = 'DEP ID'
-            ad_col = 'DEP AD'
-            time_col = 'DEP Time Applicability'  # Espace, pas \n
-            goal_col = 'DEP Operational Goal'  # Espace, pas \n
-            remarks_col = 'DEP Remarks'
-            extra_cols = {
-                'last_pt_sid': 'Last PT SID / SID ID',  # Espace, pas \n
-                'dct_dep_pt': 'DCT DEP PT',
-                'dep_fpl_options': 'DEP FPL Options'
-            }
-        else:  # Conditions
-            entry_type = 'Condition'
-            id_col = 'RAD Application ID'
-            ad_col = None  # Pas d'aérodrome pour les conditions
-            time_col = 'Time Applicability'  # Espace, pas \n
-            goal_col = None
-            remarks_col = None
-            extra_cols = {
-                'condition': 'Condition',
-                'explanation': 'Explanation'
-            }
-
-        for idx, row in df.iterrows():
-            # Ignorer les lignes vides (pas d'ID)
-            if pd.isna(row.get(id_col)):
-                continue
-
-            # Structure de base commune à tous les types
-            entry = {
-                'id': self._safe_str(row.get(id_col)),
-                'change_indicator': self._safe_str(row.get('Change Ind.')),  # Espace, pas \n
-                'valid_from': self._safe_str(row.get('Valid From')),  # Espace, pas \n
-                'valid_until': self._safe_str(row.get('Valid Until')),  # Espace, pas \n
-                'nas_fab': self._safe_str(row.get('NAS / FAB')),
-                'release_date': self._safe_str(row.get('Release Date')),  # Espace, pas \n
-                'special_event': self._safe_str(row.get('Special Event and Crisis')),  # Espace, pas \n
-
-                'annex': '3A',
-                'type': f'Aerodrome Connectivity - {entry_type}',
-                'searchable_text': self._build_searchable_text(row)
-            }
-
-            # Ajouter l'aérodrome si applicable
-            if ad_col:
-                entry['aerodrome'] = self._safe_str(row.get(ad_col))
-
-            # Ajouter les champs spécifiques
-            if time_col:
-                entry['time_applicability'] = self._safe_str(row.get(time_col))
-            if goal_col:
-                entry['operational_goal'] = self._safe_str(row.get(goal_col))
-            if remarks_col:
-                entry['remarks'] = self._safe_str(row.get(remarks_col))
-
-            # Ajouter les colonnes extra spécifiques au type
-            for key, col in extra_cols.items():
-                entry[key] = self._safe_str(row.get(col))
-
-            entries.append(entry)
-
-        return entries
+        """Parse Annex 3A - Aerodrome Connectivity (Conditions, ARR, DEP)."""
+        return self._parse_with_schema(df, self.ANNEX_SCHEMAS[sheet_name])
     
     def _parse_annex_3b(self, df: pd.DataFrame, sheet_name: str):
         """Parse Annex 3B - En-route DCT Options and FRA Limitations."""
-        entries = []
-
-        # Déterminer le type et la colonne ID selon l'onglet
-        if 'FRA' in sheet_name:
-            entry_type = 'FRA Limitation'
-            id_col = 'RAD Application ID'  # FRA LIM utilise cette colonne
-        else:
-            entry_type = 'DCT Option'
-            id_col = 'ID'  # DCT utilise la colonne standard ID
-
+        schema = self.ANNEX_SCHEMAS[sheet_name]
+        
         # Trouver la colonne ID réelle (avec variations possibles)
-        id_col_actual = None
+        id_col_actual = self._find_column(df, schema['id_column'])
+        if not id_col_actual:
+            logger.warning(f"Colonne '{schema['id_column']}' non trouvée dans {sheet_name}")
+            return []
+        
+        return self._parse_with_schema(df, schema, id_col=id_col_actual)
+    
+    def _find_column(self, df: pd.DataFrame, name: str):
+        """Trouve la première colonne contenant `name` (casse/espaces ignorés)."""
+        wanted = name.lower().replace(' ', '').replace('\n', '')
         for col in df.columns:
             col_normalized = col.lower().replace(' ', '').replace('\n', '')
-            id_normalized = id_col.lower().replace(' ', '').replace('\n', '')
-            if id_normalized in col_normalized:
-                id_col_actual = col
-                break
-
-        if not id_col_actual:
-            logger.warning(f"Colonne '{id_col}' non trouvée dans {sheet_name}")
-            return entries
-
-        for idx, row in df.iterrows():
-            if pd.isna(row.get(id_col_actual)):
-                continue
-
-            entry = {
-                'id': self._safe_str(row.get(id_col_actual)),
-                'change_indicator': self._safe_str(row.get('Change Ind.')),
-                'valid_from': self._safe_str(row.get('Valid From')),
-                'valid_until': self._safe_str(row.get('Valid Until')),
-                'from_point': self._safe_str(row.get('From')),
-                'to_point': self._safe_str(row.get('To')),
-                'utilization': self._safe_str(row.get('Utilization')),
-                'time_applicability': self._safe_str(row.get('Time Applicability')),
-                'remarks': self._safe_str(row.get('Remarks')),
-                'atc_unit': self._safe_str(row.get('ATC Unit')),
-                'nas_fab': self._safe_str(row.get('NAS/FAB')),
-
-                'annex': '3B',
-                'type': entry_type,
-                'searchable_text': self._build_searchable_text(row)
-            }
-
-            entries.append(entry)
-
-        return entries
+            if wanted in col_normalized:
+                return col
+        return None
+    
+    def _parse_with_schema(self, df: pd.DataFrame, schema: dict, id_col: str = None):
+        """Construit les entrées d'une feuille colonne par colonne.
+        
+        Chaque colonne est normalisée en une fois (NaN → "", strip), puis les
+        dictionnaires sont émis en bloc dans l'ordre des clés du schéma:
+        id, columns, constants, searchable_text, trailing.
+        """
+        id_col = id_col or schema['id_column']
+        
+        # Ignorer les lignes sans ID
+        if id_col not in df.columns:
+            return []
+        df = df[df[id_col].notna()]
+        
+        normalized = {}
+        
+        def column(col):
+            if col not in normalized:
+                if col in df.columns:
+                    normalized[col] = self._normalize_column(df[col])
+                else:
+                    normalized[col] = pd.Series("", index=df.index, dtype=object)
+            return normalized[col]
+        
+        keys = ['id']
+        values = [column(id_col).tolist()]
+        
+        for key, col in schema['columns'].items():
+            keys.append(key)
+            values.append(column(col).tolist())
+        
+        for key, constant in schema['constants'].items():
+            keys.append(key)
+            values.append(repeat(constant))
+        
+        keys.append('searchable_text')
+        with self._stage('searchable_text_s'):
+            values.append(self._build_searchable_text(df, schema, id_col, normalized).tolist())
+        
+        for key, col in schema.get('trailing', {}).items():
+            keys.append(key)
+            values.append(column(col).tolist())
+        
+        # Champs dérivés du texte (le texte d'origine reste dans son champ)
+        fields = dict(zip(keys, values))
+        if 'validity' in self.derived_fields:
+            keys.append('validity')
+            values.append(rad_validity.validity_column(
+                fields['valid_from'], fields['valid_until'], fields.get('time_applicability')
+            ))
+        if 'flight_levels' in self.derived_fields and 'utilization' in fields:
+            keys.append('flight_levels')
+            values.append(rad_flight_levels.flight_levels_column(fields['utilization']))
+        
+        return [dict(zip(keys, row)) for row in zip(*values)]
+    
+    def _normalize_column(self, series: pd.Series):
+        """Équivalent colonne de _safe_str: NaN/None → "", sinon str().strip()."""
+        values = series.astype(object).where(series.notna(), "")
+        return values.map(str).str.strip()
     
     def _safe_str(self, value):
         """Convertit une valeur en string safe (gère NaN, None)."""
@@ -408,25 +845,70 @@ class RADParser:
             return ""
         return str(value).strip()
     
-    def _build_searchable_text(self, row: pd.Series):
-        """Construit un champ texte pour recherche full-text."""
-        searchable = []
+    def _searchable_columns(self, schema: dict, id_col: str):
+        """Colonnes Excel retenues pour searchable_text (None = toutes)."""
+        if self.searchable_fields is None:
+            return None
+        
+        fields = {'id': id_col, **schema['columns'], **schema.get('trailing', {})}
+        return {col for key, col in fields.items() if key in self.searchable_fields}
+    
+    def _build_searchable_text(self, df: pd.DataFrame, schema: dict, id_col: str,
+                               normalized: dict = None):
+        """Construit le champ texte full-text de toute une feuille en une fois.
+        
+        Les valeurs non vides sont jointes par " | " dans l'ordre des colonnes
+        de la feuille, puis passées en majuscules.
+        """
+        normalized = normalized if normalized is not None else {}
+        allowed = self._searchable_columns(schema, id_col)
+        duplicated = df.columns.duplicated()
+        text = np.full(len(df), "", dtype=object)
         
-        for col, val in row.items():
-            if pd.notna(val) and str(val).strip():
-                searchable.append(str(val).strip())
+        # Par position: robuste aux en-têtes dupliqués après nettoyage des \n
+        for position, col in enumerate(df.columns):
+            if allowed is not None and col not in allowed:
+                continue
+            
+            if col in normalized and not duplicated[position]:
+                values = normalized[col]
+            else:
+                values = self._normalize_column(df.iloc[:, position])
+            
+            values = values.to_numpy(dtype=object)
+            text = text + np.where(values != "", " | " + values, "")
         
-        return " | ".join(searchable).upper()
+        # Retirer le premier séparateur
+        return pd.Series(text, index=df.index, dtype=object).str[3:].str.upper()
     
-    def save_json(self, output_path: str, indent: int = 2):
-        """Sauvegarde les données en JSON."""
+    def save_json(self, output_path: str, indent: int = 2, output_format: str = 'records'):
+        """Sauvegarde les données en JSON.
+        
+        output_format: 'records' (tableau d'objets par annexe) ou 'columnar'
+        (colonnes + dictionnaire de strings par annexe, voir rad_columnar).
+        """
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        logger.info(f"💾 Sauvegarde vers {output_path}")
+        logger.info(f"💾 Sauvegarde vers {output_path} (format {output_format})")
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=indent, ensure_ascii=False)
+        if self.profile and output_format == 'records':
+            # Écriture annexe par annexe (même fichier) pour chronométrer
+            # la sérialisation de chaque feuille; stats (et durées) en dernier
+            sheet_names = {json_key: sheet for sheet, json_key in self.SHEET_MAPPING.items()}
+            with open(output_path, 'w', encoding='utf-8') as f:
+                writer = rad_stream.StreamingJSONWriter(f, indent=indent)
+                writer.begin(self.data['metadata'])
+                for json_key, records in self.data['annexes'].items():
+                    with self._stage('serialize_s', sheet_names.get(json_key, json_key)):
+                        writer.write_annex(json_key, records)
+                self.data['stats']['timings'] = self._timings_stats()
+                writer.end(self.data['stats'], self._sections())
+        else:
+            payload = rad_columnar.encode(self.data) if output_format == 'columnar' else self.data
+            
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, indent=indent, ensure_ascii=False)
         
         # Statistiques
         file_size = output_path.stat().st_size / 1024  # KB
@@ -437,6 +919,81 @@ class RADParser:
         logger.info(f"   - {file_size:.1f} KB")
         
         return self.data
+    
+    def save_index(self, output_path: str):
+        """Sauvegarde l'index inversé (ID, points, airways...) → offsets des entrées."""
+        index = rad_index.build_inverted_index(self.data)
+        file_size = rad_index.save_index(index, output_path)
+        
+        keys = sum(len(values) for values in index['fields'].values())
+        logger.info(f"🔎 Index généré: {output_path} ({keys} clés, {file_size:.1f} KB)")
+        
+        return index
+    
+    def save_sqlite(self, output_path: str):
+        """Sauvegarde une base SQLite: une table par annexe, index B-tree et FTS5."""
+        fields = {
+            json_key: self._annex_fields(sheet_name)
+            for sheet_name, json_key in self.SHEET_MAPPING.items()
+        }
+        file_size = rad_sqlite.write_sqlite(self.data, output_path, fields=fields)
+        logger.info(f"🗄️  Base SQLite générée: {output_path} ({file_size:.1f} KB)")
+    
+    def _annex_fields(self, sheet_name: str):
+        """Champs des entrées d'une feuille, dans l'ordre de _parse_with_schema."""
+        schema = self.ANNEX_SCHEMAS[sheet_name]
+        keys = ['id', *schema['columns'], *schema['constants'], 'searchable_text',
+                *schema.get('trailing', {})]
+        if 'validity' in self.derived_fields:
+            keys.append('validity')
+        if 'flight_levels' in self.derived_fields and 'utilization' in keys:
+            keys.append('flight_levels')
+        return keys
+    
+    def save_shards(self, output_dir: str, by_fab: bool = False,
+                    output_format: str = 'records', indent: int = None):
+        """Sauvegarde un fichier par annexe (option: par NAS/FAB) + manifest.json."""
+        return rad_shards.write_shards(
+            self.data, output_dir,
+            by_fab=by_fab, output_format=output_format, indent=indent
+        )
+
+
+def peak_rss_mb():
+    """Pic de mémoire résidente du processus en MB (None si indisponible)."""
+    if resource is None:
+        return None
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en octets sous macOS, en KB ailleurs
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+# État propre à chaque processus du pool (--jobs): parser et classeur ouvert
+# une fois par processus, réutilisés pour toutes les feuilles qu'il traite
+_worker_parser = None
+_worker_workbook = None
+
+
+def _init_sheet_worker(rad_parser: RADParser):
+    """Initialise un processus du pool avec une copie du parser."""
+    global _worker_parser, _worker_workbook
+    _worker_parser = rad_parser
+    _worker_workbook = rad_parser._open_workbook() if rad_parser.single_load else None
+
+
+def _parse_sheet_worker(sheet_name: str):
+    """Lit et parse une feuille dans un processus du pool: (entrées, durées)."""
+    with _worker_parser._stage('read_s', sheet_name):
+        df = _worker_parser._read_sheet(sheet_name, _worker_workbook)
+    with _worker_parser._stage('parse_s', sheet_name):
+        parsed_data = _worker_parser._parse_sheet(sheet_name, df)
+    
+    timing = _worker_parser.timings.get(sheet_name, {})
+    if _worker_parser.profile:
+        peak = peak_rss_mb()
+        timing['worker_peak_rss_mb'] = round(peak, 1) if peak is not None else None
+    return parsed_data, timing
 
 
 def main():
@@ -448,6 +1005,15 @@ def main():
 Exemples:
   python rad_parser.py RAD_2511_v1_17.xlsx output.json
   python rad_parser.py ../data/raw/RAD.xlsx ../frontend/public/rad-data.json --indent 0
+  python rad_parser.py ../data/raw/RAD.xlsx ../frontend/public/rad-data.json --jobs 4
+  python rad_parser.py ../data/raw/RAD.xlsx ../frontend/public/rad-data.json --cache-dir ../data/cache
+  python rad_parser.py ../data/raw/RAD.xlsx ../frontend/public/rad-data.json --stream
+  python rad_parser.py ../data/raw/RAD.xlsx out.json --profile --profile-report timings.csv --cprofile parse.prof
+  python rad_parser.py ../data/raw/RAD.xlsx ../frontend/public/rad-data.json --format columnar
+  python rad_parser.py ../data/raw/RAD.xlsx ../frontend/public/rad-data.json --index ../frontend/public/rad-index.json
+  python rad_parser.py ../data/raw/RAD.xlsx ../frontend/public/rad-data.json --shards ../frontend/public/shards --shard-by-fab
+  python rad_parser.py ../data/raw/RAD.xlsx ../frontend/public/rad-data.json --sqlite ../data/rad-data.db
+  python rad_parser.py ../data/raw/RAD.xlsx ../frontend/public/rad-data.json --derived-sections areas,aerodromes
         """
     )
     
@@ -455,21 +1021,131 @@ Exemples:
     parser.add_argument('output', help='Output JSON file')
     parser.add_argument('--indent', type=int, default=2, 
                        help='JSON indent (default: 2, use 0 for minified)')
+    parser.add_argument('--format', choices=['records', 'columnar'], default='records',
+                       help='Output layout: array of objects per annex (default) '
+                            'or dictionary-encoded columns')
+    parser.add_argument('--index',
+                       help='Also write a precomputed inverted index (ID/point/airway... → offsets)')
+    parser.add_argument('--shards',
+                       help='Also write one file per annex plus a manifest into this directory')
+    parser.add_argument('--shard-by-fab', action='store_true',
+                       help='With --shards, split each annex further by NAS/FAB')
+    parser.add_argument('--sqlite',
+                       help='Also write a SQLite database (one table per annex, B-tree indexes, FTS5)')
+    parser.add_argument('--stream', action='store_true',
+                       help='Write each annex as soon as its sheet is parsed, then free it '
+                            '(bounded memory, same output; records format only)')
+    parser.add_argument('--per-sheet-load', action='store_true',
+                       help='Re-read the workbook for each sheet (legacy behavior)')
+    parser.add_argument('--searchable-fields',
+                       help='Comma-separated JSON keys kept in searchable_text '
+                            '(default: every column of the sheet)')
+    parser.add_argument('--derived-fields',
+                       help='Comma-separated structured fields added to each entry: '
+                            f'{", ".join(RADParser.DERIVED_FIELDS)} (default: none)')
+    parser.add_argument('--derived-sections',
+                       help='Comma-separated top-level sections added after stats: '
+                            f'{", ".join(RADParser.DERIVED_SECTIONS)} (default: none)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Parse sheets in N worker processes (default: 1)')
+    parser.add_argument('--cache-dir',
+                       help='Reuse parsed sheets whose content did not change (cache directory)')
+    parser.add_argument('--cache-max-mb', type=int, default=rad_cache.DEFAULT_MAX_BYTES // (1024 * 1024),
+                       help='Cache size limit, least recently used entries evicted first (default: 200)')
+    parser.add_argument('--profile', action='store_true',
+                       help='Record per-sheet timings (Excel read, rows, searchable_text, '
+                            'serialization) and peak memory in stats.timings')
+    parser.add_argument('--profile-report',
+                       help='With --profile, also write the timings to this file '
+                            '(.json, or .csv to append one row per sheet)')
+    parser.add_argument('--cprofile',
+                       help='Dump a cProfile of the whole run to this file (pstats format)')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Verbose output')
     
     args = parser.parse_args()
     
+    if args.stream and (args.format != 'records' or args.index or args.shards or args.sqlite
+                        or args.derived_sections):
+        parser.error('--stream ne produit que le format records '
+                     '(sans --index, --shards, --sqlite ni --derived-sections)')
+    
     if args.verbose:
         logger.setLevel(logging.DEBUG)
     
+    unknown = set(_split_fields(args.derived_fields) or ()) - set(RADParser.DERIVED_FIELDS)
+    if unknown:
+        parser.error(f"--derived-fields: champs inconnus: {', '.join(sorted(unknown))}")
+    
+    unknown = set(_split_fields(args.derived_sections) or ()) - set(RADParser.DERIVED_SECTIONS)
+    if unknown:
+        parser.error(f"--derived-sections: sections inconnues: {', '.join(sorted(unknown))}")
+    
+    if args.profile_report and not args.profile:
+        parser.error('--profile-report nécessite --profile')
+    
+    if args.cprofile:
+        import cProfile
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(_run, args)
+        finally:
+            profiler.dump_stats(args.cprofile)
+            logger.info(f"🔬 Profil cProfile: {args.cprofile} (python -m pstats {args.cprofile})")
+    
+    return _run(args)
+
+
+def _split_fields(value: str):
+    """'a, b' → ['a', 'b'] (None si l'option est absente)."""
+    if value is None:
+        return None
+    return [field.strip() for field in value.split(',') if field.strip()]
+
+
+def _run(args):
+    """Parse et écrit les sorties demandées sur la ligne de commande."""
     try:
         # Parse
-        rad_parser = RADParser(args.input)
+        searchable_fields = _split_fields(args.searchable_fields)
+        
+        rad_parser = RADParser(
+            args.input,
+            single_load=not args.per_sheet_load,
+            searchable_fields=searchable_fields,
+            derived_fields=_split_fields(args.derived_fields),
+            derived_sections=_split_fields(args.derived_sections),
+            jobs=args.jobs,
+            cache_dir=args.cache_dir,
+            cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+            profile=args.profile
+        )
+        if args.stream:
+            rad_parser.parse_stream(args.output, indent=args.indent)
+            if args.profile_report:
+                rad_parser.save_profile_report(args.profile_report)
+            logger.info("🎉 Parsing terminé avec succès!")
+            return 0
+        
         data = rad_parser.parse()
         
         # Save
-        rad_parser.save_json(args.output, indent=args.indent)
+        rad_parser.save_json(args.output, indent=args.indent, output_format=args.format)
+        
+        if args.index:
+            rad_parser.save_index(args.index)
+        
+        if args.shards:
+            rad_parser.save_shards(
+                args.shards, by_fab=args.shard_by_fab,
+                output_format=args.format, indent=args.indent
+            )
+        
+        if args.sqlite:
+            rad_parser.save_sqlite(args.sqlite)
+        
+        if args.profile_report:
+            rad_parser.save_profile_report(args.profile_report)
         
         logger.info("🎉 Parsing terminé avec succès!")
         return 0
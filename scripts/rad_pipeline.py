@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+RAD Pipeline - Téléchargement et parsing des RAD dans un seul processus
+
+Usage:
+    python rad_pipeline.py --output-dir ../frontend/public
+
+Exemple:
+    python rad_pipeline.py --output-dir ../frontend/public --raw-dir ../data/raw --index --cache-dir ../data/cache
+
+Chaque RAD trouvé sur la page EUROCONTROL (current, future...) est téléchargé
+en mémoire puis passé directement à RADParser, sans écrire le fichier Excel
+ni relancer un interpréteur par fichier. Les téléchargements se font en
+parallèle et chaque RAD est parsé dès qu'il est reçu. Produit, par RAD:
+    - rad-data-{type}.json
+    - rad-index-{type}.json (avec --index)
+et, avec --raw-dir, une copie des fichiers Excel + rad_downloads_metadata.json.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from rad_downloader import RADDownloader
+from rad_parser import RADParser
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Le parsing (--jobs) démarre ses processus pendant que d'autres RAD se
+# téléchargent dans des threads: un fork copierait des verrous (logging,
+# urllib3) tenus par ces threads et pourrait bloquer le processus fils
+SAFE_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+def parse_download(buffer, rad_type: str, rad_info: dict, output_dir: Path,
+                   index: bool = False, indent: int = 2, output_format: str = 'records',
+                   **parser_kwargs):
+    """Parse un RAD téléchargé en mémoire et écrit ses sorties JSON."""
+    # Le nom d'origine donne cycle et version (_extract_metadata)
+    rad_parser = RADParser(buffer, filename=rad_info['filename'], **parser_kwargs)
+    rad_parser.parse()
+
+    rad_parser.save_json(output_dir / f"rad-data-{rad_type}.json", indent=indent,
+                         output_format=output_format)
+    if index:
+        rad_parser.save_index(output_dir / f"rad-index-{rad_type}.json")
+
+    return rad_parser.data
+
+
+def run_pipeline(output_dir: str, raw_dir: str = None, types: list = None,
+                 workers: int = None, **options):
+    """Télécharge et parse tous les RAD trouvés; retourne {rad_type: succès}."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    downloader = RADDownloader(raw_dir, workers=workers)
+
+    logger.info("📖 Parsing de la page EUROCONTROL RAD...")
+    rad_links = downloader._parse_rad_page()
+    if types:
+        rad_links = {t: info for t, info in rad_links.items() if t in types}
+
+    if not rad_links:
+        logger.error("❌ Aucun fichier RAD trouvé sur la page")
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers or len(rad_links),
+                            thread_name_prefix='rad-download') as pool:
+        futures = {
+            pool.submit(downloader.fetch_to_memory, rad_type, rad_info,
+                        keep_file=raw_dir is not None): rad_type
+            for rad_type, rad_info in rad_links.items()
+        }
+
+        # Parsing dans le thread principal, pendant que les autres RAD se téléchargent
+        for future in as_completed(futures):
+            rad_type = futures[future]
+            try:
+                buffer = future.result()
+            except Exception as e:
+                # Ex.: OSError en écrivant la copie --raw-dir; les autres RAD continuent
+                logger.error(f"[{rad_type.upper()}] ❌ Erreur inattendue: {e}")
+                results[rad_type] = False
+                continue
+
+            if buffer is None:
+                results[rad_type] = False
+                continue
+
+            logger.info(f"⚙️  Parsing RAD {rad_type.upper()}...")
+            try:
+                parse_download(buffer, rad_type, rad_links[rad_type], output_dir,
+                               start_method=SAFE_START_METHOD, **options)
+                results[rad_type] = True
+            except Exception as e:
+                logger.error(f"❌ Erreur de parsing ({rad_type}): {e}")
+                results[rad_type] = False
+            finally:
+                buffer.close()
+
+    if raw_dir is not None:
+        downloader._save_metadata()
+
+    return results
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description='Télécharge et parse les RAD EUROCONTROL en un seul processus',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python rad_pipeline.py --output-dir ../frontend/public
+  python rad_pipeline.py --output-dir ../frontend/public --raw-dir ../data/raw --index
+  python rad_pipeline.py --output-dir ../frontend/public --only future --cache-dir ../data/cache
+        """
+    )
+
+    parser.add_argument('--output-dir', '-o', default='../frontend/public',
+                       help='Répertoire des JSON produits (default: ../frontend/public)')
+    parser.add_argument('--raw-dir',
+                       help='Garder aussi une copie des fichiers Excel (et leurs métadonnées) ici')
+    parser.add_argument('--only', action='append',
+                       help='Limiter à certains RAD: current, future... (répétable)')
+    parser.add_argument('--index', action='store_true',
+                       help='Écrire aussi rad-index-{type}.json')
+    parser.add_argument('--indent', type=int, default=2,
+                       help='JSON indent (default: 2, use 0 for minified)')
+    parser.add_argument('--format', choices=['records', 'columnar'], default='records',
+                       help='Output layout (voir rad_parser.py --format)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Parse sheets in N worker processes (default: 1)')
+    parser.add_argument('--cache-dir',
+                       help='Reuse parsed sheets whose content did not change (cache directory)')
+    parser.add_argument('--derived-fields',
+                       help='Champs structurés ajoutés aux entrées (voir rad_parser.py --derived-fields)')
+    parser.add_argument('--derived-sections',
+                       help='Sections ajoutées à la sortie (voir rad_parser.py --derived-sections)')
+    parser.add_argument('--workers', type=int,
+                       help='Téléchargements simultanés (default: un par fichier trouvé)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Affichage détaillé')
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
+    try:
+        results = run_pipeline(
+            args.output_dir,
+            raw_dir=args.raw_dir,
+            types=args.only,
+            workers=args.workers,
+            index=args.index,
+            indent=args.indent,
+            output_format=args.format,
+            jobs=args.jobs,
+            cache_dir=args.cache_dir,
+            derived_fields=[f.strip() for f in args.derived_fields.split(',')] if args.derived_fields else None,
+            derived_sections=[s.strip() for s in args.derived_sections.split(',')] if args.derived_sections else None
+        )
+
+        if not results or not all(results.values()):
+            failed = [rad_type for rad_type, ok in results.items() if not ok]
+            if failed:
+                logger.error(f"❌ Échec pour: {', '.join(failed)}")
+            return 1
+
+        logger.info(f"🎉 Pipeline terminé: {', '.join(results)}")
+        return 0
+
+    except KeyboardInterrupt:
+        logger.warning("\n⚠️  Pipeline interrompu par l'utilisateur")
+        return 1
+    except Exception as e:
+        logger.error(f"❌ Erreur inattendue: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+RAD Query - Recherche et décodage des messages d'erreur côté serveur
+
+Usage:
+    python rad_query.py rad-data.json "RS: TRAFFIC VIA OMASI IS ON FORBIDDEN ROUTE REF:[LSLF1139C] RAD ANNEX 2B LSASFRA"
+    python rad_query.py rad-data.json --id LSLF1139C
+    python rad_query.py rad-data.json --aerodrome EDDF --json
+
+    from rad_query import RADIndex
+    index = RADIndex.load('rad-data-current.json')
+    index.decode("... REF:[LSLF1139C] RAD ANNEX 2B LSASFRA")
+
+Équivalent Python de RADSearchEngine.searchByError (searchEngine.js), sans
+parcours linéaire: au chargement, les entrées de toutes les annexes sont
+aplaties (même ordre que le frontend et rad_index) et des tables de hachage
+associent chaque valeur normalisée aux positions des entrées:
+    - id          → normalize_id (sans crochets ni espaces, majuscules)
+    - aerodrome
+    - point       → from_point, to_point, point_or_airspace, first_pt_star,
+                    last_pt_sid, dct_arr_pt, dct_dep_pt
+    - airway
+    - airspace    → airspace, point_or_airspace, atc_unit
+Un message d'erreur est découpé en code REF, annexe, points et espace aérien,
+puis résolu par ces index: le code REF d'abord, puis les points mentionnés
+(filtrés par annexe et espace aérien), puis l'espace aérien seul.
+"""
+
+import argparse
+import json
+import logging
+import re
+import sys
+
+from rad_columnar import load_rad_json
+from rad_index import build_inverted_index, normalize_id, tokenize
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Index de RADIndex → champs des entrées qui l'alimentent
+INDEX_FIELDS = {
+    'id': ('id',),
+    'aerodrome': ('aerodrome',),
+    'point': ('from_point', 'to_point', 'point_or_airspace', 'first_pt_star',
+              'last_pt_sid', 'dct_arr_pt', 'dct_dep_pt'),
+    'airway': ('airway',),
+    'airspace': ('airspace', 'point_or_airspace', 'atc_unit'),
+}
+
+# Motifs des messages eurofpl/IFPS (mêmes règles que _extractErrorInfo)
+REF_PATTERN = re.compile(r'REF:\s*\[?([A-Z0-9]+)\]?')
+ANNEX_PATTERN = re.compile(r'ANNEX\s+(\d[A-C]?)\b(?:\s+([A-Z][A-Z0-9]{2,}))?')
+POINT_PATTERN = re.compile(r'\b[A-Z]{5}\b')
+
+# Mots de 5 lettres des messages qui ne sont pas des points
+EXCLUDED_WORDS = frozenset(['ANNEX', 'ROUTE', 'TRAFFIC', 'ERROR'])
+
+# Type d'erreur: le dernier motif trouvé l'emporte, comme dans le frontend
+ERROR_TYPES = (
+    ('FORBIDDEN', 'FORBIDDEN'),
+    ('RESTRICTED', 'RESTRICTED'),
+    ('NOT AVAILABLE', 'NOT_AVAILABLE'),
+)
+
+DEFAULT_LIMIT = 20
+
+
+def parse_error_message(message: str):
+    """Découpe un message d'erreur en code REF, annexe, points, espace aérien et type.
+
+    >>> parse_error_message("RS: TRAFFIC VIA OMASI IS ON FORBIDDEN ROUTE "
+    ...                     "REF:[LSLF1139C] RAD ANNEX 2B LSASFRA")['airspace']
+    'LSASFRA'
+    """
+    info = {
+        'ref_code': None,
+        'annex': None,
+        'points': [],
+        'airspace': None,
+        'type': None,
+    }
+
+    if not message:
+        return info
+
+    upper = message.upper()
+
+    ref_match = REF_PATTERN.search(upper)
+    if ref_match:
+        info['ref_code'] = ref_match.group(1)
+
+    # "RAD ANNEX 2B LSASFRA": l'espace aérien suit la référence d'annexe
+    annex_match = ANNEX_PATTERN.search(upper)
+    if annex_match:
+        info['annex'] = annex_match.group(1)
+        info['airspace'] = annex_match.group(2)
+
+    points = dict.fromkeys(POINT_PATTERN.findall(upper))
+    info['points'] = [point for point in points if point not in EXCLUDED_WORDS]
+
+    for pattern, error_type in ERROR_TYPES:
+        if pattern in upper:
+            info['type'] = error_type
+
+    return info
+
+
+class RADIndex:
+    """Index en mémoire d'une sortie du parser (ID, aérodrome, point, airway, espace aérien)."""
+
+    def __init__(self, data: dict):
+        self.metadata = data.get('metadata', {})
+
+        # Entrées aplaties dans l'ordre du JSON (positions communes à tous les index)
+        self.records = [
+            record
+            for records in data['annexes'].values() if isinstance(records, list)
+            for record in records
+        ]
+
+        fields = tuple(dict.fromkeys(
+            field for index_fields in INDEX_FIELDS.values() for field in index_fields
+        ))
+        inverted = build_inverted_index(data, fields)['fields']
+
+        self.indexes = {}
+        for name, index_fields in INDEX_FIELDS.items():
+            if len(index_fields) == 1:
+                self.indexes[name] = inverted[index_fields[0]]
+                continue
+
+            # Plusieurs champs: positions fusionnées, triées et sans doublon
+            merged = {}
+            for field in index_fields:
+                for key, offsets in inverted[field].items():
+                    merged.setdefault(key, set()).update(offsets)
+            self.indexes[name] = {key: sorted(offsets) for key, offsets in merged.items()}
+
+    @classmethod
+    def load(cls, path: str):
+        """Charge une sortie du parser (format entrées ou colonnes)."""
+        return cls(load_rad_json(path))
+
+    def __len__(self):
+        return len(self.records)
+
+    def _lookup(self, index: str, key: str, annex: str = None):
+        offsets = self.indexes[index].get(key, [])
+        records = [self.records[offset] for offset in offsets]
+        if annex:
+            records = [record for record in records if record.get('annex') == annex]
+        return records
+
+    def by_id(self, rad_id: str, annex: str = None):
+        """Entrées d'un ID RAD (ex: '[LSLF1139C]'), éventuellement d'une annexe ('2B')."""
+        return self._lookup('id', normalize_id(rad_id), annex)
+
+    def by_aerodrome(self, icao: str, annex: str = None):
+        """Entrées d'un aérodrome OACI (Annex 3A ARR/DEP...)."""
+        return self._lookup('aerodrome', icao.strip().upper(), annex)
+
+    def by_point(self, point: str, annex: str = None):
+        """Entrées mentionnant un point (From/To, Point or Airspace, STAR/SID, DCT)."""
+        return self._lookup('point', point.strip().upper(), annex)
+
+    def by_airway(self, airway: str, annex: str = None):
+        """Entrées d'une airway (ex: 'UN871')."""
+        return self._lookup('airway', airway.strip().upper(), annex)
+
+    def by_airspace(self, airspace: str, annex: str = None):
+        """Entrées d'un espace aérien (Airspace, Point or Airspace, ATC Unit)."""
+        return self._lookup('airspace', airspace.strip().upper(), annex)
+
+    def search(self, query: str, annex: str = None, nas_fab: str = None,
+               change_indicator: str = None, limit: int = 50):
+        """Entrées dont un index contient chaque identifiant de la requête, filtrées.
+
+        Filtres équivalents à RADSearchEngine.search (annexe exacte, NAS/FAB
+        contenu, indicateur de changement). Les identifiants sont combinés en
+        ET: dès qu'un mot de la requête est indexé, un mot absent de tous les
+        index donne un résultat vide (ex: "OMASI ZZZZZ"). Sans aucun
+        identifiant indexé dans la requête (texte libre), repli sur
+        searchable_text.
+        """
+        offsets = None
+        unmatched = False
+        for token in tokenize(query or ''):
+            matched = set()
+            for index in self.indexes.values():
+                matched.update(index.get(token, ()))
+            if not matched:
+                unmatched = True
+                continue
+            offsets = matched if offsets is None else offsets & matched
+
+        if offsets is not None and unmatched:
+            return []
+
+        if offsets is None:
+            needle = (query or '').strip().upper()
+            if len(needle) < 2:
+                return []
+            candidates = (record for record in self.records
+                          if needle in (record.get('searchable_text') or ''))
+        else:
+            candidates = (self.records[offset] for offset in sorted(offsets))
+
+        results = []
+        for record in candidates:
+            if annex and record.get('annex') != annex:
+                continue
+            if nas_fab and nas_fab not in (record.get('nas_fab') or ''):
+                continue
+            if change_indicator and (record.get('change_indicator') or '').upper() != change_indicator.upper():
+                continue
+            results.append(record)
+            if len(results) >= limit:
+                break
+
+        return results
+
+    def _resolve_points(self, points: list, annex: str = None, airspace: str = None,
+                        limit: int = DEFAULT_LIMIT):
+        """Entrées mentionnant le plus de points du message, dans l'ordre du JSON."""
+        hits = {}
+        for point in points:
+            for offset in self.indexes['point'].get(point, []):
+                hits[offset] = hits.get(offset, 0) + 1
+
+        if annex:
+            hits = {offset: count for offset, count in hits.items()
+                    if self.records[offset].get('annex') == annex}
+
+        # L'espace aérien du message départage les candidats, sans les exclure
+        # (la règle peut porter sur un point sans mentionner l'espace aérien)
+        if airspace:
+            in_airspace = set(self.indexes['airspace'].get(airspace, []))
+            if in_airspace & hits.keys():
+                hits = {offset: count for offset, count in hits.items() if offset in in_airspace}
+
+        ranked = sorted(hits, key=lambda offset: (-hits[offset], offset))
+        return [self.records[offset] for offset in ranked[:limit]]
+
+    def decode(self, message: str, limit: int = DEFAULT_LIMIT):
+        """Décode un message d'erreur: informations extraites + entrées correspondantes.
+
+        `match` indique l'index qui a résolu le message: 'ref', 'points',
+        'airspace', ou None si rien n'a été trouvé.
+        """
+        info = parse_error_message(message)
+        annex = info['annex']
+        matches, match = [], None
+
+        # Priorité 1: code de référence (restreint à l'annexe citée si possible)
+        if info['ref_code']:
+            matches = self.by_id(info['ref_code'])
+            if annex and len(matches) > 1:
+                matches = [record for record in matches if record.get('annex') == annex] or matches
+            match = 'ref' if matches else None
+
+        # Priorité 2: points mentionnés
+        if not matches and info['points']:
+            matches = self._resolve_points(info['points'], annex, info['airspace'], limit)
+            match = 'points' if matches else None
+
+        # Priorité 3: espace aérien de la référence d'annexe
+        if not matches and info['airspace']:
+            matches = self.by_airspace(info['airspace'], annex)[:limit]
+            match = 'airspace' if matches else None
+
+        return {**info, 'match': match, 'matches': matches}
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description='Recherche dans une sortie du parser RAD et décodage des erreurs eurofpl',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python rad_query.py rad-data.json "TRAFFIC VIA OMASI IS ON FORBIDDEN ROUTE REF:[LSLF1139C] RAD ANNEX 2B LSASFRA"
+  python rad_query.py rad-data.json --id LSLF1139C
+  python rad_query.py rad-data.json --aerodrome EDDF --annex 3A --json
+        """
+    )
+
+    parser.add_argument('input', help='Sortie du parser (rad-data.json, entrées ou colonnes)')
+    parser.add_argument('message', nargs='?', help='Message d\'erreur à décoder')
+    parser.add_argument('--id', help='Recherche par ID RAD')
+    parser.add_argument('--aerodrome', help='Recherche par aérodrome OACI')
+    parser.add_argument('--point', help='Recherche par point')
+    parser.add_argument('--airway', help='Recherche par airway')
+    parser.add_argument('--airspace', help='Recherche par espace aérien')
+    parser.add_argument('--annex', help='Limiter les recherches directes à une annexe (ex: 2B, 3A)')
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT,
+                       help=f'Nombre maximal d\'entrées affichées (default: {DEFAULT_LIMIT})')
+    parser.add_argument('--json', action='store_true',
+                       help='Afficher le résultat complet en JSON')
+
+    args = parser.parse_args()
+
+    lookups = [(name, getattr(args, name)) for name in ('id', 'aerodrome', 'point', 'airway', 'airspace')
+               if getattr(args, name)]
+    if not args.message and not lookups:
+        parser.error('un message ou une recherche (--id, --aerodrome...) est requis')
+
+    try:
+        index = RADIndex.load(args.input)
+    except FileNotFoundError as e:
+        logger.error(f"❌ {e}")
+        return 1
+
+    logger.info(f"📇 {len(index)} entrées indexées (cycle {index.metadata.get('cycle')})")
+
+    if args.message:
+        result = index.decode(args.message, limit=args.limit)
+    else:
+        name, value = lookups[0]
+        matches = getattr(index, f'by_{name}')(value, args.annex)
+        result = {'match': name if matches else None, 'matches': matches[:args.limit]}
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return 0 if result['matches'] else 1
+
+    if args.message:
+        logger.info(
+            f"🔎 REF {result['ref_code'] or '-'}, annexe {result['annex'] or '-'}, "
+            f"points {', '.join(result['points']) or '-'}, espace aérien {result['airspace'] or '-'}"
+        )
+
+    if not result['matches']:
+        logger.warning("⚠️  Aucune entrée trouvée")
+        return 1
+
+    logger.info(f"✅ {len(result['matches'])} entrée(s) ({result['match']})")
+    for record in result['matches']:
+        summary = record.get('utilization') or record.get('definition') or record.get('condition') or ''
+        print(f"{record.get('id', ''):<12} {record.get('annex', ''):<3} {record.get('type', '')}: {summary}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+RAD Route - Règles candidates pour une route déposée (Annex 2B, 3A, 3B DCT)
+
+Usage:
+    python rad_route.py rad-data.json "LSGG DCT OMASI UN871 BALSI DCT EDDF"
+    python rad_route.py rad-data.json --routes routes.txt -o candidates.jsonl
+
+    from rad_route import RouteChecker
+    checker = RouteChecker.load('rad-data-current.json')
+    checker.check("LSGG OMASI1A OMASI UN871 BALSI DCT EDDF")
+
+La route (item 15 du plan de vol, éventuellement encadrée des aérodromes de
+départ et d'arrivée) est découpée une fois en points, airways et segments
+(from, via, to): vitesses/niveaux ("N0450F350", "OMASI/N0450F350") ignorés,
+procédures SID/STAR ("OMASI1A") ramenées à leur point, codes OACI à 4
+lettres en tête et en fin de route pris comme aérodromes DEP/ARR.
+
+Au chargement, des tables de hachage associent aux entrées (positions dans
+les entrées aplaties, même ordre que le frontend et rad_index):
+    - point       → Annex 2B point_or_airspace, from_point, to_point
+    - airway      → Annex 2B airway
+    - from/to     → Annex 2B (from_point, to_point), dans l'ordre de la route
+    - DCT from/to → Annex 3B DCT (from_point, to_point), segment DCT de la
+                    route, dans un sens ou dans l'autre
+    - aérodrome   → Annex 3A arrivées (ARR) et départs (DEP), avec
+                    first_pt_star / last_pt_sid sur la route
+Chaque élément de la route donne lieu à une recherche par table: le coût est
+linéaire en longueur de route (plus le nombre de règles candidates).
+Une règle candidate n'est pas forcément violée: les raisons (`reasons`)
+disent quelle partie de la route l'a sélectionnée.
+"""
+
+import argparse
+import json
+import logging
+import re
+import sys
+import time
+from itertools import product
+
+from rad_columnar import load_rad_json
+from rad_index import tokenize
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Annexes consultées (clé JSON de la sortie du parser)
+RULES_ANNEX = 'annex2b_rules'
+ARRIVALS_ANNEX = 'annex3a_arrivals'
+DEPARTURES_ANNEX = 'annex3a_departures'
+DCT_ANNEX = 'annex3b_dct'
+
+# Éléments de l'item 15
+AERODROME_PATTERN = re.compile(r'^[A-Z]{4}$')
+AIRWAY_PATTERN = re.compile(r'^[A-Z]{1,3}\d{1,4}[A-Z]?$')
+PROCEDURE_PATTERN = re.compile(r'^([A-Z]{4,5})\d[A-Z]?$')
+SPEED_LEVEL_PATTERN = re.compile(r'^[NKM]\d{3,4}(?:[FAS]\d{3,4}|VFR)$')
+
+# Mots de la route qui ne sont ni des points ni des airways
+ROUTE_KEYWORDS = frozenset(['DCT', 'SID', 'STAR', 'IFR', 'VFR', 'OAT', 'GAT', 'IFPSTOP', 'IFPSTART'])
+
+
+def parse_route(route: str, dep: str = None, arr: str = None):
+    """Découpe une route en aérodromes, points, airways et segments (from, via, to).
+
+    `via` vaut l'airway, 'DCT', 'SID'/'STAR' (procédure vers/depuis un
+    aérodrome) ou None (aérodrome relié au premier point sans indication).
+
+    >>> parse_route("LSGG DCT OMASI UN871 BALSI EDDF")['segments']
+    [('LSGG', 'DCT', 'OMASI'), ('OMASI', 'UN871', 'BALSI'), ('BALSI', None, 'EDDF')]
+    """
+    tokens = []
+    for token in (route or '').upper().split():
+        # "OMASI/N0450F350": changement de vitesse/niveau sur un point
+        token = token.split('/', 1)[0]
+        if token and not SPEED_LEVEL_PATTERN.match(token):
+            tokens.append(token)
+
+    dep = dep.strip().upper() if dep else None
+    arr = arr.strip().upper() if arr else None
+    if tokens and AERODROME_PATTERN.match(tokens[0]) and dep in (None, tokens[0]):
+        dep = tokens.pop(0)
+    if tokens and AERODROME_PATTERN.match(tokens[-1]) and arr in (None, tokens[-1]):
+        arr = tokens.pop()
+
+    points, airways, segments = [], [], []
+    via = None
+    if dep:
+        points.append(dep)
+
+    for token in tokens:
+        procedure = PROCEDURE_PATTERN.match(token)
+        if procedure:
+            # SID en tête de route, STAR en fin: le point de la procédure
+            via = 'SID' if len(points) <= 1 else 'STAR'
+            token = procedure.group(1)
+        elif token == 'DCT':
+            via = 'DCT'
+            continue
+        elif token in ROUTE_KEYWORDS:
+            continue
+        elif AIRWAY_PATTERN.match(token):
+            via = token
+            airways.append(token)
+            continue
+
+        if points and token == points[-1]:
+            continue
+        if points:
+            # Deux points sans rien entre eux: DCT implicite (sauf depuis l'aérodrome)
+            if via is None and not (dep and len(points) == 1):
+                via = 'DCT'
+            segments.append((points[-1], via, token))
+        points.append(token)
+        via = 'STAR' if via == 'STAR' else None
+
+    if arr:
+        if points and arr != points[-1]:
+            segments.append((points[-1], via if via in ('DCT', 'STAR') else None, arr))
+        points.append(arr)
+
+    return {
+        'dep': dep,
+        'arr': arr,
+        'points': points,
+        'airways': list(dict.fromkeys(airways)),
+        'segments': segments,
+    }
+
+
+def _add(index: dict, key, offset: int):
+    index.setdefault(key, []).append(offset)
+
+
+class RouteChecker:
+    """Index des règles RAD par point, airway, paire from/to et aérodrome."""
+
+    def __init__(self, data: dict):
+        self.metadata = data.get('metadata', {})
+        self.records = []
+
+        self.points = {}         # 2B point_or_airspace / from_point / to_point
+        self.airways = {}        # 2B airway
+        self.pairs = {}          # 2B from_point → [(to_point, offset)]
+        self.dct = {}            # 3B DCT (from_point, to_point)
+        self.arrivals = {}       # 3A aerodrome (ARR)
+        self.departures = {}     # 3A aerodrome (DEP)
+
+        for json_key, records in data['annexes'].items():
+            if not isinstance(records, list):
+                continue
+
+            for record in records:
+                offset = len(self.records)
+                self.records.append(record)
+
+                if json_key == RULES_ANNEX:
+                    self._index_rule(record, offset)
+                elif json_key == DCT_ANNEX:
+                    for pair in product(tokenize(record.get('from_point') or ''),
+                                        tokenize(record.get('to_point') or '')):
+                        _add(self.dct, pair, offset)
+                elif json_key in (ARRIVALS_ANNEX, DEPARTURES_ANNEX):
+                    index = self.arrivals if json_key == ARRIVALS_ANNEX else self.departures
+                    for aerodrome in tokenize(record.get('aerodrome') or ''):
+                        _add(index, aerodrome, offset)
+
+    def _index_rule(self, record: dict, offset: int):
+        from_points = tokenize(record.get('from_point') or '')
+        to_points = tokenize(record.get('to_point') or '')
+        points = dict.fromkeys([*tokenize(record.get('point_or_airspace') or ''), *from_points, *to_points])
+
+        for point in points:
+            _add(self.points, point, offset)
+        for airway in tokenize(record.get('airway') or ''):
+            _add(self.airways, airway, offset)
+        for from_point, to_point in product(from_points, to_points):
+            _add(self.pairs, from_point, (to_point, offset))
+
+    @classmethod
+    def load(cls, path: str):
+        """Charge une sortie du parser (format entrées ou colonnes)."""
+        return cls(load_rad_json(path))
+
+    def __len__(self):
+        return len(self.records)
+
+    def candidates(self, route: dict):
+        """{offset: [raisons]} des règles candidates d'une route découpée (parse_route)."""
+        hits = {}
+
+        def hit(offsets, reason):
+            for offset in offsets:
+                if offset in hits:
+                    hits[offset].append(reason)
+                else:
+                    hits[offset] = [reason]
+
+        points = route['points']
+        # Première et dernière position de chaque point: une paire from/to est
+        # dans l'ordre de la route si to apparaît après from
+        first_position, last_position = {}, {}
+        for position, point in enumerate(points):
+            first_position.setdefault(point, position)
+            last_position[point] = position
+
+        for point, position in first_position.items():
+            hit(self.points.get(point, ()), f'point:{point}')
+            for to_point, offset in self.pairs.get(point, ()):
+                if last_position.get(to_point, -1) > position:
+                    hit((offset,), f'segment:{point}-{to_point}')
+
+        for airway in route['airways']:
+            hit(self.airways.get(airway, ()), f'airway:{airway}')
+
+        for from_point, to_point in dict.fromkeys(
+            (from_point, to_point) for from_point, via, to_point in route['segments'] if via == 'DCT'
+        ):
+            offsets = self.dct.get((from_point, to_point), [])
+            if from_point != to_point:
+                offsets = offsets + self.dct.get((to_point, from_point), [])
+            hit(offsets, f'dct:{from_point}-{to_point}')
+
+        # Règles 3A de l'aérodrome, avec leur SID/STAR présent sur la route
+        for aerodrome, index, kind, field, label in (
+            (route['dep'], self.departures, 'dep', 'last_pt_sid', 'sid'),
+            (route['arr'], self.arrivals, 'arr', 'first_pt_star', 'star'),
+        ):
+            if not aerodrome:
+                continue
+            for offset in index.get(aerodrome, ()):
+                reasons = hits.setdefault(offset, [])
+                reasons.append(f'{kind}:{aerodrome}')
+                reasons.extend(f'{label}:{point}' for point in tokenize(self.records[offset].get(field) or '')
+                               if point in first_position)
+
+        return hits
+
+    def check(self, route: str, dep: str = None, arr: str = None):
+        """Route découpée + règles candidates (id, annexe, type, raisons), dans l'ordre du JSON."""
+        parsed = parse_route(route, dep, arr)
+        hits = self.candidates(parsed)
+        return {
+            **parsed,
+            'candidates': [
+                {
+                    'id': self.records[offset].get('id'),
+                    'annex': self.records[offset].get('annex'),
+                    'type': self.records[offset].get('type'),
+                    'reasons': hits[offset],
+                }
+                for offset in sorted(hits)
+            ],
+        }
+
+
+def check_routes(checker: RouteChecker, lines, output):
+    """Vérifie une route par ligne et écrit une ligne JSON par route; retourne (routes, candidats)."""
+    routes = total = 0
+    for line in lines:
+        route = line.strip()
+        if not route or route.startswith('#'):
+            continue
+        result = checker.check(route)
+        output.write(json.dumps({'route': route, **result}, ensure_ascii=False, separators=(',', ':')) + '\n')
+        routes += 1
+        total += len(result['candidates'])
+    return routes, total
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description='Règles RAD candidates pour une route (Annex 2B, 3A ARR/DEP, 3B DCT)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python rad_route.py rad-data.json "LSGG DCT OMASI UN871 BALSI DCT EDDF"
+  python rad_route.py rad-data.json "OMASI UN871 BALSI" --dep LSGG --arr EDDF --json
+  python rad_route.py rad-data.json --routes routes.txt -o candidates.jsonl
+        """
+    )
+
+    parser.add_argument('input', help='Sortie du parser (rad-data.json, entrées ou colonnes)')
+    parser.add_argument('route', nargs='?', help='Route (item 15, aérodromes DEP/ARR en tête et en fin)')
+    parser.add_argument('--dep', help='Aérodrome de départ (si absent de la route)')
+    parser.add_argument('--arr', help="Aérodrome d'arrivée (si absent de la route)")
+    parser.add_argument('--routes', help="Fichier de routes, une par ligne ('-' pour stdin)")
+    parser.add_argument('-o', '--output', help='Sortie JSONL du mode --routes (défaut: stdout)')
+    parser.add_argument('--json', action='store_true', help='Afficher le résultat complet en JSON')
+
+    args = parser.parse_args()
+
+    if bool(args.route) == bool(args.routes):
+        parser.error('une route ou --routes est requis (pas les deux)')
+
+    try:
+        checker = RouteChecker.load(args.input)
+    except FileNotFoundError as e:
+        logger.error(f"❌ {e}")
+        return 1
+
+    logger.info(f"📇 {len(checker)} entrées indexées (cycle {checker.metadata.get('cycle')})")
+
+    if args.routes:
+        start = time.perf_counter()
+        try:
+            source = sys.stdin if args.routes == '-' else open(args.routes, encoding='utf-8')
+        except FileNotFoundError as e:
+            logger.error(f"❌ {e}")
+            return 1
+
+        output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+        try:
+            routes, total = check_routes(checker, source, output)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if output is not sys.stdout:
+                output.close()
+
+        elapsed = time.perf_counter() - start
+        logger.info(f"✅ {routes} route(s), {total} règle(s) candidate(s) en {elapsed:.2f}s"
+                    f" ({routes / elapsed if elapsed else 0:.0f} routes/s)")
+        return 0
+
+    result = checker.check(args.route, args.dep, args.arr)
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return 0
+
+    logger.info(f"🛫 {result['dep'] or '-'} → {result['arr'] or '-'}: "
+                f"{len(result['points'])} point(s), airways {', '.join(result['airways']) or '-'}")
+    if not result['candidates']:
+        logger.info("✅ Aucune règle candidate")
+        return 0
+
+    logger.info(f"⚠️  {len(result['candidates'])} règle(s) candidate(s)")
+    for candidate in result['candidates']:
+        print(f"{candidate['id'] or '':<12} {candidate['annex'] or '':<3} {', '.join(candidate['reasons'])}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+RAD Server - Service HTTP local de recherche et de décodage RAD
+
+Usage:
+    python rad_server.py [--data-dir ../frontend/public] [--port 8765]
+
+Exemple:
+    python rad_server.py --data-dir ../frontend/public --port 8765 --cache-size 4096
+    curl 'http://127.0.0.1:8765/decode?message=REF:[LSLF1139C]%20RAD%20ANNEX%202B'
+
+Charge une seule fois rad-data-current.json et rad-data-future.json (toutes
+les versions listées dans rad-versions.json) et les indexe avec RADIndex
+(rad_query). Endpoints (JSON, paramètre `version`: current, future, auto):
+
+    GET  /health                      état, versions chargées, cache
+    GET  /versions                    contenu de rad-versions.json
+    GET  /rules/<id>                  entrées d'un ID RAD
+    GET  /decode?message=...          décodage d'un message d'erreur eurofpl
+    POST /decode   {"message": ...}
+    GET  /search?q=...&annex=&nas_fab=&change=&limit=
+    POST /batch    {"messages": [...], "version": ...}
+
+Les décodages sont gardés dans un cache LRU propre à chaque jeu de données.
+Quand rad-versions.json change (nouveau cycle publié par la CI), les JSON
+sont rechargés dans un thread séparé puis remplacés d'un bloc: chaque
+requête travaille sur le jeu de données lu à son arrivée, les requêtes en
+cours ne sont donc ni interrompues ni servies avec des versions mélangées.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import threading
+from datetime import date, datetime
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
+
+from rad_query import DEFAULT_LIMIT, RADIndex
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+VERSIONS_FILENAME = 'rad-versions.json'
+DEFAULT_TYPES = ('current', 'future')
+
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_SIZE = 4096
+DEFAULT_RELOAD_INTERVAL = 5.0
+
+# Bornes des requêtes (un client ne bloque pas le service)
+MAX_BATCH_MESSAGES = 10000
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAX_SEARCH_LIMIT = 500
+
+
+class RequestError(ValueError):
+    """Requête invalide (réponse 400, ou `status`)."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+class RADSnapshot:
+    """Jeu de données immuable: versions et index chargés ensemble."""
+
+    def __init__(self, data_dir: Path, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.loaded_at = datetime.now().isoformat()
+
+        versions_path = data_dir / VERSIONS_FILENAME
+        if versions_path.exists():
+            with open(versions_path, 'r', encoding='utf-8') as f:
+                self.versions = json.load(f)
+            types = list(self.versions.get('versions', {})) or list(DEFAULT_TYPES)
+        else:
+            self.versions = None
+            types = list(DEFAULT_TYPES)
+
+        self.indexes = {}
+        for rad_type in types:
+            path = data_dir / f"rad-data-{rad_type}.json"
+            if not path.exists():
+                logger.warning(f"⚠️  {path.name} absent, version {rad_type} indisponible")
+                continue
+            self.indexes[rad_type] = RADIndex.load(path)
+            logger.info(f"📇 {rad_type}: {len(self.indexes[rad_type])} entrées indexées")
+
+        if not self.indexes:
+            raise FileNotFoundError(f"Aucun fichier rad-data-*.json dans {data_dir}")
+
+        # Cache LRU propre à ce jeu de données (vidé de fait au rechargement)
+        self.decode = lru_cache(maxsize=cache_size)(self._decode)
+
+    def resolve_type(self, rad_type: str = None):
+        """Version demandée; 'auto' choisit comme le frontend (selectVersionByDate)."""
+        rad_type = rad_type or 'current'
+
+        if rad_type == 'auto':
+            rad_type = 'current'
+            future = ((self.versions or {}).get('versions') or {}).get('future') or {}
+            effective = future.get('effectiveDate')
+            if effective and 'future' in self.indexes and date.today().isoformat() >= effective:
+                rad_type = 'future'
+
+        if rad_type not in self.indexes:
+            raise RequestError(f"Version inconnue: {rad_type} (disponibles: {', '.join(self.indexes)})", 404)
+        return rad_type
+
+    def _decode(self, rad_type: str, message: str, limit: int):
+        return self.indexes[rad_type].decode(message, limit=limit)
+
+
+class RADStore:
+    """Jeu de données courant, rechargé quand rad-versions.json change."""
+
+    def __init__(self, data_dir: str, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.data_dir = Path(data_dir)
+        self.cache_size = cache_size
+        self._signature = self._versions_signature()
+        self.snapshot = RADSnapshot(self.data_dir, cache_size)
+        self._stop = threading.Event()
+
+    def _versions_signature(self):
+        try:
+            stat = (self.data_dir / VERSIONS_FILENAME).stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload_if_changed(self):
+        """Recharge si rad-versions.json a changé; retourne True si remplacé."""
+        signature = self._versions_signature()
+        if signature == self._signature:
+            return False
+
+        # Retenir la signature même en cas d'échec: nouvelle tentative au prochain changement
+        self._signature = signature
+        logger.info(f"🔄 {VERSIONS_FILENAME} modifié, rechargement...")
+
+        try:
+            snapshot = RADSnapshot(self.data_dir, self.cache_size)
+        except Exception as e:
+            logger.error(f"❌ Rechargement impossible, données précédentes conservées: {e}")
+            return False
+
+        # Remplacement d'un bloc (affectation atomique): les requêtes en cours
+        # gardent la référence à l'ancien jeu de données
+        self.snapshot = snapshot
+        logger.info(f"✅ Données rechargées ({', '.join(snapshot.indexes)})")
+        return True
+
+    def watch(self, interval: float = DEFAULT_RELOAD_INTERVAL):
+        """Surveille rad-versions.json dans un thread démon."""
+        def run():
+            while not self._stop.wait(interval):
+                self.reload_if_changed()
+
+        thread = threading.Thread(target=run, name='rad-reload', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+
+
+def _limit(value, default: int = DEFAULT_LIMIT):
+    try:
+        limit = int(value) if value is not None else default
+    except (TypeError, ValueError):
+        raise RequestError(f"limit invalide: {value}")
+    return max(1, min(limit, MAX_SEARCH_LIMIT))
+
+
+class RADRequestHandler(BaseHTTPRequestHandler):
+    """Endpoints JSON; le jeu de données est lu une fois par requête."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'RADServer/1.0'
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send_json(self, payload, status: int = 200):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            # Corps non lu: la connexion ne peut pas être réutilisée
+            self.close_connection = True
+            if length < 0:
+                raise RequestError('En-tête Content-Length invalide')
+            raise RequestError('Corps de requête trop volumineux', 413)
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError as e:
+            raise RequestError(f"JSON invalide: {e}")
+        if not isinstance(body, dict):
+            raise RequestError('Le corps de la requête doit être un objet JSON')
+        return body
+
+    def _dispatch(self, method: str):
+        snapshot = self.server.store.snapshot
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        body = self._read_json() if method == 'POST' else {}
+        path = url.path.rstrip('/') or '/'
+
+        if method == 'GET' and path == '/health':
+            return self._health(snapshot)
+
+        if method == 'GET' and path == '/versions':
+            return snapshot.versions or {'versions': {rad_type: {} for rad_type in snapshot.indexes}}
+
+        version = body.get('version') or params.get('version')
+
+        if method == 'GET' and path.startswith('/rules/'):
+            rad_type = snapshot.resolve_type(version)
+            rad_id = unquote(path[len('/rules/'):])
+            matches = snapshot.indexes[rad_type].by_id(rad_id, params.get('annex'))
+            if not matches:
+                raise RequestError(f"ID inconnu: {rad_id}", 404)
+            return {'version': rad_type, 'id': rad_id, 'matches': matches}
+
+        if path == '/decode' and method in ('GET', 'POST'):
+            message = body.get('message') if method == 'POST' else params.get('message')
+            if not message:
+                raise RequestError('Paramètre message requis')
+            if not isinstance(message, str):
+                raise RequestError('Le champ message doit être une chaîne')
+            rad_type = snapshot.resolve_type(version)
+            limit = _limit(body.get('limit') or params.get('limit'))
+            return {'version': rad_type, **snapshot.decode(rad_type, message.strip(), limit)}
+
+        if method == 'GET' and path == '/search':
+            rad_type = snapshot.resolve_type(version)
+            matches = snapshot.indexes[rad_type].search(
+                params.get('q', ''),
+                annex=params.get('annex'),
+                nas_fab=params.get('nas_fab'),
+                change_indicator=params.get('change'),
+                limit=_limit(params.get('limit'), 50),
+            )
+            return {'version': rad_type, 'count': len(matches), 'matches': matches}
+
+        if method == 'POST' and path == '/batch':
+            messages = body.get('messages')
+            if not isinstance(messages, list):
+                raise RequestError('Champ messages (liste) requis')
+            if len(messages) > MAX_BATCH_MESSAGES:
+                raise RequestError(f"Au plus {MAX_BATCH_MESSAGES} messages par requête", 413)
+            if not all(isinstance(message, str) for message in messages):
+                raise RequestError('Chaque élément de messages doit être une chaîne')
+            rad_type = snapshot.resolve_type(version)
+            limit = _limit(body.get('limit'))
+            return {
+                'version': rad_type,
+                'results': [snapshot.decode(rad_type, message.strip(), limit) for message in messages],
+            }
+
+        raise RequestError(f"Endpoint inconnu: {method} {url.path}", 404)
+
+    def _health(self, snapshot: RADSnapshot):
+        cache = snapshot.decode.cache_info()
+        return {
+            'status': 'ok',
+            'loaded_at': snapshot.loaded_at,
+            'versions': {
+                rad_type: {
+                    'cycle': index.metadata.get('cycle'),
+                    'version': index.metadata.get('version'),
+                    'entries': len(index),
+                }
+                for rad_type, index in snapshot.indexes.items()
+            },
+            'cache': {'hits': cache.hits, 'misses': cache.misses,
+                      'size': cache.currsize, 'max_size': cache.maxsize},
+        }
+
+    def _handle(self, method: str):
+        try:
+            self._send_json(self._dispatch(method))
+        except RequestError as e:
+            self._send_json({'error': str(e)}, e.status)
+        except Exception as e:
+            logger.exception(f"❌ Erreur sur {method} {self.path}")
+            self._send_json({'error': f"Erreur interne: {e}"}, 500)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+
+def create_server(store: RADStore, host: str = '127.0.0.1', port: int = DEFAULT_PORT):
+    """Serveur HTTP multi-thread rattaché à un RADStore."""
+    server = ThreadingHTTPServer((host, port), RADRequestHandler)
+    server.daemon_threads = True
+    server.store = store
+    return server
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description='Service HTTP local de recherche et de décodage RAD',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python rad_server.py
+  python rad_server.py --data-dir ../frontend/public --port 8765 --cache-size 4096
+  curl 'http://127.0.0.1:8765/rules/LSLF1139C?version=future'
+  curl -X POST http://127.0.0.1:8765/batch -d '{"messages": ["REF:[LSLF1139C] RAD ANNEX 2B"]}'
+        """
+    )
+
+    parser.add_argument('--data-dir', default='../frontend/public',
+                       help='Répertoire des rad-data-*.json et rad-versions.json (default: ../frontend/public)')
+    parser.add_argument('--host', default='127.0.0.1',
+                       help='Adresse d\'écoute (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                       help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                       help=f'Messages décodés gardés en cache LRU (default: {DEFAULT_CACHE_SIZE})')
+    parser.add_argument('--reload-interval', type=float, default=DEFAULT_RELOAD_INTERVAL,
+                       help=f'Vérification de {VERSIONS_FILENAME} toutes les N secondes, 0 = jamais '
+                            f'(default: {DEFAULT_RELOAD_INTERVAL:g})')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Affichage détaillé (une ligne par requête)')
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
+    try:
+        store = RADStore(args.data_dir, cache_size=args.cache_size)
+    except FileNotFoundError as e:
+        logger.error(f"❌ {e}")
+        return 1
+
+    if args.reload_interval > 0:
+        store.watch(args.reload_interval)
+
+    server = create_server(store, args.host, args.port)
+    logger.info(f"🚀 Service RAD sur http://{args.host}:{server.server_address[1]}/")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("👋 Arrêt du service")
+    finally:
+        store.stop()
+        server.server_close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
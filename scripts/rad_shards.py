@@ -0,0 +1,202 @@
+"""
+RAD Shards - Sortie découpée par annexe (et optionnellement par NAS/FAB)
+
+Au lieu d'un seul fichier contenant toutes les annexes, chaque annexe est
+écrite dans son propre fichier, éventuellement redécoupé par valeur de
+`nas_fab`. Un manifeste décrit chaque shard pour qu'un client ne charge que
+ceux dont une requête a besoin (ex: "RAD ANNEX 2B LSASFRA" → annex2b_rules):
+
+    manifest.json
+    {
+      "format": "rad-shards",
+      "version": 1,
+      "metadata": {...},
+      "stats": {...},
+      "shards": [
+        {
+          "file": "annex2b_rules--FABEC.json",
+          "annex": "annex2b_rules",
+          "nas_fab": "FABEC",
+          "records": 812,
+          "size": 421337,
+          "sha256": "...",
+          "id_prefixes": ["ED", "LF", "LS"]
+        }
+      ]
+    }
+
+Chaque shard contient {"annex", "nas_fab", "records": [...]} (ou
+"columns" au format colonnes, voir rad_columnar).
+
+Usage:
+    python rad_parser.py input.xlsx rad-data.json --shards ../frontend/public/shards --shard-by-fab
+"""
+
+import hashlib
+import json
+import logging
+import re
+from pathlib import Path
+
+import rad_columnar
+
+logger = logging.getLogger(__name__)
+
+SHARDS_FORMAT = 'rad-shards'
+SHARDS_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+
+# Longueur des préfixes d'ID listés dans le manifeste (lettres OACI du pays)
+ID_PREFIX_LENGTH = 2
+
+_UNSAFE_FILENAME = re.compile(r'[^A-Za-z0-9_-]+')
+_ID_PREFIX = re.compile(r'[A-Z]+')
+
+
+def id_prefixes(records: list, length: int = ID_PREFIX_LENGTH):
+    """Préfixes alphabétiques (triés) des IDs couverts par un shard."""
+    prefixes = set()
+    for record in records:
+        match = _ID_PREFIX.match(record.get('id', '').strip().upper())
+        if match:
+            prefixes.add(match.group(0)[:length])
+    return sorted(prefixes)
+
+
+def shard_filename(json_key: str, nas_fab: str = None):
+    """Nom de fichier d'un shard (valeur NAS/FAB assainie, '_' si vide)."""
+    if nas_fab is None:
+        return f"{json_key}.json"
+
+    safe = _UNSAFE_FILENAME.sub('_', nas_fab).strip('_') or '_'
+    return f"{json_key}--{safe}.json"
+
+
+def split_annex(records: list, by_fab: bool):
+    """Découpe une annexe en [(nas_fab, entrées)] en conservant l'ordre des entrées."""
+    # Annexe 1: pas de champ nas_fab, jamais redécoupée
+    if not by_fab or not any('nas_fab' in record for record in records):
+        return [(None, records)]
+
+    groups = {}
+    for record in records:
+        groups.setdefault(record.get('nas_fab', ''), []).append(record)
+    return list(groups.items())
+
+
+def write_shards(data: dict, output_dir: str, by_fab: bool = False,
+                 output_format: str = 'records', indent: int = None):
+    """Écrit les shards et le manifeste; retourne le manifeste."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / MANIFEST_NAME
+
+    previous_files = _manifest_files(manifest_path)
+    shards = []
+    used_names = set()
+
+    for json_key, records in data['annexes'].items():
+        for nas_fab, group in split_annex(records, by_fab):
+            filename = shard_filename(json_key, nas_fab)
+
+            # Deux valeurs NAS/FAB assainies identiques: suffixe numérique
+            base, n = filename[:-len('.json')], 2
+            while filename in used_names:
+                filename = f"{base}-{n}.json"
+                n += 1
+            used_names.add(filename)
+
+            shard = {'annex': json_key, 'nas_fab': nas_fab}
+            if output_format == 'columnar':
+                shard['format'] = rad_columnar.FORMAT_NAME
+                shard['columns'] = rad_columnar.encode_annex(group)
+            else:
+                shard['records'] = group
+
+            payload = _dumps(shard, indent).encode('utf-8')
+            (output_dir / filename).write_bytes(payload)
+
+            shards.append({
+                'file': filename,
+                'annex': json_key,
+                'nas_fab': nas_fab,
+                'records': len(group),
+                'size': len(payload),
+                'sha256': hashlib.sha256(payload).hexdigest(),
+                'id_prefixes': id_prefixes(group),
+            })
+
+    manifest = {
+        'format': SHARDS_FORMAT,
+        'version': SHARDS_VERSION,
+        'metadata': data['metadata'],
+        'stats': data['stats'],
+        'shards': shards,
+    }
+    manifest_path.write_text(_dumps(manifest, indent), encoding='utf-8')
+
+    # Shards d'un run précédent qui n'existent plus (ex: NAS/FAB disparu)
+    for stale in previous_files - used_names:
+        (output_dir / stale).unlink(missing_ok=True)
+
+    total = sum(shard['size'] for shard in shards) / 1024
+    logger.info(f"🧩 {len(shards)} shards écrits dans {output_dir} ({total:.1f} KB)")
+
+    return manifest
+
+
+def _manifest_files(manifest_path: Path):
+    """Fichiers listés dans un manifeste existant (ensemble vide sinon)."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return set()
+
+    if manifest.get('format') != SHARDS_FORMAT:
+        return set()
+
+    # Seuls des noms simples, jamais de chemins: on ne supprime que dans output_dir
+    return {
+        shard['file'] for shard in manifest.get('shards', [])
+        if Path(shard.get('file', '')).name == shard.get('file')
+    }
+
+
+def _dumps(value, indent: int = None):
+    if indent:
+        return json.dumps(value, indent=indent, ensure_ascii=False)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def load_shards(output_dir: str, annexes: list = None, nas_fabs: list = None,
+                id_prefix: str = None):
+    """Recharge les shards utiles à une requête (tous par défaut).
+
+    Returns:
+        dict: {json_key: [entrées]}, dans l'ordre du manifeste
+    """
+    output_dir = Path(output_dir)
+    with open(output_dir / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    result = {}
+    for shard in manifest['shards']:
+        if annexes is not None and shard['annex'] not in annexes:
+            continue
+        if nas_fabs is not None and shard['nas_fab'] is not None and shard['nas_fab'] not in nas_fabs:
+            continue
+        if id_prefix is not None and id_prefix.upper()[:ID_PREFIX_LENGTH] not in shard['id_prefixes']:
+            continue
+
+        with open(output_dir / shard['file'], 'r', encoding='utf-8') as f:
+            content = json.load(f)
+
+        if content.get('format') == rad_columnar.FORMAT_NAME:
+            records = rad_columnar.ColumnarAnnex(content['columns']).records()
+        else:
+            records = content['records']
+
+        result.setdefault(shard['annex'], []).extend(records)
+
+    return result
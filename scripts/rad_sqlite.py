@@ -0,0 +1,173 @@
+"""
+RAD SQLite - Sortie en base SQLite (une table par annexe, index B-tree, FTS5)
+
+Le JSON doit être chargé en entier avant toute requête. La base SQLite se
+requête directement sur disque (fichier mappé en mémoire par connect()):
+
+    metadata       (key, value)            metadata, stats, format et sections
+                                           dérivées (areas...), en JSON
+    annex1_areas, annex2b_rules, ...       une table par annexe, une colonne
+                                           par champ des entrées (texte)
+    rad_search     FTS5 (text, annex, entry)
+                                           remplace searchable_text: `entry`
+                                           est le rowid de l'entrée dans la
+                                           table `annex`
+
+Index B-tree sur id, aerodrome, from_point, to_point, airway et nas_fab
+lorsque la table a ces colonnes. Exemple:
+
+    SELECT r.* FROM rad_search s JOIN annex2b_rules r ON r.rowid = s.entry
+    WHERE rad_search MATCH 'OMASI' AND s.annex = 'annex2b_rules';
+
+Usage:
+    python rad_parser.py input.xlsx rad-data.json --sqlite rad-data.db
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SQLITE_FORMAT = 'rad-sqlite'
+SQLITE_VERSION = 1
+
+# Colonnes indexées (B-tree) quand la table les contient
+INDEXED_COLUMNS = ('id', 'aerodrome', 'from_point', 'to_point', 'airway', 'nas_fab')
+
+FTS_TABLE = 'rad_search'
+SEARCHABLE_FIELD = 'searchable_text'
+
+# Mémoire mappée par connect() pour les lectures
+DEFAULT_MMAP_BYTES = 256 * 1024 * 1024
+
+
+def fts5_available():
+    """SQLite compilé avec FTS5 (cas de la plupart des distributions Python)."""
+    try:
+        with sqlite3.connect(':memory:') as connection:
+            connection.execute('CREATE VIRTUAL TABLE probe USING fts5(text)')
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def annex_fields(records: list, default: list = None):
+    """Champs d'une annexe dans l'ordre des entrées (union, sans doublon)."""
+    fields = dict.fromkeys(default or [])
+    for record in records:
+        if len(record) != len(fields) or record.keys() - fields.keys():
+            fields.update(dict.fromkeys(record))
+    return list(fields)
+
+
+def _quote(name: str):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _sql_value(value):
+    """Valeur stockable: texte et nombres tels quels, structures en JSON."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def write_sqlite(data: dict, output_path: str, fields: dict = None):
+    """Écrit la base (fichier remplacé d'un bloc); retourne sa taille en KB.
+
+    `fields` donne, par annexe, les champs attendus (colonnes créées même si
+    l'annexe est vide).
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    tmp_path.unlink(missing_ok=True)
+
+    fields = fields or {}
+    fts = fts5_available()
+    if not fts:
+        logger.warning("⚠️  SQLite sans FTS5: searchable_text gardé comme colonne")
+
+    connection = sqlite3.connect(tmp_path, isolation_level=None)
+    try:
+        # Fichier temporaire remplacé à la fin: pas besoin de journal ni de fsync
+        connection.execute('PRAGMA journal_mode = OFF')
+        connection.execute('PRAGMA synchronous = OFF')
+        connection.execute(f'PRAGMA user_version = {SQLITE_VERSION}')
+
+        # Tout le contenu dans une seule transaction
+        connection.execute('BEGIN')
+
+        connection.execute('CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT)')
+        connection.executemany('INSERT INTO metadata VALUES (?, ?)', [
+            ('format', json.dumps(SQLITE_FORMAT)),
+            ('metadata', json.dumps(data.get('metadata', {}), ensure_ascii=False)),
+            ('stats', json.dumps(data.get('stats', {}), ensure_ascii=False)),
+            *(
+                (name, json.dumps(value, ensure_ascii=False))
+                for name, value in data.items() if name not in ('metadata', 'annexes', 'stats')
+            ),
+        ])
+
+        if fts:
+            connection.execute(
+                f'CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(text, annex UNINDEXED, entry UNINDEXED)'
+            )
+
+        for json_key, records in data['annexes'].items():
+            if not isinstance(records, list):
+                continue
+
+            columns = annex_fields(records, fields.get(json_key))
+            if fts:
+                columns = [column for column in columns if column != SEARCHABLE_FIELD]
+
+            table = _quote(json_key)
+            connection.execute(
+                f'CREATE TABLE {table} ({", ".join(f"{_quote(column)} TEXT" for column in columns)})'
+            )
+
+            # rowid explicite (1..n): même ordre que le JSON, référencé par rad_search
+            placeholders = ', '.join('?' * (len(columns) + 1))
+            connection.executemany(
+                f'INSERT INTO {table} (rowid, {", ".join(map(_quote, columns))}) VALUES ({placeholders})',
+                (
+                    (rowid, *(_sql_value(record.get(column)) for column in columns))
+                    for rowid, record in enumerate(records, 1)
+                )
+            )
+
+            if fts:
+                connection.executemany(
+                    f'INSERT INTO {FTS_TABLE} (text, annex, entry) VALUES (?, ?, ?)',
+                    (
+                        (record.get(SEARCHABLE_FIELD) or '', json_key, rowid)
+                        for rowid, record in enumerate(records, 1)
+                    )
+                )
+
+            # Index créés après l'insertion (plus rapide qu'une mise à jour ligne à ligne)
+            for column in INDEXED_COLUMNS:
+                if column in columns:
+                    connection.execute(
+                        f'CREATE INDEX {_quote(f"idx_{json_key}_{column}")} ON {table} ({_quote(column)})'
+                    )
+
+        connection.execute('COMMIT')
+        connection.execute('ANALYZE')
+    finally:
+        connection.close()
+
+    os.replace(tmp_path, output_path)
+    return output_path.stat().st_size / 1024
+
+
+def connect(path: str, mmap_bytes: int = DEFAULT_MMAP_BYTES):
+    """Connexion en lecture seule, fichier mappé en mémoire."""
+    connection = sqlite3.connect(f'file:{Path(path).as_posix()}?mode=ro', uri=True,
+                                 check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+    connection.execute(f'PRAGMA mmap_size = {int(mmap_bytes)}')
+    return connection
@@ -0,0 +1,72 @@
+"""
+RAD Stream - Écriture JSON en flux de la sortie du parser
+
+Produit exactement les mêmes octets que json.dump(data, indent=indent,
+ensure_ascii=False) sur {"metadata", "annexes", "stats"}, mais annexe par
+annexe: chaque liste d'entrées peut être libérée dès qu'elle est écrite.
+Les stats (suivies des sections dérivées éventuelles, ex: areas) sont
+écrites à la fin, une fois toutes les annexes connues.
+
+Usage (via le parser):
+    python rad_parser.py input.xlsx output.json --stream
+"""
+
+import json
+
+
+class StreamingJSONWriter:
+    """Écrit {"metadata": ..., "annexes": {...}, "stats": ...} morceau par morceau."""
+
+    def __init__(self, f, indent: int = 2):
+        self.f = f
+        self.indent = indent
+        # Mêmes séparateurs que json.dump selon que l'indentation est active
+        self.item_separator = ',' if indent is not None else ', '
+        self._annex_count = 0
+
+    def _newline(self, level: int):
+        if self.indent is None:
+            return ''
+        return '\n' + ' ' * (self.indent * level)
+
+    def _dumps(self, value, level: int):
+        """json.dumps d'une valeur imbriquée à `level` niveaux de profondeur."""
+        text = json.dumps(value, indent=self.indent, ensure_ascii=False)
+        if self.indent is None:
+            return text
+        return text.replace('\n', self._newline(level))
+
+    def begin(self, metadata: dict):
+        """Ouvre le document et écrit les métadonnées."""
+        self.f.write(
+            '{' + self._newline(1) + '"metadata": ' + self._dumps(metadata, 1)
+            + self.item_separator + self._newline(1) + '"annexes": {'
+        )
+
+    def write_annex(self, json_key: str, records: list):
+        """Écrit une annexe complète (les entrées peuvent ensuite être libérées)."""
+        if self._annex_count:
+            self.f.write(self.item_separator)
+        self._annex_count += 1
+
+        self.f.write(self._newline(2) + json.dumps(json_key, ensure_ascii=False) + ': [')
+
+        for i, record in enumerate(records):
+            if i:
+                self.f.write(self.item_separator)
+            self.f.write(self._newline(3) + self._dumps(record, 3))
+
+        self.f.write((self._newline(2) if records else '') + ']')
+
+    def end(self, stats: dict, sections: dict = None):
+        """Ferme les annexes, écrit les stats (puis les sections dérivées) et ferme le document."""
+        self.f.write(
+            (self._newline(1) if self._annex_count else '') + '}'
+            + self.item_separator + self._newline(1) + '"stats": ' + self._dumps(stats, 1)
+        )
+        for name, value in (sections or {}).items():
+            self.f.write(
+                self.item_separator + self._newline(1) + json.dumps(name, ensure_ascii=False)
+                + ': ' + self._dumps(value, 1)
+            )
+        self.f.write(self._newline(0) + '}')
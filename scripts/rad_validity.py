@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+RAD Validity - Fenêtres de validité structurées et règles actives à un instant T
+
+Usage:
+    python rad_validity.py rad-data.json --at 2025-11-05T14:00Z [--annex 2B]
+    python rad_validity.py rad-data.json --at 2025-11-05T14:00Z --until 2025-11-05T18:00Z --json
+
+Les champs valid_from, valid_until et time_applicability sont du texte tel
+que lu dans le fichier Excel ("30 OCT 2025", "01/01/2026", "UFN",
+"MON-FRI 0600-1800 (0500-1700)", "MON-THU 2200-0500, FRI 2200-SAT 0700"...).
+Avec `rad_parser.py --derived-fields validity`, chaque entrée reçoit un
+champ `validity` (le texte d'origine reste dans son champ):
+
+    "validity": {
+      "from": "2025-10-30T00:00:00Z",      # null = sans date de début
+      "until": "2026-01-02T00:00:00Z",     # exclu (lendemain de valid_until), null = UFN
+      "weekly": [[360, 1080], ...],        # minutes UTC depuis lundi 00:00, null = H24
+      "weekly_summer": [[300, 1020], ...], # horaires entre parenthèses (heure d'été)
+      "unparsed": ["time_applicability"]   # champs non compris (fenêtre non restreinte)
+    }
+
+Sans ce champ (sortie par défaut), ValidityIndex le calcule au chargement.
+ValidityIndex répond à "quelles règles sont actives à T / pendant [T1, T2)":
+les périodes de validité distinctes sont rangées dans un arbre d'intervalles
+(O(log n + k)), puis les fenêtres hebdomadaires des candidates sont
+vérifiées par recherche dichotomique.
+"""
+
+import argparse
+import bisect
+import json
+import logging
+import math
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+
+from rad_columnar import load_rad_json
+
+# Configuration du logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+DAYS = ('MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN')
+
+# Valeurs sans date (période ouverte)
+OPEN_ENDED = frozenset(['', 'UFN', 'PERM', 'N/A', 'NIL', '-'])
+
+# Formats de date rencontrés dans les colonnes Valid From / Valid Until
+# (dates Excel converties par str(): "2025-12-11 00:00:00")
+DATE_FORMATS = (
+    '%d %b %Y',
+    '%d/%m/%Y',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+    '%d-%b-%Y',
+    '%d %b %y',
+    '%d.%m.%Y',
+)
+
+_DAY = r'(?:MON|TUE|WED|THU|FRI|SAT|SUN)'
+_DAY_LIST = rf'(?:DLY|DAILY|{_DAY}(?:\s*-\s*{_DAY})?(?:\s*[,&/]\s*{_DAY}(?:\s*-\s*{_DAY})?)*)'
+_TIME = r'\d{4}'
+
+# Un créneau: [jours] HHMM-[jour] HHMM [(HHMM-[jour] HHMM)], ou [jours] H24
+# ("FRI 2200-SAT 0700": jour de fin avant l'heure de fin)
+SEGMENT_PATTERN = re.compile(
+    rf'(?:(?P<days>{_DAY_LIST})\s+)?'
+    rf'(?:(?P<h24>H24)'
+    rf'|(?P<start>{_TIME})\s*-\s*(?:(?P<end_day>{_DAY})\s*)?(?P<end>{_TIME})'
+    rf'(?:\s*\(\s*(?P<summer_start>{_TIME})\s*-\s*(?:{_DAY}\s*)?(?P<summer_end>{_TIME})\s*\))?)'
+)
+# Ce qui peut séparer deux créneaux
+SEGMENT_SEPARATORS = re.compile(r'[\s,;&]|\bAND\b')
+_DAY_RANGE = re.compile(rf'({_DAY})(?:\s*-\s*({_DAY}))?')
+
+
+def parse_date(value: str):
+    """Date d'une cellule de validité (datetime UTC à minuit), None si absente ou illisible."""
+    text = (value or '').strip().upper()
+    if text in OPEN_ENDED:
+        return None
+
+    for date_format in DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(text.title() if '%b' in date_format else text, date_format)
+        except ValueError:
+            continue
+        return datetime(parsed.year, parsed.month, parsed.day, tzinfo=timezone.utc)
+    return None
+
+
+def _iso(moment: datetime):
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _minutes(hhmm: str):
+    """'0630' → 390; '2359' et '2400' → fin de journée (borne exclue)."""
+    hours, minutes = int(hhmm[:2]), int(hhmm[2:])
+    if hhmm in ('2359', '2400'):
+        return MINUTES_PER_DAY
+    if hours > 23 or minutes > 59:
+        raise ValueError(hhmm)
+    return hours * 60 + minutes
+
+
+def _days(day_list: str):
+    """'MON-FRI, SUN' → [0, 1, 2, 3, 4, 6]; absent ou DLY → tous les jours."""
+    if not day_list or day_list in ('DLY', 'DAILY'):
+        return list(range(7))
+
+    days = []
+    for first, last in _DAY_RANGE.findall(day_list):
+        start = DAYS.index(first)
+        end = DAYS.index(last) if last else start
+        # MON-FRI, mais aussi FRI-MON (à cheval sur le week-end)
+        span = (end - start) % 7
+        days.extend((start + offset) % 7 for offset in range(span + 1))
+    return sorted(set(days))
+
+
+def _weekly_ranges(days: list, start: int, end: int, end_day: int = None):
+    """Plages [début, fin) en minutes depuis lundi 00:00, coupées à la fin de semaine."""
+    ranges = []
+    for day in days:
+        begin = day * MINUTES_PER_DAY + start
+        if end_day is not None:
+            finish = end_day * MINUTES_PER_DAY + end
+            if finish <= begin:
+                finish += MINUTES_PER_WEEK
+        else:
+            finish = day * MINUTES_PER_DAY + end
+            # "2200-0500": la nuit déborde sur le lendemain
+            if finish <= begin:
+                finish += MINUTES_PER_DAY
+
+        if finish > MINUTES_PER_WEEK:
+            ranges.append([begin, MINUTES_PER_WEEK])
+            ranges.append([0, finish - MINUTES_PER_WEEK])
+        else:
+            ranges.append([begin, finish])
+    return ranges
+
+
+def _merge(ranges: list):
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def parse_time_applicability(value: str):
+    """Fenêtres hebdomadaires (hiver, été) d'un texte Time Applicability.
+
+    Retourne (None, None) sans restriction horaire (vide, H24), et lève
+    ValueError si le texte n'est pas compris.
+    """
+    text = (value or '').strip().upper()
+    if not text or text == 'H24':
+        return None, None
+
+    winter, summer = [], []
+    position = 0
+
+    for match in SEGMENT_PATTERN.finditer(text):
+        # Entre deux créneaux, seulement des séparateurs
+        if SEGMENT_SEPARATORS.sub('', text[position:match.start()]):
+            raise ValueError(text)
+        position = match.end()
+
+        days = _days(match.group('days'))
+        if match.group('h24'):
+            winter.extend(_weekly_ranges(days, 0, MINUTES_PER_DAY))
+            summer.extend(_weekly_ranges(days, 0, MINUTES_PER_DAY))
+            continue
+
+        end_day = DAYS.index(match.group('end_day')) if match.group('end_day') else None
+        start, end = _minutes(match.group('start')), _minutes(match.group('end'))
+        winter.extend(_weekly_ranges(days, start, end, end_day))
+
+        if match.group('summer_start'):
+            start, end = _minutes(match.group('summer_start')), _minutes(match.group('summer_end'))
+        summer.extend(_weekly_ranges(days, start, end, end_day))
+
+    if not winter or SEGMENT_SEPARATORS.sub('', text[position:]):
+        raise ValueError(text)
+
+    winter, summer = _merge(winter), _merge(summer)
+    if summer == winter:
+        summer = None
+    if winter == [[0, MINUTES_PER_WEEK]] and summer is None:
+        return None, None
+    return winter, summer
+
+
+def parse_validity(valid_from: str, valid_until: str, time_applicability: str = None):
+    """Champ `validity` d'une entrée (voir l'en-tête du module)."""
+    unparsed = []
+
+    start = parse_date(valid_from)
+    if start is None and (valid_from or '').strip().upper() not in OPEN_ENDED:
+        unparsed.append('valid_from')
+
+    until = parse_date(valid_until)
+    if until is None and (valid_until or '').strip().upper() not in OPEN_ENDED:
+        unparsed.append('valid_until')
+
+    try:
+        weekly, weekly_summer = parse_time_applicability(time_applicability)
+    except ValueError:
+        weekly, weekly_summer = None, None
+        unparsed.append('time_applicability')
+
+    validity = {
+        'from': _iso(start) if start else None,
+        # valid_until est inclus: la borne stockée est le lendemain à 00:00
+        'until': _iso(until + timedelta(days=1)) if until else None,
+        'weekly': weekly,
+    }
+    if weekly_summer is not None:
+        validity['weekly_summer'] = weekly_summer
+    if unparsed:
+        validity['unparsed'] = unparsed
+    return validity
+
+
+def validity_column(valid_from: list, valid_until: list, time_applicability: list = None):
+    """`validity` de toute une feuille; chaque combinaison distincte est parsée une fois."""
+    time_applicability = time_applicability or [''] * len(valid_from)
+    parsed = {}
+    column = []
+    for key in zip(valid_from, valid_until, time_applicability):
+        if key not in parsed:
+            parsed[key] = parse_validity(*key)
+        # Copie: les entrées ne partagent pas d'objet modifiable
+        column.append(dict(parsed[key]))
+    return column
+
+
+def _last_sunday(year: int, month: int):
+    day = datetime(year, month + 1, 1, tzinfo=timezone.utc) - timedelta(days=1)
+    return day - timedelta(days=(day.weekday() - 6) % 7)
+
+
+def is_summer(moment: datetime):
+    """Période d'heure d'été européenne (dernier dimanche de mars → d'octobre, 01:00 UTC)."""
+    start = _last_sunday(moment.year, 3) + timedelta(hours=1)
+    end = _last_sunday(moment.year, 10) + timedelta(hours=1)
+    return start <= moment < end
+
+
+def week_minute(moment: datetime):
+    """Minutes écoulées depuis lundi 00:00 UTC."""
+    return moment.weekday() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def parse_timestamp(value: str):
+    """'2025-11-05T14:00Z', '2025-11-05 14:00', '2025-11-05' → datetime UTC."""
+    text = value.strip().upper().replace('Z', '+00:00')
+    moment = datetime.fromisoformat(text)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+class IntervalTree:
+    """Arbre d'intervalles centré, statique: intervalles [début, fin) → valeurs.
+
+    Construction O(n log n); recherche des intervalles chevauchant une plage
+    en O(log n + k).
+    """
+
+    def __init__(self, intervals: list):
+        # Intervalles vides (fin <= début, données incohérentes): jamais actifs
+        self.root = self._build(sorted(
+            (interval for interval in intervals if interval[1] > interval[0]),
+            key=lambda interval: interval[0]
+        ))
+
+    def _build(self, intervals: list):
+        if not intervals:
+            return None
+
+        # Début médian: l'intervalle correspondant contient le centre, chaque
+        # nœud garde donc au moins un intervalle
+        center = intervals[len(intervals) // 2][0]
+
+        left, right, here = [], [], []
+        for interval in intervals:
+            if interval[1] <= center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+
+        return (
+            center,
+            here,                                                       # triés par début
+            sorted(here, key=lambda interval: interval[1], reverse=True),  # par fin décroissante
+            self._build(left),
+            self._build(right),
+        )
+
+    def overlapping(self, start: float, end: float = None):
+        """Valeurs des intervalles qui chevauchent [start, end), ou qui contiennent `start`."""
+        if end is None or end <= start:
+            end = math.nextafter(start, math.inf)
+
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            center, by_start, by_end, left, right = node
+
+            # Les intervalles du nœud contiennent tous le centre
+            if end <= center:
+                for interval in by_start:
+                    if interval[0] >= end:
+                        break
+                    found.append(interval[2])
+                stack.append(left)
+            elif start > center:
+                for interval in by_end:
+                    if interval[1] <= start:
+                        break
+                    found.append(interval[2])
+                stack.append(right)
+            else:
+                found.extend(interval[2] for interval in by_start)
+                stack.append(left)
+                stack.append(right)
+        return found
+
+
+def _epoch(iso: str, default: float):
+    return parse_timestamp(iso).timestamp() if iso else default
+
+
+def _overlaps_weekly(windows: list, starts: list, start: int, end: int):
+    """Une fenêtre hebdomadaire chevauche-t-elle [start, end) (minutes de la semaine) ?"""
+    position = bisect.bisect_right(starts, start) - 1
+    if position >= 0 and windows[position][1] > start:
+        return True
+    return position + 1 < len(windows) and windows[position + 1][0] < end
+
+
+class ValidityIndex:
+    """Règles actives à un instant ou pendant une plage, sans parcours de toutes les entrées."""
+
+    def __init__(self, data: dict):
+        self.metadata = data.get('metadata', {})
+        self.records = [
+            record
+            for records in data['annexes'].values() if isinstance(records, list)
+            for record in records
+        ]
+
+        # Période de validité distincte → positions des entrées
+        groups = {}
+        self.weekly = []
+        for offset, record in enumerate(self.records):
+            validity = record.get('validity')
+            if validity is None:
+                # Sortie d'une version antérieure du parser: calculé à la volée
+                validity = parse_validity(record.get('valid_from'), record.get('valid_until'),
+                                          record.get('time_applicability'))
+            groups.setdefault((validity['from'], validity['until']), []).append(offset)
+
+            windows = {}
+            for season in ('weekly', 'weekly_summer'):
+                if validity.get(season) is not None:
+                    windows[season] = (validity[season], [window[0] for window in validity[season]])
+            if 'weekly_summer' not in windows and 'weekly' in windows:
+                windows['weekly_summer'] = windows['weekly']
+            self.weekly.append(windows or None)
+
+        self.tree = IntervalTree([
+            (_epoch(start, float('-inf')), _epoch(until, float('inf')), offsets)
+            for (start, until), offsets in groups.items()
+        ])
+
+    @classmethod
+    def load(cls, path: str):
+        """Charge une sortie du parser (format entrées ou colonnes)."""
+        return cls(load_rad_json(path))
+
+    def _weekly_spans(self, start: datetime, end: datetime):
+        """[(saison, début, fin)] en minutes de la semaine couvrant [start, end), None si >= 1 semaine."""
+        if end - start >= timedelta(weeks=1):
+            return None
+
+        first = week_minute(start)
+        last = first + max(int((end - start).total_seconds() // 60), 1)
+        minutes = [(first, last)]
+        if last > MINUTES_PER_WEEK:
+            minutes = [(first, MINUTES_PER_WEEK), (0, last - MINUTES_PER_WEEK)]
+
+        # Plage à cheval sur un changement d'heure: les deux jeux d'horaires
+        seasons = {'weekly_summer' if is_summer(moment) else 'weekly'
+                   for moment in (start, end - timedelta(minutes=1))}
+        return [(season, low, high) for season in seasons for low, high in minutes]
+
+    def active(self, start: datetime, end: datetime = None, annex: str = None):
+        """Entrées actives à `start`, ou à un moment de [start, end)."""
+        if end is None or end <= start:
+            end = start + timedelta(minutes=1)
+
+        offsets = []
+        for group in self.tree.overlapping(start.timestamp(), end.timestamp()):
+            offsets.extend(group)
+
+        spans = self._weekly_spans(start, end)
+
+        results = []
+        for offset in sorted(offsets):
+            record = self.records[offset]
+            if annex and record.get('annex') != annex:
+                continue
+
+            windows = self.weekly[offset]
+            if windows is not None and spans is not None:
+                if not any(_overlaps_weekly(*windows[season], first, last)
+                           for season, first, last in spans if season in windows):
+                    continue
+            results.append(record)
+        return results
+
+
+def main():
+    """Point d'entrée du script."""
+    parser = argparse.ArgumentParser(
+        description='Règles RAD actives à un instant ou pendant une plage horaire (UTC)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples:
+  python rad_validity.py rad-data.json --at 2025-11-05T14:00Z
+  python rad_validity.py rad-data.json --at 2025-11-05T14:00Z --until 2025-11-05T18:00Z --annex 2B
+  python rad_validity.py rad-data.json --at now --json
+        """
+    )
+
+    parser.add_argument('input', help='Sortie du parser (rad-data.json, entrées ou colonnes)')
+    parser.add_argument('--at', required=True,
+                       help='Instant UTC (ISO 8601, ex: 2025-11-05T14:00Z) ou "now"')
+    parser.add_argument('--until', help='Fin de plage (exclue): règles actives à un moment de [at, until)')
+    parser.add_argument('--annex', help='Limiter à une annexe (ex: 2B, 3A)')
+    parser.add_argument('--json', action='store_true', help='Afficher les entrées en JSON')
+
+    args = parser.parse_args()
+
+    try:
+        start = datetime.now(timezone.utc) if args.at == 'now' else parse_timestamp(args.at)
+        end = parse_timestamp(args.until) if args.until else None
+    except ValueError as e:
+        parser.error(f"date invalide: {e}")
+
+    try:
+        index = ValidityIndex.load(args.input)
+    except FileNotFoundError as e:
+        logger.error(f"❌ {e}")
+        return 1
+
+    results = index.active(start, end, annex=args.annex)
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return 0
+
+    logger.info(f"✅ {len(results)} règle(s) active(s) sur {len(index.records)}")
+    for record in results:
+        print(f"{record.get('id', ''):<12} {record.get('annex', ''):<3} "
+              f"{record.get('valid_from', '') or '-'} → {record.get('valid_until', '') or 'UFN'}  "
+              f"{record.get('time_applicability', '') or 'H24'}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
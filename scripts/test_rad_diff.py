@@ -0,0 +1,66 @@
+"""
+Tests du diff/patch RAD: appliquer le patch redonne exactement la nouvelle version
+
+Usage:
+    python -m pytest scripts/test_rad_diff.py
+"""
+
+import pytest
+
+from rad_diff import PatchError, apply_patch, diff_data
+
+
+def rad(records: list, cycle: str = '2511', version: str = '1.17', **sections):
+    return {
+        'metadata': {'cycle': cycle, 'version': version},
+        'annexes': {'annex2b_rules': records},
+        'stats': {'total_entries': len(records)},
+        **sections,
+    }
+
+
+OLD_RECORDS = [
+    {'id': 'LS1', 'annex': '2B', 'utilization': 'Not available'},
+    {'id': 'LS2', 'annex': '2B', 'utilization': 'Only available'},
+]
+
+NEW_RECORDS = [
+    {'id': 'LS2', 'annex': '2B', 'utilization': 'Only available for ARR'},
+    {'id': 'LS3', 'annex': '2B', 'utilization': 'Not available'},
+]
+
+
+def test_patch_rebuilds_records():
+    old = rad(OLD_RECORDS)
+    new = rad(NEW_RECORDS, version='1.19')
+
+    assert apply_patch(old, diff_data(old, new)) == new
+
+
+def test_patch_carries_changed_sections():
+    old = rad(OLD_RECORDS, areas={'graph': {'LSAS': []}}, aerodromes={'LSZH': {}})
+    new = rad(NEW_RECORDS, version='1.19',
+              areas={'graph': {'LSAS': ['LSAZ']}}, aerodromes={'LSZH': {}})
+
+    patch = diff_data(old, new)
+
+    # Section inchangée: reprise de la base, pas transportée
+    assert list(patch['sections']) == ['areas']
+    assert apply_patch(old, patch) == new
+
+
+def test_patch_adds_and_drops_sections():
+    old = rad(OLD_RECORDS, areas={'graph': {}})
+    new = rad(OLD_RECORDS, aerodromes={'LSGG': {}})
+
+    assert apply_patch(old, diff_data(old, new)) == new
+
+
+def test_patch_requires_unchanged_section_in_base():
+    old = rad(OLD_RECORDS, areas={'graph': {}})
+    new = rad(NEW_RECORDS, areas={'graph': {}})
+    patch = diff_data(old, new)
+
+    del old['areas']
+    with pytest.raises(PatchError):
+        apply_patch(old, patch)
@@ -0,0 +1,236 @@
+"""
+Tests du downloader RAD contre un serveur HTTP local
+
+Le serveur sert un seul fichier et peut couper la connexion en cours de
+transfert, ignorer les requêtes Range, refuser une reprise (416) ou servir
+un ZIP corrompu.
+
+Usage:
+    python -m pytest scripts/test_rad_downloader.py
+"""
+
+import io
+import os
+import re
+import socket
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from rad_downloader import RADDownloader, file_sha256
+
+FILENAME = 'RAD_2511_v1_17.xlsx'
+
+
+def make_payload(size: int):
+    """Fichier ZIP valide d'environ `size` octets (contenu incompressible)."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED) as archive:
+        archive.writestr('xl/worksheets/sheet1.xml', os.urandom(size))
+    return buffer.getvalue()
+
+
+class StubServer:
+    """Serveur local: un fichier, comportement réglable, requêtes enregistrées."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = '"v1"'        # None: aucun validateur HTTP
+        self.drop_after = []      # coupures successives: octets envoyés avant fermeture
+        self.ranges = True        # False: ignore Range et répond 200
+        self.honor_conditional = True
+        self.requests = []        # en-têtes de chaque requête reçue
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stub.requests.append(dict(self.headers))
+                stub.handle(self)
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/RAD/{FILENAME}'
+
+    def handle(self, handler):
+        body = self.body
+
+        if (self.honor_conditional and self.etag
+                and handler.headers.get('If-None-Match') == self.etag):
+            handler.send_response(304)
+            handler.send_header('ETag', self.etag)
+            handler.end_headers()
+            return
+
+        start = 0
+        match = re.match(r'bytes=(\d+)-', handler.headers.get('Range', ''))
+        if match and self.ranges:
+            start = int(match.group(1))
+            if start >= len(body):
+                handler.send_response(416)
+                handler.send_header('Content-Range', f'bytes */{len(body)}')
+                handler.send_header('Content-Length', '0')
+                handler.end_headers()
+                return
+            handler.send_response(206)
+            handler.send_header('Content-Range', f'bytes {start}-{len(body) - 1}/{len(body)}')
+        else:
+            handler.send_response(200)
+
+        if self.etag:
+            handler.send_header('ETag', self.etag)
+        handler.send_header('Content-Length', str(len(body) - start))
+        handler.end_headers()
+
+        if self.drop_after:
+            # Coupure franche au milieu du corps
+            sent = self.drop_after.pop(0)
+            handler.wfile.write(body[start:start + sent])
+            handler.wfile.flush()
+            handler.connection.shutdown(socket.SHUT_RDWR)
+            handler.close_connection = True
+            return
+
+        handler.wfile.write(body[start:])
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def server():
+    stub = StubServer(make_payload(3 * 1024 * 1024))
+    yield stub
+    stub.close()
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    return RADDownloader(tmp_path, retries=2, backoff=0)
+
+
+def rad_info(server):
+    return {
+        'url': server.url,
+        'cycle': '2511',
+        'version': '1.17',
+        'filename': FILENAME,
+        'effective_date': '2025-11-27',
+    }
+
+
+def test_resume_after_dropped_connection(server, downloader, tmp_path):
+    server.drop_after = [2 * 1024 * 1024 + 512 * 1024]
+
+    assert downloader._download_rad('current', rad_info(server))
+
+    assert (tmp_path / FILENAME).read_bytes() == server.body
+    assert not (tmp_path / (FILENAME + '.part')).exists()
+    assert len(server.requests) == 2
+
+    # Reprise au plus un bloc réseau (64 KB) avant la coupure, pas au dernier MB plein
+    resumed_at = int(re.match(r'bytes=(\d+)-', server.requests[1]['Range']).group(1))
+    assert resumed_at >= 2 * 1024 * 1024 + 512 * 1024 - 64 * 1024
+    assert server.requests[1]['If-Range'] == server.etag
+
+
+def test_resume_before_first_chunk(server, downloader):
+    server.drop_after = [300 * 1024]
+
+    assert downloader._download_rad('current', rad_info(server))
+
+    resumed_at = int(re.match(r'bytes=(\d+)-', server.requests[1]['Range']).group(1))
+    assert resumed_at > 0
+
+
+def test_server_without_range_support(server, downloader, tmp_path):
+    server.ranges = False
+    server.drop_after = [1024 * 1024]
+
+    assert downloader._download_rad('current', rad_info(server))
+
+    # Réponse 200 à la reprise: le .part est réécrit depuis le début
+    assert 'Range' in server.requests[1]
+    assert (tmp_path / FILENAME).read_bytes() == server.body
+
+
+def test_range_not_satisfiable_restarts(server, downloader, tmp_path):
+    # .part d'un run précédent plus long que le fichier distant
+    (tmp_path / (FILENAME + '.part')).write_bytes(b'x' * (len(server.body) + 10))
+
+    assert downloader._download_rad('current', rad_info(server))
+
+    assert server.requests[0]['Range'] == f'bytes={len(server.body) + 10}-'
+    assert 'Range' not in server.requests[1]
+    assert (tmp_path / FILENAME).read_bytes() == server.body
+
+
+def test_corrupt_zip_is_rejected(server, downloader, tmp_path):
+    server.body = b'PK\x03\x04' + os.urandom(64 * 1024)
+
+    assert not downloader._download_rad('current', rad_info(server))
+
+    assert not (tmp_path / FILENAME).exists()
+    assert not (tmp_path / (FILENAME + '.part')).exists()
+
+
+def download_twice(server, tmp_path, before_second=None):
+    """Premier run (métadonnées sauvegardées), puis second run; retourne le second downloader."""
+    first = RADDownloader(tmp_path, retries=0, backoff=0)
+    assert first._download_rad('current', rad_info(server))
+    first._save_metadata()
+
+    if before_second is not None:
+        before_second()
+    server.requests.clear()
+
+    second = RADDownloader(tmp_path, retries=0, backoff=0)
+    assert second._download_rad('current', rad_info(server))
+    return second
+
+
+def test_not_modified_skips_transfer(server, tmp_path):
+    second = download_twice(server, tmp_path)
+
+    assert server.requests[0]['If-None-Match'] == server.etag
+    assert second.transferred == []
+    assert second.rad_files['current']['transferred'] is False
+
+
+def test_ignored_conditional_request_with_same_content(server, tmp_path):
+    server.honor_conditional = False
+
+    second = download_twice(server, tmp_path)
+
+    # 200 complet, mais checksum identique au run précédent
+    assert len(server.requests) == 1
+    assert second.transferred == []
+    assert second.rad_files['current']['sha256'] == file_sha256(tmp_path / FILENAME)
+
+
+def test_checksum_match_without_validators_sends_no_request(server, tmp_path):
+    server.etag = None
+
+    second = download_twice(server, tmp_path)
+
+    assert server.requests == []
+    assert second.transferred == []
+
+
+def test_checksum_mismatch_downloads_again(server, tmp_path):
+    def corrupt_local_copy():
+        (tmp_path / FILENAME).write_bytes(b'modified')
+
+    second = download_twice(server, tmp_path, before_second=corrupt_local_copy)
+
+    assert 'If-None-Match' not in server.requests[0]
+    assert second.transferred == ['current']
+    assert (tmp_path / FILENAME).read_bytes() == server.body
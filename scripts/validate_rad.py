@@ -10,6 +10,8 @@ import json
 import sys
 from pathlib import Path
 
+from rad_columnar import decode, is_columnar
+
 def validate_rad(json_path):
     """Valide la structure du fichier JSON RAD."""
     
@@ -26,6 +28,11 @@ def validate_rad(json_path):
         with open(path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         print("✅ JSON valide")
+        
+        # Sortie --format columnar: validée sous sa forme habituelle
+        if is_columnar(data):
+            data = decode(data)
+            print("✅ Format colonnes décodé")
     except json.JSONDecodeError as e:
         print(f"❌ JSON invalide: {e}")
         return False